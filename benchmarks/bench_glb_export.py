@@ -0,0 +1,86 @@
+"""
+Compares the size and parse time of the .obj and .glb files written by :class:`compas_xr.project.AssemblyExtensions`
+for the same synthetic assembly.
+
+The .obj files are parsed with a minimal reader of their vertex and face lines, the .glb files with :func:`compas_xr.project.read_glb`.
+
+Usage::
+
+    python benchmarks/bench_glb_export.py --parts 500 --subdivisions 3
+
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_xr.project import AssemblyExtensions
+from compas_xr.project import read_glb
+
+
+def create_mesh_assembly(count, subdivisions):
+    assembly = Assembly()
+    for i in range(count):
+        frame = Frame(Point(i % 50, i // 50, 0), Vector(1, 0.01 * i, 0), Vector(0, 0, 1))
+        shape = Mesh.from_shape(Box(3.0, 0.1, 0.2, frame=frame))
+        for _ in range(subdivisions):
+            shape = shape.subdivided("quad")
+        assembly.add_part(Part(name="part {}".format(i), frame=frame, shape=shape))
+    return assembly
+
+
+def read_obj(file_path):
+    vertices = []
+    faces = []
+    with open(file_path) as obj_file:
+        for line in obj_file:
+            if line.startswith("v "):
+                vertices.append([float(value) for value in line.split()[1:4]])
+            elif line.startswith("f "):
+                faces.append([int(value.split("/")[0]) - 1 for value in line.split()[1:]])
+    return vertices, faces
+
+
+def measure(folder, reader):
+    names = sorted(os.listdir(folder))
+    size = sum(os.path.getsize(os.path.join(folder, name)) for name in names)
+    start = time.perf_counter()
+    for name in names:
+        reader(os.path.join(folder, name))
+    return len(names), size, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parts", type=int, default=500, help="number of parts of the synthetic assembly")
+    parser.add_argument("--subdivisions", type=int, default=3, help="number of quad subdivisions of the synthetic part meshes")
+    args = parser.parse_args()
+
+    assembly = create_mesh_assembly(args.parts, args.subdivisions)
+    directory = tempfile.mkdtemp()
+    try:
+        extensions = AssemblyExtensions()
+        extensions.export_mesh_assembly_objs(assembly, directory, "obj")
+        extensions.export_mesh_assembly_glbs(assembly, directory, "glb")
+
+        obj_count, obj_size, obj_time = measure(os.path.join(directory, "obj"), read_obj)
+        glb_count, glb_size, glb_time = measure(os.path.join(directory, "glb"), read_glb)
+        print("obj  {} files  {:10d} bytes  parsed in {:6.3f} s".format(obj_count, obj_size, obj_time))
+        print("glb  {} files  {:10d} bytes  parsed in {:6.3f} s".format(glb_count, glb_size, glb_time))
+        print("glb is {:.1%} of the obj size and parses {:.1f}x faster".format(glb_size / obj_size, obj_time / glb_time))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares the per-request latency of ``urlopen`` against the pooled :class:`compas_xr.utilities.HttpClient`
+on a local HTTPS stand-in server that answers like the Firebase REST API.
+
+Usage::
+
+    python benchmarks/bench_http_client.py --requests 500 --size 2048
+
+"""
+
+import argparse
+import os
+import shutil
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.request import urlopen
+
+from compas_xr.utilities import HttpClient
+
+
+class FirebaseStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one write, like the Firebase frontends, to avoid Nagle delays on keep-alive connections
+    wbufsize = 1 << 16
+    payload = b"{}"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+
+def create_certificate(directory):
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.check_call(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost", "-keyout", key_path, "-out", cert_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return cert_path, key_path
+
+
+def start_server(cert_path, key_path, payload):
+    FirebaseStandInHandler.payload = payload
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FirebaseStandInHandler)
+    server.daemon_threads = True
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert_path, key_path)
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def measure(fn, url, count):
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn(url)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print("{:<12} mean {:7.3f} ms   median {:7.3f} ms   p95 {:7.3f} ms".format(name, statistics.mean(latencies), statistics.median(latencies), p95))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="number of sequential GET requests per client")
+    parser.add_argument("--size", type=int, default=2048, help="size of the JSON response in bytes")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        cert_path, key_path = create_certificate(directory)
+        payload = ('{"data": "' + "x" * max(args.size - 12, 0) + '"}').encode()
+        server = start_server(cert_path, key_path, payload)
+        url = "https://localhost:{}/project/building_plan/data/steps/0.json".format(server.server_address[1])
+
+        client_context = ssl.create_default_context(cafile=cert_path)
+        client = HttpClient(pool_size=4, ssl_context=client_context)
+
+        print("{} sequential GET requests of {} bytes against {}".format(args.requests, len(payload), url))
+        report("urlopen", measure(lambda u: urlopen(u, context=client_context).read(), url, args.requests))
+        report("HttpClient", measure(lambda u: client.get(u).content, url, args.requests))
+
+        client.close()
+        server.shutdown()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures the ProjectManager pipeline on the local Storage and RealtimeDatabase backends,
+so serialization and pipeline cost are measured without network noise.
+
+Usage::
+
+    python benchmarks/bench_local_backend.py --beams 500 --repeat 3
+
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from bench_project_schema import create_timber_assembly
+from compas.geometry import Frame
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Step
+
+from compas_xr.project import ProjectManager
+
+
+def measure(name, function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    print("{:<28} best {:8.3f} s   mean {:8.3f} s".format(name, min(timings), sum(timings) / len(timings)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beams", type=int, default=500, help="number of beams of the synthetic timber assembly")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs of every step")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    config_path = os.path.join(directory, "config.json")
+    with open(config_path, "w") as config_file:
+        json.dump({"backend": "local"}, config_file)
+    project_manager = ProjectManager(config_path)
+
+    assembly = create_timber_assembly(args.beams)
+    building_plan = BuildingPlan([Step([beam.key], actor="HUMAN", location=Frame.worldXY(), priority=i // 10) for i, beam in enumerate(assembly.beams)])
+    qr_frames = [Frame.worldXY()]
+    snapshot_directory = os.path.join(directory, "snapshots")
+    step_changes = dict((str(i), {"is_built": True}) for i in range(0, len(assembly.beams), 2))
+
+    for normalized in (False, True):
+        print("{} schema, {} beams".format("normalized" if normalized else "default", args.beams))
+        measure("upload", lambda: project_manager.upload_project_data_from_compas("project", assembly, building_plan, qr_frames, normalized=normalized), args.repeat)
+        measure("get project objects", lambda: project_manager.get_project_objects("project"), args.repeat)
+        measure("lazy read LastBuiltIndex", lambda: project_manager.get_project_data("project", lazy=True).building_plan.data.get("LastBuiltIndex"), args.repeat)
+        measure(
+            "publish unchanged",
+            lambda: project_manager.publish_project_data_from_compas("project", assembly, building_plan, qr_frames, normalized, snapshot_directory),
+            args.repeat,
+        )
+        measure("edit steps", lambda: project_manager.edit_steps_on_database("project", step_changes), args.repeat)
+        measure("query next priority steps", lambda: project_manager.get_next_priority_steps_from_database("project"), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
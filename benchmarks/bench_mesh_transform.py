@@ -0,0 +1,81 @@
+"""
+Compares writing transformed part meshes through a transformed copy of every mesh
+with the NumPy path of :func:`compas_xr.project.obj_writer.write_transformed_obj`,
+and checks that both write identical files.
+
+Usage::
+
+    python benchmarks/bench_mesh_transform.py --parts 20 --subdivisions 5
+
+"""
+
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import Vector
+
+from compas_xr.project.obj_writer import write_transformed_obj
+
+
+def create_parts(count, subdivisions):
+    parts = []
+    for i in range(count):
+        frame = Frame(Point(i % 10, i // 10, 0), Vector(1, 0.01 * i, 0), Vector(0, 0, 1))
+        shape = Mesh.from_shape(Box(3.0, 0.1, 0.2, frame=frame))
+        for _ in range(subdivisions):
+            shape = shape.subdivided("quad")
+        parts.append((frame, shape))
+    return parts
+
+
+def copy_and_write(shape, transformation, file_path):
+    shape.transformed(transformation).to_obj(file_path)
+
+
+def measure(write, parts, folder_path):
+    os.makedirs(folder_path)
+    export_frame = Frame(Point(0, 0, 0), Vector.Xaxis(), Vector.Zaxis())
+    tracemalloc.start()
+    start = time.perf_counter()
+    for key, (frame, shape) in enumerate(parts):
+        write(shape, Transformation.from_frame_to_frame(frame, export_frame), os.path.join(folder_path, "{}.obj".format(key)))
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parts", type=int, default=20, help="number of parts")
+    parser.add_argument("--subdivisions", type=int, default=5, help="number of quad subdivisions of the part meshes")
+    args = parser.parse_args()
+
+    parts = create_parts(args.parts, args.subdivisions)
+    vertices = sum(shape.number_of_vertices() for _, shape in parts)
+    directory = tempfile.mkdtemp()
+    try:
+        copy_time, copy_peak = measure(copy_and_write, parts, os.path.join(directory, "copy"))
+        numpy_time, numpy_peak = measure(write_transformed_obj, parts, os.path.join(directory, "numpy"))
+        names = sorted(os.listdir(os.path.join(directory, "copy")))
+        _, mismatch, errors = filecmp.cmpfiles(os.path.join(directory, "copy"), os.path.join(directory, "numpy"), names, shallow=False)
+        print("{} parts, {} vertices".format(len(parts), vertices))
+        print("transformed copy  {:7.2f} s   peak {:8.1f} MB".format(copy_time, copy_peak / 1e6))
+        print("numpy arrays      {:7.2f} s   peak {:8.1f} MB".format(numpy_time, numpy_peak / 1e6))
+        print("speedup {:.1f}x   identical {}".format(copy_time / numpy_time, not mismatch and not errors))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares the serial and process-pool export of :class:`compas_xr.project.AssemblyExtensions`
+on a synthetic assembly and checks that both write identical files.
+
+The timber assembly export needs a Brep backend (ex: compas_occ), the mesh assembly export is benchmarked without it.
+
+Usage::
+
+    python benchmarks/bench_obj_export.py --parts 3000 --workers 8
+
+"""
+
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_xr.project import AssemblyExtensions
+
+
+def create_mesh_assembly(count, subdivisions):
+    assembly = Assembly()
+    for i in range(count):
+        frame = Frame(Point(i % 50, i // 50, 0), Vector(1, 0.01 * i, 0), Vector(0, 0, 1))
+        shape = Mesh.from_shape(Box(3.0, 0.1, 0.2, frame=frame))
+        for _ in range(subdivisions):
+            shape = shape.subdivided("quad")
+        assembly.add_part(Part(name="part {}".format(i), frame=frame, shape=shape))
+    return assembly
+
+
+def create_timber_assembly(count):
+    from compas_timber.assembly import TimberAssembly
+    from compas_timber.parts import Beam
+
+    assembly = TimberAssembly()
+    for i in range(count):
+        frame = Frame(Point(i % 50, i // 50, 0), Vector(1, 0.01 * i, 0), Vector(0, 0, 1))
+        assembly.add_beam(Beam(frame, 3.0, 0.1, 0.2))
+    return assembly
+
+
+def compare(name, export, assembly, workers):
+    directory = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        export(assembly, directory, "serial")
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        export(assembly, directory, "parallel", max_workers=workers)
+        parallel = time.perf_counter() - start
+
+        serial_folder = os.path.join(directory, "serial")
+        parallel_folder = os.path.join(directory, "parallel")
+        names = sorted(os.listdir(serial_folder))
+        _, mismatch, errors = filecmp.cmpfiles(serial_folder, parallel_folder, names, shallow=False)
+        identical = not mismatch and not errors and names == sorted(os.listdir(parallel_folder))
+        print(
+            "{:<8} {} files   serial {:7.2f} s   {} workers {:7.2f} s   speedup {:4.1f}x   identical {}".format(
+                name, len(names), serial, workers, parallel, serial / parallel, identical
+            )
+        )
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parts", type=int, default=3000, help="number of parts of the synthetic assemblies")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--subdivisions", type=int, default=2, help="number of quad subdivisions of the synthetic part meshes")
+    args = parser.parse_args()
+
+    extensions = AssemblyExtensions()
+    compare("mesh", extensions.export_mesh_assembly_objs, create_mesh_assembly(args.parts, args.subdivisions), args.workers)
+    try:
+        compare("timber", extensions.export_timberassembly_objs, create_timber_assembly(args.parts), args.workers)
+    except Exception as e:
+        print("timber   skipped, no Brep backend available: {!r}".format(e))
+
+
+if __name__ == "__main__":
+    main()
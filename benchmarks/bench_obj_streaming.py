@@ -0,0 +1,97 @@
+"""
+Compares writing a beam through joined and transformed copies of its Brep face meshes
+with streaming the face meshes to the file with :func:`compas_xr.project.obj_writer.write_meshes_as_obj`,
+and checks that both write identical files.
+
+The face meshes are tessellated from the Brep of a timber beam if a Brep backend (ex: compas_occ) is available,
+and generated from a subdivided box with unwelded faces otherwise.
+
+Usage::
+
+    python benchmarks/bench_obj_streaming.py --beams 20 --subdivisions 4
+
+"""
+
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import Vector
+
+from compas_xr.project.obj_writer import write_meshes_as_obj
+
+
+def face_meshes(subdivisions):
+    try:
+        from compas.geometry import Brep
+
+        return Brep.from_box(Box(3.0, 0.1, 0.2)).to_meshes()
+    except Exception:
+        box = Mesh.from_shape(Box(3.0, 0.1, 0.2))
+        for _ in range(subdivisions):
+            box = box.subdivided("quad")
+        # One mesh per face with its own vertices, like the tessellation of the Brep faces
+        return [Mesh.from_vertices_and_faces(box.face_coordinates(face), [[0, 1, 2, 3]]) for face in box.faces()]
+
+
+def join_and_write(meshes, transformation, file_path):
+    compas_mesh = Mesh()
+    for mesh in meshes:
+        compas_mesh.join(mesh)
+    compas_mesh.transformed(transformation).to_obj(file_path)
+
+
+def stream(meshes, transformation, file_path):
+    write_meshes_as_obj(file_path, meshes, transformation)
+
+
+def measure(write, beams, meshes, folder_path):
+    os.makedirs(folder_path)
+    export_frame = Frame(Point(0, 0, 0), Vector.Xaxis(), Vector.Zaxis())
+    tracemalloc.start()
+    start = time.perf_counter()
+    for key in range(beams):
+        frame = Frame(Point(key % 10, key // 10, 0), Vector(1, 0.01 * key, 0), Vector(0, 0, 1))
+        write(meshes, Transformation.from_frame_to_frame(frame, export_frame), os.path.join(folder_path, "{}.obj".format(key)))
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beams", type=int, default=20, help="number of beams")
+    parser.add_argument("--subdivisions", type=int, default=4, help="number of quad subdivisions of the synthetic face meshes")
+    args = parser.parse_args()
+
+    meshes = face_meshes(args.subdivisions)
+    directory = tempfile.mkdtemp()
+    try:
+        print("{} beams of {} face meshes, {} vertices per beam".format(args.beams, len(meshes), sum(mesh.number_of_vertices() for mesh in meshes)))
+        for beams in (1, args.beams):
+            shutil.rmtree(directory)
+            join_time, join_peak = measure(join_and_write, beams, meshes, os.path.join(directory, "join"))
+            stream_time, stream_peak = measure(stream, beams, meshes, os.path.join(directory, "stream"))
+            names = sorted(os.listdir(os.path.join(directory, "join")))
+            _, mismatch, errors = filecmp.cmpfiles(os.path.join(directory, "join"), os.path.join(directory, "stream"), names, shallow=False)
+            print(
+                "{:>4} beams   join + transform {:6.2f} s peak {:6.2f} MB   stream {:6.2f} s peak {:6.2f} MB   identical {}".format(
+                    beams, join_time, join_peak / 1e6, stream_time, stream_peak / 1e6, not mismatch and not errors
+                )
+            )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares the payload size of the default and the normalized project schema
+of :meth:`compas_xr.project.ProjectManager.create_project_data_from_compas`,
+and their upload time if a Firebase configuration is given.
+
+The assembly is read from a COMPAS JSON file, or a synthetic timber assembly is created.
+
+Usage::
+
+    python benchmarks/bench_project_schema.py --beams 500
+    python benchmarks/bench_project_schema.py --assembly assembly.json --config config.json --project schema_benchmark
+
+"""
+
+import argparse
+import time
+
+from compas.data import json_dumps
+from compas.data import json_load
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import TButtJoint
+from compas_timber.parts import Beam
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Step
+
+from compas_xr.project import ProjectManager
+from compas_xr.project.project_schema import project_objects_from_data
+
+
+def create_timber_assembly(count):
+    assembly = TimberAssembly()
+    posts = []
+    for i in range(count // 2):
+        post = Beam.from_endpoints(Point(i, 0, 0), Point(i, 0, 3), 0.1, 0.2)
+        assembly.add_beam(post)
+        posts.append(post)
+    for i in range(count - len(posts)):
+        rail = Beam.from_endpoints(Point(i, 0, 3), Point(i + 1, 0, 3), 0.1, 0.2)
+        assembly.add_beam(rail)
+        TButtJoint.create(assembly, posts[i % len(posts)], rail)
+    return assembly
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beams", type=int, default=500, help="number of beams of the synthetic timber assembly")
+    parser.add_argument("--assembly", help="path of a COMPAS JSON file of an assembly, instead of the synthetic one")
+    parser.add_argument("--config", help="path of a Firebase configuration file, to measure the upload time")
+    parser.add_argument("--project", default="schema_benchmark", help="name of the project uploaded to measure the upload time")
+    args = parser.parse_args()
+
+    assembly = json_load(args.assembly) if args.assembly else create_timber_assembly(args.beams)
+    keys = [beam.key for beam in assembly.beams] if isinstance(assembly, TimberAssembly) else [part.key for part in assembly.parts()]
+    building_plan = BuildingPlan([Step([key], actor="HUMAN", location=Frame.worldXY()) for key in keys])
+    project_manager = ProjectManager(args.config) if args.config else ProjectManager.__new__(ProjectManager)
+
+    for normalized in (False, True):
+        data = project_manager.create_project_data_from_compas(assembly, building_plan, [Frame.worldXY()], normalized=normalized)
+        start = time.perf_counter()
+        payload = json_dumps(data)
+        serialize = time.perf_counter() - start
+        line = "{:<10}  payload {:8.2f} MB   assembly {:8.2f} MB   serialize {:6.2f} s".format(
+            "normalized" if normalized else "default", len(payload) / 1e6, len(json_dumps(data["assembly"])) / 1e6, serialize
+        )
+        if args.config:
+            start = time.perf_counter()
+            project_manager.upload_project_data_from_compas(args.project, assembly, building_plan, [Frame.worldXY()], normalized=normalized)
+            upload = time.perf_counter() - start
+            start = time.perf_counter()
+            project_objects_from_data(project_manager.get_project_data(args.project))
+            line += "   upload {:6.2f} s   download and read {:6.2f} s".format(upload, time.perf_counter() - start)
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
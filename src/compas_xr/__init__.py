@@ -14,6 +14,7 @@ compas_xr
     compas_xr.project
     compas_xr.realtime_database
     compas_xr.storage
+    compas_xr.utilities
 
 """
 
@@ -9,6 +9,9 @@ from ghpythonlib.componentbase import executingcomponent as component
 from compas_xr.ghpython.app_settings import AppSettings
 from compas_xr.project import ProjectManager
 
+# Settings written within this number of seconds, ex: while a slider is dragged, are sent as one write
+WRITE_WINDOW = 0.5
+
 
 class ApplicationSettingsComponent(component):
     def RunScript(self, config_filepath, project_name, storage_folder, z_to_y_remap, write):
@@ -20,7 +23,7 @@ class ApplicationSettingsComponent(component):
 
         else:
             app_settings = AppSettings(project_name, storage_folder, z_to_y_remap)
-            pm = ProjectManager(config_filepath)
+            pm = ProjectManager(config_filepath, write_window=WRITE_WINDOW)
             self.Message = None
 
             if write:
@@ -18,11 +18,53 @@ Classes
     ProjectManager
     AssemblyExtensions
     BuildingPlanExtensions
+    ExportCache
+    MeshBundle
+    MeshOptimizer
+    ProjectSnapshot
+    ProjectStateTracker
+
+Functions
+---------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    cluster_vertices
+    mesh_to_glb
+    prototype_key
+    read_glb
+    write_glb
 
 """
 
 from compas_xr.project.assembly_extensions import AssemblyExtensions
 from compas_xr.project.buildingplan_extensions import BuildingPlanExtensions
+from compas_xr.project.export_cache import ExportCache
+from compas_xr.project.glb import mesh_to_glb
+from compas_xr.project.glb import read_glb
+from compas_xr.project.glb import write_glb
+from compas_xr.project.instancing import prototype_key
+from compas_xr.project.mesh_bundle import MeshBundle
+from compas_xr.project.mesh_optimizer import MeshOptimizer
+from compas_xr.project.mesh_optimizer import cluster_vertices
 from compas_xr.project.project_manager import ProjectManager
+from compas_xr.project.project_snapshot import ProjectSnapshot
+from compas_xr.project.project_state_tracker import ProjectStateTracker
 
-__all__ = ["ProjectManager", "AssemblyExtensions", "BuildingPlanExtensions"]
+__all__ = [
+    "ProjectManager",
+    "AssemblyExtensions",
+    "BuildingPlanExtensions",
+    "ExportCache",
+    "MeshBundle",
+    "MeshOptimizer",
+    "ProjectSnapshot",
+    "ProjectStateTracker",
+    "cluster_vertices",
+    "mesh_to_glb",
+    "prototype_key",
+    "read_glb",
+    "write_glb",
+]
@@ -1,4 +1,8 @@
+import io
+import json
 import os
+import pickle
+import sys
 
 from compas.datastructures import Assembly
 from compas.datastructures import Mesh
@@ -9,20 +13,288 @@ from compas.geometry import Transformation
 from compas.geometry import Vector
 from compas_timber.consumers import BrepGeometryConsumer
 
+from compas_xr.project.export_cache import ExportCache
+from compas_xr.project.glb import mesh_to_glb
+from compas_xr.project.glb import write_glb
+from compas_xr.project.instancing import group_prototypes
+from compas_xr.project.mesh_optimizer import cluster_vertices
+from compas_xr.project.obj_writer import write_meshes_as_obj
+from compas_xr.project.obj_writer import write_transformed_obj
+
+EXPORT_FORMATS = ("obj", "glb")
+PROTOTYPES_FILE_NAME = "prototypes.json"
+LODS_FILE_NAME = "lods.json"
+
+
+class _BeamExportJob(object):
+    """
+    The picklable inputs needed to mesh and write a single beam, stands in for both the beam and its assembly
+    towards the :class:`~compas_timber.consumers.BrepGeometryConsumer`.
+    """
+
+    def __init__(self, beam, frame, file_path, file_format="obj", optimizer=None, lods=None):
+        self.key = beam.key
+        self.blank = beam.blank
+        self.features = list(beam.features)
+        self.beam_frame = beam.frame
+        self.frame = frame
+        self.file_path = file_path
+        self.file_format = file_format
+        self.optimizer = optimizer
+        self.lods = lods
+
+    @property
+    def beams(self):
+        return [self]
+
+    def cache_key(self):
+        return _cache_key(self, self.blank, self.features, self.beam_frame)
+
+    def local_geometry(self):
+        to_local = Transformation.from_frame_to_frame(self.beam_frame, Frame.worldXY())
+        features = []
+        for feature in self.features:
+            data = {}
+            for name, value in feature.__data__.items():
+                if hasattr(value, "transformed"):
+                    try:
+                        value = value.transformed(to_local)
+                    except Exception:
+                        # Brep volumes can only be transformed with a Brep backend, the beam is not shared then
+                        return None
+                data[name] = value
+            features.append({"type": type(feature).__name__, "data": data})
+        return [self.blank.transformed(to_local), features, self.file_format]
+
+
+class _ShapeExportJob(object):
+    """
+    The picklable inputs needed to transform and write the shape of a single part.
+    """
+
+    def __init__(self, key, shape, part_frame, frame, file_path, file_format="obj", optimizer=None, lods=None):
+        self.key = key
+        self.shape = shape
+        self.part_frame = part_frame
+        self.frame = frame
+        self.file_path = file_path
+        self.file_format = file_format
+        self.optimizer = optimizer
+        self.lods = lods
+
+    def cache_key(self):
+        return _cache_key(self, self.shape, self.part_frame)
+
+    def local_geometry(self):
+        return [self.shape.transformed(Transformation.from_frame_to_frame(self.part_frame, Frame.worldXY())), self.file_format]
+
+
+def _cache_key(job, *data):
+    data = list(data) + [job.frame, job.file_format, job.optimizer.settings if job.optimizer else None]
+    if job.lods:
+        data.append(list(job.lods))
+    return ExportCache.key_from_data(*data)
+
+
+def _lod_file_path(file_path, level):
+    folder_path, file_name = os.path.split(file_path)
+    return os.path.join(folder_path, "lod{}".format(level), file_name)
+
+
+def _file_paths(job):
+    """
+    Returns the paths of the files written by a job, the part file followed by the file of every level of detail.
+    """
+    return [job.file_path] + [_lod_file_path(job.file_path, level) for level in range(1, len(job.lods or ()) + 1)]
+
+
+def _cache_entries(key, job):
+    keys = [key] + ["{}_lod{}".format(key, level) for level in range(1, len(job.lods or ()) + 1)]
+    return list(zip(keys, _file_paths(job)))
+
+
+def _write_mesh(mesh, job):
+    """
+    Writes a mesh in the job file format, welded and quantized if the job has an optimizer, and its levels of detail.
+    Returns the report entry of the optimization, or None.
+    """
+    _write_lods(mesh, job)
+    if not job.optimizer:
+        _write_mesh_file(mesh, job.file_path, job.file_format)
+        return None
+
+    bytes_before = _mesh_file_size(mesh, job.file_format)
+    optimized = job.optimizer.optimize(mesh)
+    bytes_after = _write_mesh_file(optimized, job.file_path, job.file_format, job.optimizer.precision)
+    return {
+        "vertices_before": mesh.number_of_vertices(),
+        "vertices_after": optimized.number_of_vertices(),
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+    }
+
+
+def _write_lods(mesh, job):
+    """
+    Writes the levels of detail of a mesh, decimated by vertex clustering with cells relative to its bounding box diagonal.
+    """
+    if not job.lods:
+        return
+    points = mesh.vertices_attributes("xyz")
+    diagonal = sum((max(point[axis] for point in points) - min(point[axis] for point in points)) ** 2 for axis in range(3)) ** 0.5 if points else 0.0
+    precision = job.optimizer.precision if job.optimizer else None
+    for level, cell_ratio in enumerate(job.lods, 1):
+        lod = cluster_vertices(mesh, cell_ratio * (diagonal or 1.0), precision)
+        _write_mesh_file(lod, _lod_file_path(job.file_path, level), job.file_format, precision)
+
+
+def _mesh_file_size(mesh, file_format, precision=None):
+    """
+    Returns the size of the file a mesh would be written to, formatted in memory instead of written.
+    """
+    if file_format == "glb":
+        return len(mesh_to_glb(mesh))
+    obj_file = io.StringIO()
+    mesh.to_obj(obj_file, precision=precision)
+    text = obj_file.getvalue()
+    # Files written in text mode end their lines with the line separator of the platform
+    return len(text.encode("utf-8")) + text.count("\n") * (len(os.linesep) - 1)
+
+
+def _write_mesh_file(mesh, file_path, file_format, precision=None):
+    if file_format == "glb":
+        write_glb(mesh, file_path)
+    else:
+        mesh.to_obj(file_path, precision=precision)
+    return os.path.getsize(file_path)
+
+
+def _export_beam(job):
+    """
+    Meshes a single beam with its features applied, transforms it to the export frame and writes it in the job file format.
+    Plain .obj exports are streamed from the Brep face meshes, see :func:`compas_xr.project.obj_writer.write_meshes_as_obj`.
+    """
+    result = next(iter(BrepGeometryConsumer(job).result))
+    brep_meshes = result.geometry.to_meshes()
+    if job.file_format == "obj" and not job.optimizer and not job.lods:
+        # Streams the face meshes to the file, without joined and transformed copies of the whole beam
+        write_meshes_as_obj(job.file_path, brep_meshes, Transformation.from_frame_to_frame(job.beam_frame, job.frame))
+        return None
+    compas_mesh = Mesh()
+    for mesh in brep_meshes:
+        compas_mesh.join(mesh)
+    mesh_transformed = compas_mesh.transformed(Transformation.from_frame_to_frame(job.beam_frame, job.frame))
+    return _write_mesh(mesh_transformed, job)
+
+
+def _export_shape(job):
+    """
+    Transforms the shape of a single part to the export frame and writes it in the job file format.
+    Plain .obj exports of meshes are written from the transformed vertex array, without a transformed copy of the mesh.
+    """
+    transformation = Transformation.from_frame_to_frame(job.part_frame, job.frame)
+    if job.file_format == "obj" and not job.optimizer and not job.lods and isinstance(job.shape, Mesh):
+        write_transformed_obj(job.shape, transformation, job.file_path)
+        return None
+    return _write_mesh(job.shape.transformed(transformation), job)
+
+
+def _run_pickled_job(function, pickled_job):
+    return function(pickle.loads(pickled_job))
+
+
+def _pickled_jobs(jobs):
+    """
+    Returns the pickled jobs, or None if one of them cannot be pickled (ex: a beam with Brep features whose backend cannot serialize them).
+    """
+    try:
+        return [pickle.dumps(job, pickle.HIGHEST_PROTOCOL) for job in jobs]
+    except Exception:
+        return None
+
+
+def _run_export_jobs(function, jobs, max_workers=None, cache=None):
+    """
+    Runs the export jobs that are not cached, in a process pool if more than one worker is requested,
+    or in the current process otherwise. IronPython has no process pools, it always runs the jobs in the current process,
+    and so do jobs that cannot be pickled to be sent to the pool.
+    """
+    if cache:
+        keyed_jobs = [(job.cache_key(), job) for job in jobs]
+        keyed_jobs = [(key, job) for key, job in keyed_jobs if not all(cache.get(entry, path) for entry, path in _cache_entries(key, job))]
+        jobs = [job for _, job in keyed_jobs]
+
+    pickled_jobs = None
+    if max_workers and max_workers >= 2 and len(jobs) >= 2 and sys.platform != "cli":
+        pickled_jobs = _pickled_jobs(jobs)
+
+    if pickled_jobs is None:
+        results = [function(job) for job in jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # The jobs are pickled once up front, so the pool only sends the bytes
+        chunksize = max(1, len(jobs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_pickled_job, [function] * len(jobs), pickled_jobs, chunksize=chunksize))
+
+    # The jobs run on copies of the optimizer in worker processes, their reports are collected here
+    for job, result in zip(jobs, results):
+        if job.optimizer:
+            job.optimizer.report[str(job.key)] = result
+
+    if cache:
+        for key, job in keyed_jobs:
+            for entry, path in _cache_entries(key, job):
+                cache.put(entry, path)
+        cache.save()
+
+
+def _export(function, jobs, target_folder_path, max_workers=None, cache=None, optimizer=None, instancing=False, lods=None):
+    """
+    Runs the export jobs, only those of the first part of every prototype if instancing is enabled,
+    and writes the prototype map and the level of detail map next to the exported files.
+    """
+    prototypes = None
+    if instancing:
+        jobs, prototypes = group_prototypes(jobs, optimizer.precision if optimizer else None)
+
+    for level in range(1, len(lods or ()) + 1):
+        lod_folder_path = os.path.join(target_folder_path, "lod{}".format(level))
+        if not os.path.exists(lod_folder_path):
+            os.makedirs(lod_folder_path)
+
+    _run_export_jobs(function, jobs, max_workers, cache)
+
+    if instancing:
+        with open(os.path.join(target_folder_path, PROTOTYPES_FILE_NAME), "w") as prototypes_file:
+            json.dump(prototypes, prototypes_file, sort_keys=True)
+    if lods:
+        # Paths relative to the export folder, level 0 is the full resolution file
+        lod_files = {}
+        for job in jobs:
+            file_name = os.path.basename(job.file_path)
+            lod_files[str(job.key)] = [file_name] + ["lod{}/{}".format(level, file_name) for level in range(1, len(lods) + 1)]
+        with open(os.path.join(target_folder_path, LODS_FILE_NAME), "w") as lods_file:
+            json.dump(lod_files, lods_file, sort_keys=True)
+    return prototypes
+
 
 class AssemblyExtensions(object):
     """
     AssemblyExtensions is a class for extending the functionality of the :class:`~compas.datastructures.Assembly` class.
 
-    The AssemblyExtensions class provides additional functionalities such as exporting parts as .obj files
+    The AssemblyExtensions class provides additional functionalities such as exporting parts as .obj or .glb files
     and creating a frame assembly from a list of :class:`~compas.geometry.Frame` with a specific data structure
     for localization information.
 
     """
 
-    def export_timberassembly_objs(self, assembly, folder_path, new_folder_name, z_to_y_remap=False):
+    def export_timberassembly_objs(
+        self, assembly, folder_path, new_folder_name, z_to_y_remap=False, max_workers=None, cache=None, file_format="obj", optimizer=None, instancing=False, lods=None
+    ):
         """
-        Export timber assembly beams as .obj files to a folder path.
+        Export timber assembly beams as .obj files, or .glb files, to a folder path.
 
         Parameters
         ----------
@@ -34,12 +306,34 @@ class AssemblyExtensions(object):
             The name of the folder you would like to create.
         z_to_y_remap : bool, optional
             A boolean that determines if the z-axis should be remapped to the y-axis for .obj export. Default is False.
+        max_workers : int, optional
+            The number of worker processes that mesh and write the parts in parallel. Default is None, which exports in the current process.
+            The files are identical in both cases. IronPython always exports in the current process.
+            The beams are pickled to be sent to the worker processes, if the Brep backend cannot serialize the Brep features
+            of a beam (ex: ``BrepSubtraction``), all beams are exported in the current process instead.
+        cache : :class:`compas_xr.project.ExportCache`, optional
+            The cache from which the files of unchanged parts are copied instead of exporting them again. Default is None.
+        file_format : str, optional
+            The file format of the exported files, "obj" or "glb" (binary glTF). Default is "obj".
+        optimizer : :class:`compas_xr.project.MeshOptimizer`, optional
+            The optimizer that welds and quantizes the part meshes before they are written, and reports the savings. Default is None.
+        instancing : bool, optional
+            Whether geometrically identical parts share a single exported file. Default is False.
+            Only the first part of every prototype is exported, and the prototype key of every part
+            is written to a ``prototypes.json`` file next to the exported files.
+        lods : list of float, optional
+            The vertex clustering cell sizes of the levels of detail written for every part, relative to the bounding box diagonal
+            of the part (ex: ``[0.02, 0.08]``). Level n is written to a ``lod<n>`` subfolder, and the files of every part
+            are listed by level in a ``lods.json`` file next to the exported files. Default is None.
 
         Returns
         -------
-        None
+        dict of str, str or None
+            The key of the part whose file is shared by every part, keyed by part key, if instancing is enabled. None otherwise.
 
         """
+        if file_format not in EXPORT_FORMATS:
+            raise Exception("Unsupported export file format {}, expected one of {}".format(file_format, EXPORT_FORMATS))
         target_folder_path = os.path.join(folder_path, new_folder_name)
         if not os.path.exists(target_folder_path):
             os.makedirs(target_folder_path)
@@ -49,23 +343,17 @@ class AssemblyExtensions(object):
         else:
             frame = Frame.worldXY()
 
-        for result in BrepGeometryConsumer(assembly).result:
-            brep = result.geometry
-            beam_frame = result.beam.frame
-            key = result.beam.key
-
-            brep_meshes = brep.to_meshes()
-            compas_mesh = Mesh()
-            for mesh in brep_meshes:
-                compas_mesh.join(mesh)
-            mesh_transformed = compas_mesh.transformed(Transformation.from_frame_to_frame(beam_frame, frame))
+        jobs = []
+        for beam in assembly.beams:
+            filename = "{}.{}".format(str(beam.key), file_format)
+            jobs.append(_BeamExportJob(beam, frame, os.path.join(target_folder_path, filename), file_format, optimizer, lods))
+        return _export(_export_beam, jobs, target_folder_path, max_workers, cache, optimizer, instancing, lods)
 
-            filename = "{}.obj".format(str(key))
-            mesh_transformed.to_obj(os.path.join(target_folder_path, filename))
-
-    def export_mesh_assembly_objs(self, assembly, folder_path, new_folder_name, z_to_y_remap=False):
+    def export_mesh_assembly_objs(
+        self, assembly, folder_path, new_folder_name, z_to_y_remap=False, max_workers=None, cache=None, file_format="obj", optimizer=None, instancing=False, lods=None
+    ):
         """
-        Export Mesh assembly parts as .obj files to a folder path.
+        Export Mesh assembly parts as .obj files, or .glb files, to a folder path.
 
         Parameters
         ----------
@@ -77,12 +365,32 @@ class AssemblyExtensions(object):
             The name of the folder you would like to create.
         z_to_y_remap : bool, optional
             A boolean that determines if the z-axis should be remapped to the y-axis for .obj export. Default is False.
+        max_workers : int, optional
+            The number of worker processes that mesh and write the parts in parallel. Default is None, which exports in the current process.
+            The files are identical in both cases. IronPython always exports in the current process.
+        cache : :class:`compas_xr.project.ExportCache`, optional
+            The cache from which the files of unchanged parts are copied instead of exporting them again. Default is None.
+        file_format : str, optional
+            The file format of the exported files, "obj" or "glb" (binary glTF). Default is "obj".
+        optimizer : :class:`compas_xr.project.MeshOptimizer`, optional
+            The optimizer that welds and quantizes the part meshes before they are written, and reports the savings. Default is None.
+        instancing : bool, optional
+            Whether geometrically identical parts share a single exported file. Default is False.
+            Only the first part of every prototype is exported, and the prototype key of every part
+            is written to a ``prototypes.json`` file next to the exported files.
+        lods : list of float, optional
+            The vertex clustering cell sizes of the levels of detail written for every part, relative to the bounding box diagonal
+            of the part (ex: ``[0.02, 0.08]``). Level n is written to a ``lod<n>`` subfolder, and the files of every part
+            are listed by level in a ``lods.json`` file next to the exported files. Default is None.
 
         Returns
         -------
-        None
+        dict of str, str or None
+            The key of the part whose file is shared by every part, keyed by part key, if instancing is enabled. None otherwise.
 
         """
+        if file_format not in EXPORT_FORMATS:
+            raise Exception("Unsupported export file format {}, expected one of {}".format(file_format, EXPORT_FORMATS))
         target_folder_path = os.path.join(folder_path, new_folder_name)
         if not os.path.exists(target_folder_path):
             os.makedirs(target_folder_path)
@@ -92,6 +400,7 @@ class AssemblyExtensions(object):
         else:
             frame = Frame.worldXY()
 
+        jobs = []
         for part in assembly.parts():
             # Mesh assembly can be made with or without a frame (ex. assembly.add_part(Mesh)) try & default to worldXY
             if hasattr(part, "frame"):
@@ -100,14 +409,100 @@ class AssemblyExtensions(object):
                 part_frame = Frame.worldXY()
 
             # TODO: This is weird, but I can't transform a Part object, so I need to check if it's a Part or a Mesh
-            transformation = Transformation.from_frame_to_frame(part_frame, frame)
             if isinstance(part, Part):
-                part_transformed = part.attributes["shape"].transformed(transformation)
+                shape = part.attributes["shape"]
             else:
-                part_transformed = part.transformed(transformation)
+                shape = part
+
+            filename = "{}.{}".format(str(part.key), file_format)
+            jobs.append(_ShapeExportJob(part.key, shape, part_frame, frame, os.path.join(target_folder_path, filename), file_format, optimizer, lods))
+        return _export(_export_shape, jobs, target_folder_path, max_workers, cache, optimizer, instancing, lods)
+
+    def export_timberassembly_glbs(self, assembly, folder_path, new_folder_name, z_to_y_remap=False, max_workers=None, cache=None, optimizer=None, instancing=False, lods=None):
+        """
+        Export timber assembly beams as binary glTF (.glb) files to a folder path.
+
+        Every file holds a single mesh with a float32 vertex buffer and a uint32 triangle index buffer,
+        which is smaller and faster to load on AR devices than the equivalent .obj file.
 
-            filename = "{}.obj".format(str(part.key))
-            part_transformed.to_obj(os.path.join(target_folder_path, filename))
+        Parameters
+        ----------
+        assembly : :class:`~compas_timber.assembly.TimberAssembly`
+            The assembly that you want to export beams from.
+        folder_path : str
+            The path in which you would like to create a storage folder.
+        new_folder_name : str
+            The name of the folder you would like to create.
+        z_to_y_remap : bool, optional
+            A boolean that determines if the z-axis should be remapped to the y-axis for export. Default is False.
+        max_workers : int, optional
+            The number of worker processes that mesh and write the parts in parallel. Default is None, which exports in the current process.
+            The beams are pickled to be sent to the worker processes, if the Brep backend cannot serialize the Brep features
+            of a beam (ex: ``BrepSubtraction``), all beams are exported in the current process instead.
+        cache : :class:`compas_xr.project.ExportCache`, optional
+            The cache from which the files of unchanged parts are copied instead of exporting them again. Default is None.
+        optimizer : :class:`compas_xr.project.MeshOptimizer`, optional
+            The optimizer that welds and quantizes the part meshes before they are written, and reports the savings. Default is None.
+        instancing : bool, optional
+            Whether geometrically identical parts share a single exported file. Default is False.
+            Only the first part of every prototype is exported, and the prototype key of every part
+            is written to a ``prototypes.json`` file next to the exported files.
+        lods : list of float, optional
+            The vertex clustering cell sizes of the levels of detail written for every part, relative to the bounding box diagonal
+            of the part (ex: ``[0.02, 0.08]``). Level n is written to a ``lod<n>`` subfolder, and the files of every part
+            are listed by level in a ``lods.json`` file next to the exported files. Default is None.
+
+        Returns
+        -------
+        dict of str, str or None
+            The key of the part whose file is shared by every part, keyed by part key, if instancing is enabled. None otherwise.
+
+        """
+        return self.export_timberassembly_objs(
+            assembly, folder_path, new_folder_name, z_to_y_remap, max_workers, cache, file_format="glb", optimizer=optimizer, instancing=instancing, lods=lods
+        )
+
+    def export_mesh_assembly_glbs(self, assembly, folder_path, new_folder_name, z_to_y_remap=False, max_workers=None, cache=None, optimizer=None, instancing=False, lods=None):
+        """
+        Export Mesh assembly parts as binary glTF (.glb) files to a folder path.
+
+        Every file holds a single mesh with a float32 vertex buffer and a uint32 triangle index buffer,
+        which is smaller and faster to load on AR devices than the equivalent .obj file.
+
+        Parameters
+        ----------
+        assembly : :class:`~compas.datastructures.Assembly`
+            The Mesh assembly that you want to export parts from.
+        folder_path : str
+            The path in which you would like to create a storage folder.
+        new_folder_name : str
+            The name of the folder you would like to create.
+        z_to_y_remap : bool, optional
+            A boolean that determines if the z-axis should be remapped to the y-axis for export. Default is False.
+        max_workers : int, optional
+            The number of worker processes that transform and write the parts in parallel. Default is None, which exports in the current process.
+        cache : :class:`compas_xr.project.ExportCache`, optional
+            The cache from which the files of unchanged parts are copied instead of exporting them again. Default is None.
+        optimizer : :class:`compas_xr.project.MeshOptimizer`, optional
+            The optimizer that welds and quantizes the part meshes before they are written, and reports the savings. Default is None.
+        instancing : bool, optional
+            Whether geometrically identical parts share a single exported file. Default is False.
+            Only the first part of every prototype is exported, and the prototype key of every part
+            is written to a ``prototypes.json`` file next to the exported files.
+        lods : list of float, optional
+            The vertex clustering cell sizes of the levels of detail written for every part, relative to the bounding box diagonal
+            of the part (ex: ``[0.02, 0.08]``). Level n is written to a ``lod<n>`` subfolder, and the files of every part
+            are listed by level in a ``lods.json`` file next to the exported files. Default is None.
+
+        Returns
+        -------
+        dict of str, str or None
+            The key of the part whose file is shared by every part, keyed by part key, if instancing is enabled. None otherwise.
+
+        """
+        return self.export_mesh_assembly_objs(
+            assembly, folder_path, new_folder_name, z_to_y_remap, max_workers, cache, file_format="glb", optimizer=optimizer, instancing=instancing, lods=lods
+        )
 
     def create_qr_assembly(self, qr_frames):
         """
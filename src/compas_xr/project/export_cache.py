@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import compas
+from compas.data import json_dumps
+from compas.tolerance import TOL
+
+
+class ExportCache(object):
+    """
+    An ExportCache keeps exported mesh files on disk, keyed by a hash of the geometry inputs they were created from.
+
+    The AssemblyExtensions export methods look up every part in the cache before meshing it,
+    and copy the cached file instead of meshing, transforming and writing the part again when its inputs did not change.
+    The inputs of a timber beam are its blank, features and frame, the inputs of a mesh part are its shape and frame,
+    and both include the export frame (ex: the ``z_to_y_remap`` frame) and the file format and the COMPAS version and precision of the .obj writer.
+    The least recently used files are evicted once the cache exceeds its size limit.
+
+    Parameters
+    ----------
+    cache_directory : str, optional
+        The directory in which exported files are kept. Defaults to a ``compas_xr_export_cache`` folder in the temp directory.
+    max_size : int, optional
+        The maximum number of bytes kept on disk. Default is 1 GB.
+
+    Attributes
+    ----------
+    cache_directory : str
+        The directory in which exported files are kept.
+    max_size : int
+        The maximum number of bytes kept on disk.
+    hits : int
+        The number of parts that were copied from the cache.
+    misses : int
+        The number of parts that had to be exported.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_directory=None, max_size=1024 * 1024 * 1024):
+        self.cache_directory = cache_directory or os.path.join(tempfile.gettempdir(), "compas_xr_export_cache")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        if not os.path.exists(self.cache_directory):
+            os.makedirs(self.cache_directory)
+        self._index = self._load_index()
+
+    @property
+    def size(self):
+        """
+        int : The number of bytes currently kept on disk.
+        """
+        return sum(entry["size"] for entry in self._index.values())
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def _load_index(self):
+        index_path = os.path.join(self.cache_directory, self.INDEX_NAME)
+        if not os.path.exists(index_path):
+            return {}
+        try:
+            with open(index_path) as index_file:
+                index = json.load(index_file)
+        except ValueError:
+            return {}
+        # Drop entries whose file was removed outside of the cache
+        return dict((key, entry) for key, entry in index.items() if os.path.exists(self._file_path(key)))
+
+    def _file_path(self, key):
+        return os.path.join(self.cache_directory, key)
+
+    @staticmethod
+    def key_from_data(*data):
+        """
+        Computes the cache key of an export from its geometry inputs.
+
+        Parameters
+        ----------
+        *data : Any
+            The JSON serializable inputs of the export (ex: COMPAS geometry objects and frames).
+
+        Returns
+        -------
+        str
+            The hexadecimal SHA-1 hash of the inputs and of the .obj writer version.
+
+        """
+        # Round trip through plain JSON to get a key order independent serialization of COMPAS objects,
+        # without the guids that differ between otherwise identical objects
+        serialized = json.dumps(json.loads(json_dumps(list(data)), object_hook=ExportCache._without_guid), sort_keys=True)
+        writer = "{}:{}:".format(compas.__version__, TOL.precision)
+        return hashlib.sha1((writer + serialized).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _without_guid(obj):
+        obj.pop("guid", None)
+        return obj
+
+    def get(self, key, file_path):
+        """
+        Copies the cached file of a key to a file path.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the export.
+        file_path : str
+            The path the cached file is copied to.
+
+        Returns
+        -------
+        bool
+            True if the key was cached and the file was copied.
+
+        """
+        entry = self._index.get(key)
+        if not entry or not os.path.exists(self._file_path(key)):
+            self._index.pop(key, None)
+            self.misses += 1
+            return False
+        shutil.copyfile(self._file_path(key), file_path)
+        entry["accessed"] = time.time()
+        self.hits += 1
+        return True
+
+    def put(self, key, file_path):
+        """
+        Adds an exported file to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the export.
+        file_path : str
+            The path of the exported file.
+
+        Returns
+        -------
+        None
+
+        """
+        shutil.copyfile(file_path, self._file_path(key))
+        self._index[key] = {"size": os.path.getsize(file_path), "accessed": time.time()}
+
+    def save(self):
+        """
+        Evicts the least recently used files above the size limit and writes the index of the cache to disk.
+
+        Returns
+        -------
+        None
+
+        """
+        total = self.size
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["accessed"]):
+            if total <= self.max_size:
+                break
+            self._remove(key)
+            total -= entry["size"]
+
+        index_path = os.path.join(self.cache_directory, self.INDEX_NAME)
+        temp_path = index_path + ".tmp"
+        with open(temp_path, "w") as index_file:
+            json.dump(self._index, index_file)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        os.rename(temp_path, index_path)
+
+    def _remove(self, key):
+        self._index.pop(key, None)
+        if os.path.exists(self._file_path(key)):
+            os.remove(self._file_path(key))
+
+    def invalidate(self, key=None):
+        """
+        Removes an export, or every export, from the cache.
+
+        Parameters
+        ----------
+        key : str, optional
+            The cache key of the export to remove. Removes everything if None.
+
+        Returns
+        -------
+        None
+
+        """
+        keys = list(self._index) if key is None else [key]
+        for key in keys:
+            self._remove(key)
+        self.save()
@@ -0,0 +1,139 @@
+import json
+import struct
+
+GLB_MAGIC = 0x46546C67
+GLB_VERSION = 2
+JSON_CHUNK = 0x4E4F534A
+BIN_CHUNK = 0x004E4942
+
+FLOAT = 5126
+UNSIGNED_INT = 5125
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+TRIANGLES = 4
+
+
+def _padded(data, fill):
+    padding = (4 - len(data) % 4) % 4
+    return data + fill * padding
+
+
+def mesh_to_glb(mesh, name=None):
+    """
+    Encodes a mesh as binary glTF (GLB) with a float32 vertex buffer and a uint32 triangle index buffer.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh to encode, polygonal faces are triangulated.
+    name : str, optional
+        The name of the glTF node and mesh. Default is the name of the mesh.
+
+    Returns
+    -------
+    bytes
+        The GLB file content.
+
+    """
+    vertices, faces = mesh.to_vertices_and_faces(triangulated=True)
+    name = name or mesh.name
+
+    coordinates = [float(value) for vertex in vertices for value in vertex]
+    indices = [index for face in faces for index in face]
+    vertex_buffer = struct.pack("<{}f".format(len(coordinates)), *coordinates)
+    index_buffer = struct.pack("<{}I".format(len(indices)), *indices)
+    binary = _padded(vertex_buffer, b"\x00") + index_buffer
+
+    # The POSITION accessor bounds are required, they are taken from the float32 values to match the buffer
+    rounded = struct.unpack("<{}f".format(len(coordinates)), vertex_buffer)
+    bounds_min = [min(rounded[axis::3]) for axis in range(3)] if rounded else [0.0, 0.0, 0.0]
+    bounds_max = [max(rounded[axis::3]) for axis in range(3)] if rounded else [0.0, 0.0, 0.0]
+
+    gltf = {
+        "asset": {"version": "2.0", "generator": "compas_xr"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "name": name}],
+        "meshes": [{"name": name, "primitives": [{"attributes": {"POSITION": 0}, "indices": 1, "mode": TRIANGLES}]}],
+        "buffers": [{"byteLength": len(binary)}],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": len(vertex_buffer), "target": ARRAY_BUFFER},
+            {"buffer": 0, "byteOffset": len(_padded(vertex_buffer, b"\x00")), "byteLength": len(index_buffer), "target": ELEMENT_ARRAY_BUFFER},
+        ],
+        "accessors": [
+            {"bufferView": 0, "componentType": FLOAT, "count": len(vertices), "type": "VEC3", "min": bounds_min, "max": bounds_max},
+            {"bufferView": 1, "componentType": UNSIGNED_INT, "count": len(indices), "type": "SCALAR"},
+        ],
+    }
+    json_chunk = _padded(json.dumps(gltf, separators=(",", ":")).encode("utf-8"), b" ")
+    binary_chunk = _padded(binary, b"\x00")
+
+    length = 12 + 8 + len(json_chunk) + 8 + len(binary_chunk)
+    header = struct.pack("<III", GLB_MAGIC, GLB_VERSION, length)
+    json_header = struct.pack("<II", len(json_chunk), JSON_CHUNK)
+    binary_header = struct.pack("<II", len(binary_chunk), BIN_CHUNK)
+    return header + json_header + json_chunk + binary_header + binary_chunk
+
+
+def write_glb(mesh, file_path, name=None):
+    """
+    Writes a mesh to a binary glTF (GLB) file.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh to write, polygonal faces are triangulated.
+    file_path : str
+        The path of the .glb file.
+    name : str, optional
+        The name of the glTF node and mesh. Default is the name of the mesh.
+
+    Returns
+    -------
+    None
+
+    """
+    with open(file_path, "wb") as glb_file:
+        glb_file.write(mesh_to_glb(mesh, name=name))
+
+
+def read_glb(file_path):
+    """
+    Reads the vertices and triangles of the first mesh primitive of a binary glTF (GLB) file written by :func:`write_glb`.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the .glb file.
+
+    Returns
+    -------
+    vertices : list of tuple of float
+        The vertex coordinates.
+    faces : list of tuple of int
+        The vertex indices of the triangles.
+
+    """
+    with open(file_path, "rb") as glb_file:
+        content = glb_file.read()
+    magic, version, _ = struct.unpack_from("<III", content, 0)
+    if magic != GLB_MAGIC or version != GLB_VERSION:
+        raise Exception("Not a glTF 2.0 binary file: {}".format(file_path))
+
+    json_length, _ = struct.unpack_from("<II", content, 12)
+    gltf = json.loads(content[20 : 20 + json_length].decode("utf-8"))
+    binary_offset = 20 + json_length + 8
+
+    primitive = gltf["meshes"][0]["primitives"][0]
+    values = []
+    for accessor_index, code in ((primitive["attributes"]["POSITION"], "f"), (primitive["indices"], "I")):
+        accessor = gltf["accessors"][accessor_index]
+        view = gltf["bufferViews"][accessor["bufferView"]]
+        count = accessor["count"] * (3 if accessor["type"] == "VEC3" else 1)
+        offset = binary_offset + view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+        values.append(struct.unpack_from("<{}{}".format(count, code), content, offset))
+
+    coordinates, indices = values
+    vertices = [coordinates[i : i + 3] for i in range(0, len(coordinates), 3)]
+    faces = [indices[i : i + 3] for i in range(0, len(indices), 3)]
+    return vertices, faces
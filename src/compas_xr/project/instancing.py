@@ -0,0 +1,75 @@
+import hashlib
+import json
+
+from compas.data import json_dumps
+from compas.tolerance import TOL
+
+
+def _rounded(value, precision):
+    if isinstance(value, float):
+        # Adding 0.0 turns -0.0 into 0.0
+        return round(value, precision) + 0.0
+    if isinstance(value, list):
+        return [_rounded(item, precision) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _rounded(item, precision)) for key, item in value.items() if key != "guid")
+    return value
+
+
+def prototype_key(data, precision=None):
+    """
+    Computes the canonical hash of the geometry of a part, expressed in the local coordinates of the part.
+
+    Parts with the same prototype key are geometrically identical up to their placement,
+    so they can share a single exported mesh that every part places at its own frame.
+
+    Parameters
+    ----------
+    data : Any
+        The JSON serializable geometry of the part in its local coordinates (ex: COMPAS geometry objects).
+    precision : int, optional
+        The number of decimals the coordinates are compared at. Default is ``TOL.precision``.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-1 hash of the geometry.
+
+    """
+    precision = TOL.precision if precision is None else precision
+    serialized = json.dumps(_rounded(json.loads(json_dumps(data)), precision), sort_keys=True)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def group_prototypes(jobs, precision=None):
+    """
+    Groups export jobs by the prototype key of their part.
+
+    Parameters
+    ----------
+    jobs : list
+        The export jobs, every job provides a ``key`` and a ``local_geometry()`` method.
+        Jobs whose local geometry is None are never shared.
+    precision : int, optional
+        The number of decimals the coordinates are compared at. Default is ``TOL.precision``.
+
+    Returns
+    -------
+    prototype_jobs : list
+        The job of the first part of every prototype, which is exported for all parts of the prototype.
+    prototypes : dict of str, str
+        The key of the prototype part, keyed by the key of every part.
+
+    """
+    prototype_jobs = []
+    prototypes = {}
+    keys = {}
+    for job in jobs:
+        geometry = job.local_geometry()
+        geometry_key = prototype_key(geometry, precision) if geometry is not None else None
+        if geometry_key is None or geometry_key not in keys:
+            prototype_jobs.append(job)
+            if geometry_key is not None:
+                keys[geometry_key] = str(job.key)
+        prototypes[str(job.key)] = keys.get(geometry_key, str(job.key))
+    return prototype_jobs, prototypes
@@ -0,0 +1,176 @@
+import os
+
+from compas.data import json_dump
+from compas.data import json_load
+
+
+class MeshBundle(object):
+    """
+    A MeshBundle packs the exported mesh files of an assembly into a single file with a byte offset index.
+
+    The bundle is the plain concatenation of the files, and the index records the offset and length of every file
+    keyed by element key (the file name without extension). The whole assembly can therefore be transferred in one
+    request, and single parts can be read back with a byte range request.
+
+    Parameters
+    ----------
+    parts : dict of str, dict, optional
+        The ``{"file": str, "offset": int, "length": int}`` entry of every part, keyed by element key.
+
+    Attributes
+    ----------
+    parts : dict of str, dict
+        The ``{"file": str, "offset": int, "length": int}`` entry of every part, keyed by element key.
+    """
+
+    INDEX_SUFFIX = ".index.json"
+    EXTENSIONS = (".obj", ".glb")
+
+    def __init__(self, parts=None):
+        self.parts = parts or {}
+
+    def __data__(self):
+        return {"parts": self.parts}
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(dict(data.get("parts") or {}))
+
+    @property
+    def size(self):
+        """
+        int : The number of bytes of the bundle.
+        """
+        return sum(entry["length"] for entry in self.parts.values())
+
+    @classmethod
+    def index_path(cls, bundle_path):
+        """
+        Returns the path of the index file of a bundle file.
+
+        Parameters
+        ----------
+        bundle_path : str
+            The path of the bundle file.
+
+        Returns
+        -------
+        str
+            The path of the index file, next to the bundle file.
+
+        """
+        return bundle_path + cls.INDEX_SUFFIX
+
+    @classmethod
+    def from_directory(cls, directory_path, bundle_path):
+        """
+        Packs the .obj and .glb files of a directory into a bundle file and writes its index next to it.
+
+        Parameters
+        ----------
+        directory_path : str
+            The path to the directory where the exported mesh files are stored.
+        bundle_path : str
+            The path of the bundle file to write.
+
+        Returns
+        -------
+        :class:`compas_xr.project.MeshBundle`
+            The index of the written bundle.
+
+        """
+        if not os.path.exists(directory_path):
+            raise Exception("Directory {} does not exist!".format(directory_path))
+
+        bundle = cls()
+        offset = 0
+        with open(bundle_path, "wb") as bundle_file:
+            for file_name in sorted(os.listdir(directory_path)):
+                key, extension = os.path.splitext(file_name)
+                if extension.lower() not in cls.EXTENSIONS:
+                    continue
+                if key in bundle.parts:
+                    raise Exception("Element key {} is exported more than once in {}".format(key, directory_path))
+                with open(os.path.join(directory_path, file_name), "rb") as part_file:
+                    content = part_file.read()
+                bundle_file.write(content)
+                bundle.parts[key] = {"file": file_name, "offset": offset, "length": len(content)}
+                offset += len(content)
+        bundle.to_json(cls.index_path(bundle_path))
+        return bundle
+
+    @classmethod
+    def from_json(cls, index_path):
+        """
+        Reads the index of a bundle from a JSON file.
+
+        Parameters
+        ----------
+        index_path : str
+            The path of the index file.
+
+        Returns
+        -------
+        :class:`compas_xr.project.MeshBundle`
+            The index of the bundle.
+
+        """
+        return cls.__from_data__(json_load(index_path))
+
+    def to_json(self, index_path):
+        """
+        Writes the index of the bundle to a JSON file.
+
+        Parameters
+        ----------
+        index_path : str
+            The path of the index file.
+
+        Returns
+        -------
+        None
+
+        """
+        json_dump(self.__data__(), index_path)
+
+    def byte_range(self, key):
+        """
+        Returns the byte range of a part in the bundle.
+
+        Parameters
+        ----------
+        key : str
+            The element key of the part.
+
+        Returns
+        -------
+        tuple of int
+            The start and stop offset of the part, like a slice.
+
+        """
+        entry = self.parts.get(str(key))
+        if not entry:
+            raise KeyError("Element key {} is not in the bundle".format(key))
+        return entry["offset"], entry["offset"] + entry["length"]
+
+    def read_part(self, bundle_path, key):
+        """
+        Reads a part from a local bundle file.
+
+        Parameters
+        ----------
+        bundle_path : str
+            The path of the bundle file.
+        key : str
+            The element key of the part.
+
+        Returns
+        -------
+        bytes
+            The content of the part file.
+
+        """
+        start, stop = self.byte_range(key)
+        with open(bundle_path, "rb") as bundle_file:
+            bundle_file.seek(start)
+            return bundle_file.read(stop - start)
@@ -0,0 +1,146 @@
+from compas.datastructures import Mesh
+
+
+def cluster_vertices(mesh, cell_size, precision=None, average=True):
+    """
+    Simplifies a mesh by vertex clustering.
+
+    Every vertex is snapped to a grid of the cell size, the vertices in the same grid cell are merged into one,
+    and the faces that collapse to a line or a point are dropped.
+    Small cell sizes weld coincident vertices, large cell sizes decimate the mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh to simplify, it is not modified.
+    cell_size : float
+        The size of the grid cells.
+    precision : int, optional
+        The number of decimals the vertex coordinates are rounded to. Default is None, which does not round them.
+    average : bool, optional
+        Whether the merged vertices are placed at their average, or at the first of them. Default is True.
+
+    Returns
+    -------
+    :class:`compas.datastructures.Mesh`
+        The simplified mesh, with the name of the input mesh.
+
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+
+    cell_indices = {}
+    sums = []
+    counts = []
+    cluster_index = []
+    for vertex in vertices:
+        cell = tuple(int(round(value / cell_size)) for value in vertex)
+        index = cell_indices.get(cell)
+        if index is None:
+            index = cell_indices[cell] = len(sums)
+            sums.append([0.0, 0.0, 0.0])
+            counts.append(0)
+        if average or not counts[index]:
+            for axis in range(3):
+                sums[index][axis] += vertex[axis]
+            counts[index] += 1
+        cluster_index.append(index)
+
+    clustered_faces = []
+    for face in faces:
+        clustered_face = []
+        for vertex in face:
+            index = cluster_index[vertex]
+            if not clustered_face or clustered_face[-1] != index:
+                clustered_face.append(index)
+        if len(clustered_face) > 1 and clustered_face[0] == clustered_face[-1]:
+            clustered_face.pop()
+        # Faces whose vertices were merged together collapse to a line or a point
+        if len(set(clustered_face)) >= 3:
+            clustered_faces.append(clustered_face)
+
+    # Clusters only used by collapsed faces are left out
+    used = sorted(set(index for face in clustered_faces for index in face))
+    remap = dict((index, position) for position, index in enumerate(used))
+    clustered_vertices = []
+    for index in used:
+        point = [value / counts[index] for value in sums[index]]
+        if precision is not None:
+            # Adding 0.0 turns -0.0 into 0.0
+            point = [round(value, precision) + 0.0 for value in point]
+        clustered_vertices.append(point)
+
+    clustered = Mesh.from_vertices_and_faces(clustered_vertices, [[remap[index] for index in face] for face in clustered_faces])
+    clustered.name = mesh.name
+    return clustered
+
+
+class MeshOptimizer(object):
+    """
+    A MeshOptimizer welds coincident vertices and quantizes the vertex coordinates of exported part meshes.
+
+    Meshes joined from the faces of a Brep (ex: ``brep.to_meshes()``) repeat every vertex on the face seams,
+    and are written with the full precision of the .obj writer. Both inflate the exported files and their load time on devices.
+    The MeshOptimizer merges the vertices that fall in the same cell of a grid of the weld tolerance into the first of them,
+    see :func:`cluster_vertices`, and rounds the remaining coordinates to the given number of decimals.
+    The AssemblyExtensions export methods record the before/after vertex count and file size of every exported part in :attr:`report`.
+
+    Parameters
+    ----------
+    precision : int, optional
+        The number of decimals the vertex coordinates are rounded and written to. Default is 4.
+    weld_tolerance : float, optional
+        The size of the grid cells whose vertices are welded. Default is None, which uses a cell size of ``10 ** -precision``
+        and welds the vertices that round to the same coordinates.
+        The vertices of a cell are welded even if they are up to ``sqrt(3)`` times the cell size apart,
+        while vertices on either side of a cell boundary are not, however close they are.
+
+    Attributes
+    ----------
+    precision : int
+        The number of decimals the vertex coordinates are rounded and written to.
+    weld_tolerance : float
+        The size of the grid cells whose vertices are welded.
+    report : dict of str, dict
+        The ``{"vertices_before": int, "vertices_after": int, "bytes_before": int, "bytes_after": int}`` entry of every exported part,
+        keyed by element key. Parts copied from an :class:`compas_xr.project.ExportCache` are not exported again, and not reported.
+    """
+
+    def __init__(self, precision=4, weld_tolerance=None):
+        self.precision = precision
+        self.weld_tolerance = weld_tolerance or 10.0**-precision
+        self.report = {}
+
+    @property
+    def settings(self):
+        """
+        dict : The settings of the optimizer, part of the :class:`compas_xr.project.ExportCache` key of optimized exports.
+        """
+        return {"precision": self.precision, "weld_tolerance": self.weld_tolerance}
+
+    @property
+    def totals(self):
+        """
+        dict : The sums of the vertex counts and file sizes of all reported parts.
+        """
+        totals = {"vertices_before": 0, "vertices_after": 0, "bytes_before": 0, "bytes_after": 0}
+        for entry in self.report.values():
+            for name in totals:
+                totals[name] += entry[name]
+        return totals
+
+    def optimize(self, mesh):
+        """
+        Welds the coincident vertices of a mesh and rounds its vertex coordinates.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            The mesh to optimize, it is not modified.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+            The optimized mesh, with the name of the input mesh.
+
+        """
+        return cluster_vertices(mesh, self.weld_tolerance, self.precision, average=False)
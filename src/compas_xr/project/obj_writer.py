@@ -0,0 +1,160 @@
+import compas
+from compas.geometry import transform_points
+from compas.tolerance import TOL
+
+try:
+    from compas.geometry import transform_points_numpy
+except ImportError:
+    # IronPython has no NumPy
+    transform_points_numpy = None
+
+CHUNK_SIZE = 4096
+
+
+def write_obj(file_path, vertices, faces, name="Mesh", number_of_edges=0, precision=None):
+    """
+    Writes the vertices and faces of a single mesh to an .obj file, in the format of :meth:`compas.datastructures.Mesh.to_obj`.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the .obj file.
+    vertices : list of list of float or (N, 3) ndarray
+        The vertex coordinates.
+    faces : list of list of int
+        The vertex indices of the faces.
+    name : str, optional
+        The name of the mesh. Default is "Mesh".
+    number_of_edges : int, optional
+        The number of edges of the mesh, written to the file header. Default is 0.
+    precision : int, optional
+        The number of decimals of the vertex coordinates. Default is ``TOL.precision``.
+
+    Returns
+    -------
+    None
+
+    """
+    precision = precision or TOL.precision
+    with open(file_path, "w") as obj_file:
+        _write_header(obj_file, name, len(vertices), len(faces), number_of_edges, precision)
+        _write_vertices(obj_file, vertices, precision)
+        _write_faces(obj_file, faces)
+
+
+def write_meshes_as_obj(file_path, meshes, transformation=None, name="Mesh", precision=None):
+    """
+    Writes meshes as a single joined and transformed mesh to an .obj file, one mesh at a time.
+
+    The file is identical to the one written by joining the meshes into a new mesh, transforming it, and writing it
+    with :meth:`compas.datastructures.Mesh.to_obj`, up to the last digit of rounding ties.
+    Only the vertex and face lists of a single mesh are held in memory at once, instead of the joined and transformed copies.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the .obj file.
+    meshes : list of :class:`compas.datastructures.Mesh`
+        The meshes to write (ex: the tessellation of the faces of a Brep).
+    transformation : :class:`compas.geometry.Transformation`, optional
+        The transformation of the vertices. Default is None.
+    name : str, optional
+        The name of the joined mesh. Default is "Mesh".
+    precision : int, optional
+        The number of decimals of the vertex coordinates. Default is ``TOL.precision``.
+
+    Returns
+    -------
+    None
+
+    """
+    precision = precision or TOL.precision
+    # The header needs the counts of the joined mesh, the meshes are disjoint so they add up
+    number_of_vertices = sum(mesh.number_of_vertices() for mesh in meshes)
+    number_of_faces = sum(mesh.number_of_faces() for mesh in meshes)
+    number_of_edges = sum(mesh.number_of_edges() for mesh in meshes)
+
+    with open(file_path, "w") as obj_file:
+        _write_header(obj_file, name, number_of_vertices, number_of_faces, number_of_edges, precision)
+        # The joined mesh lists all vertices before all faces, so the meshes are streamed twice
+        for mesh in meshes:
+            vertices = mesh.vertices_attributes("xyz")
+            if vertices and transformation:
+                vertices = _transform_points(vertices, transformation)
+            _write_vertices(obj_file, vertices, precision)
+        offset = 0
+        for mesh in meshes:
+            vertex_index = mesh.vertex_index()
+            _write_faces(obj_file, ([vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()), offset)
+            offset += len(vertex_index)
+
+
+def write_transformed_obj(mesh, transformation, file_path, precision=None):
+    """
+    Writes a transformed mesh to an .obj file, without creating a transformed copy of the mesh.
+
+    The vertex coordinates are transformed as one NumPy array, the file is identical to the one
+    written by ``mesh.transformed(transformation).to_obj(file_path)`` up to the last digit of rounding ties.
+    Without NumPy (ex: IronPython) the transformed copy is written instead.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh to write.
+    transformation : :class:`compas.geometry.Transformation`
+        The transformation of the vertices.
+    file_path : str
+        The path of the .obj file.
+    precision : int, optional
+        The number of decimals of the vertex coordinates. Default is ``TOL.precision``.
+
+    Returns
+    -------
+    None
+
+    """
+    if not transform_points_numpy:
+        mesh.transformed(transformation).to_obj(file_path, precision=precision)
+        return
+
+    vertices, faces = mesh.to_vertices_and_faces()
+    if vertices:
+        vertices = _transform_points(vertices, transformation)
+    write_obj(file_path, vertices, faces, mesh.name, mesh.number_of_edges(), precision)
+
+
+def _transform_points(points, transformation):
+    if transform_points_numpy:
+        return transform_points_numpy(points, transformation)
+    return transform_points(points, transformation)
+
+
+def _write_header(obj_file, name, number_of_vertices, number_of_faces, number_of_edges, precision):
+    obj_file.write("# OBJ\n")
+    obj_file.write("# COMPAS\n")
+    obj_file.write("# version: {}\n".format(compas.__version__))
+    obj_file.write("# precision: {}\n".format(precision))
+    obj_file.write("# V F E: {} {} {}\n".format(number_of_vertices, number_of_faces, number_of_edges))
+    obj_file.write("\n")
+    obj_file.write("o {}\n".format("Mesh 0" if name == "Mesh" else name))
+
+
+def _write_vertices(obj_file, vertices, precision):
+    if hasattr(vertices, "tolist"):
+        vertices = vertices.tolist()
+    if precision > 0:
+        # Formats a chunk of vertices at once, "%.3f" formats numbers like TOL.format_number does for positive precision
+        vertex_line = "v %.{0}f %.{0}f %.{0}f\n".format(precision)
+        for start in range(0, len(vertices), CHUNK_SIZE):
+            chunk = vertices[start : start + CHUNK_SIZE]
+            obj_file.write((vertex_line * len(chunk)) % tuple(value for vertex in chunk for value in vertex))
+    else:
+        for x, y, z in vertices:
+            obj_file.write("v {0} {1} {2}\n".format(TOL.format_number(x, precision), TOL.format_number(y, precision), TOL.format_number(z, precision)))
+
+
+def _write_faces(obj_file, faces, offset=0):
+    # .obj vertex indices start at 1
+    offset += 1
+    for face in faces:
+        obj_file.write("f {0}\n".format(" ".join([str(index + offset) for index in face])))
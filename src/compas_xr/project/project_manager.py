@@ -1,13 +1,30 @@
+import json
 import os
 
+from compas.data import json_dumps
 from compas.geometry import Frame
 from compas_timber.assembly import TimberAssembly
 from compas_timber.planning import BuildingPlan
 from compas_timber.planning import Step
 
+from compas_xr.project.assembly_extensions import LODS_FILE_NAME
 from compas_xr.project.assembly_extensions import AssemblyExtensions
+from compas_xr.project.mesh_bundle import MeshBundle
+from compas_xr.project.project_schema import NORMALIZED_SCHEMA
+from compas_xr.project.project_schema import normalized_assembly_data
+from compas_xr.project.project_schema import project_objects_from_data
+from compas_xr.project.project_snapshot import ProjectSnapshot
+from compas_xr.project.project_snapshot import diff_trees
+from compas_xr.project.project_state_tracker import ProjectStateTracker
+from compas_xr.realtime_database import DatabaseQuery
+from compas_xr.realtime_database import LocalRealtimeDatabase
 from compas_xr.realtime_database import RealtimeDatabase
+from compas_xr.realtime_database import ReplicaDatabase
+from compas_xr.realtime_database import WriteQueue
+from compas_xr.storage import LocalStorage
 from compas_xr.storage import Storage
+from compas_xr.utilities import database_url_from_config
+from compas_xr.utilities import is_local_backend
 
 
 class ProjectManager(object):
@@ -19,20 +36,79 @@ class ProjectManager(object):
     ----------
     config_path : str
         The path to the configuration file for the project.
+        Configurations with ``"backend": "local"`` use a :class:`compas_xr.storage.LocalStorage` and a
+        :class:`compas_xr.realtime_database.LocalRealtimeDatabase` in the ``"localPath"`` directory instead of Firebase.
+    storage_cache : :class:`compas_xr.storage.StorageCache`, optional
+        The cache used by the storage to avoid downloading unchanged files again. Default is None.
+    replica_directory : str, optional
+        If given, the database is read and written in a local replica in this directory, see :class:`compas_xr.realtime_database.ReplicaDatabase`,
+        so database calls work without connection. The replica needs sqlite3, so it is not available in IronPython (ex: in Grasshopper).
+        Default is None.
+    sync_interval : float, optional
+        The number of seconds between background synchronizations of the replica,
+        None to only synchronize with ``project_manager.replica.sync()``. Default is 5.
+    write_window : float, optional
+        If given, database writes are queued for this number of seconds and sent as one multi-path update,
+        see :class:`compas_xr.realtime_database.WriteQueue`. Call ``project_manager.write_queue.flush()`` to send them right away.
+        Without ``replica_directory``, the project managers of the same configuration share one queue, see :meth:`compas_xr.realtime_database.WriteQueue.shared`,
+        so a project manager created on every Grasshopper solution does not start a thread each time. Default is None.
 
     Attributes
     ----------
-    storage : Storage
+    storage : Storage or LocalStorage
         The storage instance for the project.
-    database : RealtimeDatabase
+    database : RealtimeDatabase or LocalRealtimeDatabase or ReplicaDatabase or WriteQueue
         The realtime database instance for the project.
+    replica : :class:`compas_xr.realtime_database.ReplicaDatabase`
+        The replica of the database, None without ``replica_directory``.
+    write_queue : :class:`compas_xr.realtime_database.WriteQueue`
+        The queue of the database writes, None without ``write_window``.
+    database_url : str
+        The URL of the realtime database of the configuration, which keys the snapshots of published projects.
     """
 
-    def __init__(self, config_path):
+    def __init__(self, config_path, storage_cache=None, replica_directory=None, sync_interval=5.0, write_window=None):
         if not os.path.exists(config_path):
             raise Exception("Could not create Storage or Database with path {}!".format(config_path))
-        self.storage = Storage(config_path)
-        self.database = RealtimeDatabase(config_path)
+        self.database_url = database_url_from_config(config_path)
+        if is_local_backend(config_path):
+            self.storage = LocalStorage(config_path, cache=storage_cache)
+            self.database = LocalRealtimeDatabase(config_path)
+        else:
+            self.storage = Storage(config_path, cache=storage_cache)
+            self.database = RealtimeDatabase(config_path)
+        self.replica = None
+        self.write_queue = None
+        if replica_directory:
+            self.replica = self.database = ReplicaDatabase(self.database, replica_directory)
+            if sync_interval:
+                self.replica.start(interval=sync_interval)
+        if write_window:
+            if self.replica:
+                self.write_queue = WriteQueue(self.database, window=write_window)
+            else:
+                self.write_queue = WriteQueue.shared(os.path.abspath(config_path), self.database, window=write_window)
+            self.database = self.write_queue
+
+    def close(self):
+        """
+        Sends the queued database writes, and stops the background threads of the write queue and of the replica.
+        A write queue shared by the project managers of the configuration is only flushed, and keeps serving them.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            # An empty queue is falsy, it is compared with None
+            if self.write_queue is not None and self.replica:
+                self.write_queue.close()
+            elif self.write_queue is not None:
+                self.write_queue.flush()
+        finally:
+            if self.replica:
+                self.replica.close()
 
     def application_settings_writer(self, project_name, storage_folder="None", z_to_y_remap=False):
         """
@@ -55,7 +131,7 @@ class ProjectManager(object):
         data = {"project_name": project_name, "storage_folder": storage_folder, "z_to_y_remap": z_to_y_remap}
         self.database.upload_data(data, "ApplicationSettings")
 
-    def create_project_data_from_compas(self, assembly, building_plan, qr_frames_list):
+    def create_project_data_from_compas(self, assembly, building_plan, qr_frames_list, normalized=False):
         """
         Formats data structure from COMPAS Class Objects.
 
@@ -67,6 +143,9 @@ class ProjectManager(object):
             The BuildingPlan in which data will be extracted from.
         qr_frames_list : list of :class:`compas.geometry.Frame`
             List of frames at specific locations for application localization data.
+        normalized : bool, optional
+            Whether the assembly graph refers to the beams, joints or parts by key instead of holding a second copy of them.
+            The project is marked with ``"schema": "normalized"``, and read back by :meth:`get_project_objects`. Default is False.
 
         Returns
         -------
@@ -74,10 +153,11 @@ class ProjectManager(object):
 
         """
         qr_assembly = AssemblyExtensions().create_qr_assembly(qr_frames_list)
+        assembly_data = normalized_assembly_data(assembly) if normalized else assembly.__data__
         if isinstance(assembly, TimberAssembly):
             data = {
                 "QRFrames": qr_assembly.__data__,
-                "assembly": assembly.__data__,
+                "assembly": assembly_data,
                 "beams": {beam.key: beam for beam in assembly.beams},
                 "joints": {joint.key: joint for joint in assembly.joints},
                 "building_plan": building_plan,
@@ -85,10 +165,12 @@ class ProjectManager(object):
         else:
             data = {
                 "QRFrames": qr_assembly.__data__,
-                "assembly": assembly.__data__,
+                "assembly": assembly_data,
                 "parts": {part.key: part for part in assembly.parts()},
                 "building_plan": building_plan,
             }
+        if normalized:
+            data["schema"] = NORMALIZED_SCHEMA
         return data
 
     def upload_data_to_project(self, data, project_name, data_name):
@@ -111,7 +193,7 @@ class ProjectManager(object):
         """
         self.database.upload_data_to_reference_as_child(data, project_name, data_name)
 
-    def upload_project_data_from_compas(self, project_name, assembly, building_plan, qr_frames_list):
+    def upload_project_data_from_compas(self, project_name, assembly, building_plan, qr_frames_list, normalized=False):
         """
         Formats data structure from COMPAS Class Objects and uploads them to the RealtimeDatabase under project name.
 
@@ -125,15 +207,67 @@ class ProjectManager(object):
             List of frames at specific locations for application localization data.
         project_name : str
             The name of the project under which the data will be stored.
+        normalized : bool, optional
+            Whether the assembly graph refers to the beams, joints or parts by key instead of holding a second copy of them. Default is False.
 
         Returns
         -------
         None
 
         """
-        data = self.create_project_data_from_compas(assembly, building_plan, qr_frames_list)
+        data = self.create_project_data_from_compas(assembly, building_plan, qr_frames_list, normalized=normalized)
         self.database.upload_data(data, project_name)
 
+    def publish_project_data_from_compas(self, project_name, assembly, building_plan, qr_frames_list, normalized=False, snapshot_directory=None):
+        """
+        Uploads only the data of a project that changed since it was last published from this machine.
+
+        The published data tree is kept in a local :class:`compas_xr.project.ProjectSnapshot`. The next publish compares the new tree
+        with the snapshot and sends the changed paths as one multi-path update, so its size and duration scale with the change.
+        Without a snapshot, or if the project was deleted or reset in the database since the snapshot (checked with a shallow query),
+        the whole project is uploaded, like :meth:`upload_project_data_from_compas`.
+        Data changed in the database since the snapshot (ex: steps built in the app) is only overwritten where it changed locally,
+        and the guids of objects recreated with the same data are not sent.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data will be stored.
+        assembly : :class:`compas.datastructures.Assembly` or :class:`compas_timber.assembly.TimberAssembly`
+            The assembly in which data will be extracted from.
+        building_plan : :class:`compas_timber.planning.BuildingPlan`
+            The BuildingPlan in which data will be extracted from.
+        qr_frames_list : list of :class:`compas.geometry.Frame`
+            List of frames at specific locations for application localization data.
+        normalized : bool, optional
+            Whether the assembly graph refers to the beams, joints or parts by key instead of holding a second copy of them. Default is False.
+        snapshot_directory : str, optional
+            The directory in which the snapshots of published projects are kept. Defaults to a folder in the temp directory.
+
+        Returns
+        -------
+        dict of str, Any or None
+            The values that were sent, keyed by their path in the project, or None if the whole project was uploaded.
+
+        """
+        data = self.create_project_data_from_compas(assembly, building_plan, qr_frames_list, normalized=normalized)
+        snapshot = ProjectSnapshot(project_name, snapshot_directory, self.database_url)
+        tree = snapshot.tree_from_data(json.loads(json_dumps(data)))
+        previous = snapshot.load()
+        if previous is not None:
+            remote_keys = self.database.get_shallow_data_from_deep_reference([project_name])
+            if not isinstance(remote_keys, dict) or any(key not in remote_keys for key in previous):
+                # The project was deleted or reset since the snapshot, a delta would leave it incomplete
+                previous = None
+        if previous is None:
+            self.database.upload_data(tree, project_name)
+            snapshot.save(tree)
+            return None
+        updates = diff_trees(previous, tree)
+        self.database.update_data_at_paths(updates, [project_name])
+        snapshot.save(tree)
+        return updates
+
     def upload_qr_frames_to_project(self, project_name, qr_frames_list):
         """
         Uploads QR Frames to the Firebase RealtimeDatabase under the specified project name.
@@ -173,7 +307,7 @@ class ProjectManager(object):
         storage_folder_list = ["obj_storage", storage_folder_name]
         self.storage.upload_file_as_bytes_to_deep_reference(path_local, storage_folder_list)
 
-    def upload_objs_from_directory_to_storage(self, local_directory, storage_folder_name):
+    def upload_objs_from_directory_to_storage(self, local_directory, storage_folder_name, max_workers=8, journal_path=None, raise_on_error=True):
         """
         Uploads all .obj files from a directory to the Firebase Storage under the specified storage folder name.
 
@@ -183,16 +317,305 @@ class ProjectManager(object):
             The path to the directory where the projects .obj files are stored.
         storage_folder_name : str
             The name of the storage folder where the .obj files will be uploaded.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+        raise_on_error : bool, optional
+            Whether to raise a :class:`compas_xr.storage.UploadError` if some files were not uploaded. Default is True.
 
         Returns
         -------
-        None
+        :class:`compas_xr.storage.UploadReport`
+            The per-file outcome and the throughput of the upload.
 
         """
         storage_folder_list = ["obj_storage", storage_folder_name]
-        self.storage.upload_files_as_bytes_from_directory_to_deep_reference(local_directory, storage_folder_list)
+        return self.storage.upload_files_as_bytes_from_directory_to_deep_reference(
+            local_directory, storage_folder_list, max_workers=max_workers, journal_path=journal_path, raise_on_error=raise_on_error
+        )
 
-    def get_project_data(self, project_name):
+    def sync_objs_from_directory_to_storage(self, local_directory, storage_folder_name, delete_orphans=False, max_workers=8, journal_path=None):
+        """
+        Synchronizes a directory of .obj files with the Firebase Storage under the specified storage folder name.
+
+        Only .obj files that were added or changed since the last sync are uploaded,
+        based on the manifest stored in the storage folder.
+
+        Parameters
+        ----------
+        local_directory : str
+            The path to the directory where the projects .obj files are stored.
+        storage_folder_name : str
+            The name of the storage folder where the .obj files will be uploaded.
+        delete_orphans : bool, optional
+            Whether .obj files that no longer exist locally should be deleted from the storage folder. Default is False.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.SyncReport`
+            The outcome of the synchronization.
+
+        """
+        storage_folder_list = ["obj_storage", storage_folder_name]
+        return self.storage.sync_directory_to_deep_reference(
+            local_directory, storage_folder_list, delete_orphans=delete_orphans, max_workers=max_workers, journal_path=journal_path
+        )
+
+    def upload_glb_to_storage(self, path_local, storage_folder_name):
+        """
+        Upload a .glb file to the Firebase Storage under the specified storage folder name.
+
+        Parameters
+        ----------
+        path_local : str
+            The path at which the glb file is stored.
+        storage_folder_name : str
+            The name of the storage folder where the .glb file will be uploaded.
+
+        Returns
+        -------
+        None
+
+        """
+        storage_folder_list = ["glb_storage", storage_folder_name]
+        self.storage.upload_file_as_bytes_to_deep_reference(path_local, storage_folder_list)
+
+    def upload_glbs_from_directory_to_storage(self, local_directory, storage_folder_name, max_workers=8, journal_path=None, raise_on_error=True):
+        """
+        Uploads all .glb files from a directory to the Firebase Storage under the specified storage folder name.
+
+        Parameters
+        ----------
+        local_directory : str
+            The path to the directory where the projects .glb files are stored.
+        storage_folder_name : str
+            The name of the storage folder where the .glb files will be uploaded.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+        raise_on_error : bool, optional
+            Whether to raise a :class:`compas_xr.storage.UploadError` if some files were not uploaded. Default is True.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.UploadReport`
+            The per-file outcome and the throughput of the upload.
+
+        """
+        storage_folder_list = ["glb_storage", storage_folder_name]
+        return self.storage.upload_files_as_bytes_from_directory_to_deep_reference(
+            local_directory, storage_folder_list, max_workers=max_workers, journal_path=journal_path, raise_on_error=raise_on_error
+        )
+
+    def sync_glbs_from_directory_to_storage(self, local_directory, storage_folder_name, delete_orphans=False, max_workers=8, journal_path=None):
+        """
+        Synchronizes a directory of .glb files with the Firebase Storage under the specified storage folder name.
+
+        Only .glb files that were added or changed since the last sync are uploaded,
+        based on the manifest stored in the storage folder.
+
+        Parameters
+        ----------
+        local_directory : str
+            The path to the directory where the projects .glb files are stored.
+        storage_folder_name : str
+            The name of the storage folder where the .glb files will be uploaded.
+        delete_orphans : bool, optional
+            Whether .glb files that no longer exist locally should be deleted from the storage folder. Default is False.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.SyncReport`
+            The outcome of the synchronization.
+
+        """
+        storage_folder_list = ["glb_storage", storage_folder_name]
+        return self.storage.sync_directory_to_deep_reference(
+            local_directory, storage_folder_list, delete_orphans=delete_orphans, max_workers=max_workers, journal_path=journal_path
+        )
+
+    def upload_prototypes_to_project(self, project_name, prototypes):
+        """
+        Uploads the prototype map of an instanced export to the Firebase RealtimeDatabase under the specified project name.
+
+        The app loads a single file per prototype, and places it at the frame of every part that refers to it.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the prototypes will be stored.
+        prototypes : dict of str, str
+            The key of the part whose file is shared by every part, keyed by part key,
+            as returned by the :class:`compas_xr.project.AssemblyExtensions` export methods with instancing.
+
+        Returns
+        -------
+        None
+
+        """
+        self.upload_data_to_project(prototypes, project_name, "prototypes")
+
+    def upload_lods_from_directory_to_storage(self, local_directory, storage_folder_name, file_format="obj", max_workers=8, journal_path=None, raise_on_error=True):
+        """
+        Uploads the level of detail subfolders of an export directory to the Firebase Storage under the specified storage folder name.
+
+        Every ``lod<n>`` subfolder is uploaded to its own subfolder of the storage folder, the full resolution files
+        are uploaded with :meth:`upload_objs_from_directory_to_storage` or :meth:`upload_glbs_from_directory_to_storage`.
+
+        Parameters
+        ----------
+        local_directory : str
+            The path to the export directory, which contains the ``lod<n>`` subfolders.
+        storage_folder_name : str
+            The name of the storage folder where the full resolution files are uploaded.
+        file_format : str, optional
+            The file format of the exported files, "obj" or "glb". Default is "obj".
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+        raise_on_error : bool, optional
+            Whether to raise a :class:`compas_xr.storage.UploadError` if some files of a subfolder were not uploaded. Default is True.
+
+        Returns
+        -------
+        dict of str, :class:`compas_xr.storage.UploadReport`
+            The outcome of the upload of every level of detail subfolder, keyed by subfolder name.
+
+        """
+        reports = {}
+        level = 1
+        while os.path.isdir(os.path.join(local_directory, "lod{}".format(level))):
+            lod_folder_name = "lod{}".format(level)
+            storage_folder_list = ["{}_storage".format(file_format), storage_folder_name, lod_folder_name]
+            reports[lod_folder_name] = self.storage.upload_files_as_bytes_from_directory_to_deep_reference(
+                os.path.join(local_directory, lod_folder_name), storage_folder_list, max_workers=max_workers, journal_path=journal_path, raise_on_error=raise_on_error
+            )
+            level += 1
+        return reports
+
+    def upload_lods_to_project(self, project_name, local_directory):
+        """
+        Uploads the level of detail map of an export directory to the Firebase RealtimeDatabase under the specified project name.
+
+        The map lists the files of every part by level, relative to the storage folder,
+        so the app can load the coarsest level first and replace it with the finer ones.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the level of detail map will be stored.
+        local_directory : str
+            The path to the export directory, which contains the ``lods.json`` file written by the
+            :class:`compas_xr.project.AssemblyExtensions` export methods.
+
+        Returns
+        -------
+        None
+
+        """
+        lods_path = os.path.join(local_directory, LODS_FILE_NAME)
+        if not os.path.exists(lods_path):
+            raise Exception("No level of detail map found at {}".format(lods_path))
+        with open(lods_path) as lods_file:
+            lods = json.load(lods_file)
+        self.upload_data_to_project(lods, project_name, "lods")
+
+    def write_mesh_bundle(self, local_directory, bundle_path):
+        """
+        Packs the exported .obj and .glb files of a directory into a single bundle file with a byte offset index.
+
+        Parameters
+        ----------
+        local_directory : str
+            The path to the directory where the projects exported mesh files are stored.
+        bundle_path : str
+            The path of the bundle file to write, the index is written next to it.
+
+        Returns
+        -------
+        :class:`compas_xr.project.MeshBundle`
+            The index of the written bundle.
+
+        """
+        return MeshBundle.from_directory(local_directory, bundle_path)
+
+    def upload_mesh_bundle_to_storage(self, bundle_path, storage_folder_name):
+        """
+        Uploads a bundle file and its index to the Firebase Storage under the specified storage folder name.
+
+        Parameters
+        ----------
+        bundle_path : str
+            The path of the bundle file, its index is expected next to it.
+        storage_folder_name : str
+            The name of the storage folder where the bundle will be uploaded.
+
+        Returns
+        -------
+        None
+
+        """
+        storage_folder_list = ["bundle_storage", storage_folder_name]
+        self.storage.upload_file_as_bytes_to_deep_reference(bundle_path, storage_folder_list)
+        self.storage.upload_file_as_bytes_to_deep_reference(MeshBundle.index_path(bundle_path), storage_folder_list)
+
+    def get_mesh_bundle_index_from_storage(self, storage_folder_name, bundle_name):
+        """
+        Retrieves the index of a bundle from the Firebase Storage.
+
+        Parameters
+        ----------
+        storage_folder_name : str
+            The name of the storage folder where the bundle is stored.
+        bundle_name : str
+            The file name of the bundle.
+
+        Returns
+        -------
+        :class:`compas_xr.project.MeshBundle`
+            The index of the bundle.
+
+        """
+        storage_path_list = ["bundle_storage", storage_folder_name, MeshBundle.index_path(bundle_name)]
+        return MeshBundle.__from_data__(self.storage.get_data_from_deep_reference(storage_path_list))
+
+    def get_part_from_mesh_bundle_in_storage(self, storage_folder_name, bundle_name, key, bundle_index=None):
+        """
+        Retrieves the mesh file of a single part from a bundle in the Firebase Storage with a byte range request.
+
+        Parameters
+        ----------
+        storage_folder_name : str
+            The name of the storage folder where the bundle is stored.
+        bundle_name : str
+            The file name of the bundle.
+        key : str
+            The element key of the part.
+        bundle_index : :class:`compas_xr.project.MeshBundle`, optional
+            The index of the bundle. Default is None, in which case it is retrieved first.
+
+        Returns
+        -------
+        bytes
+            The content of the mesh file of the part.
+
+        """
+        bundle_index = bundle_index or self.get_mesh_bundle_index_from_storage(storage_folder_name, bundle_name)
+        storage_path_list = ["bundle_storage", storage_folder_name, bundle_name]
+        return self.storage.get_bytes_from_deep_reference(storage_path_list, bundle_index.byte_range(key))
+
+    def get_project_data(self, project_name, lazy=False):
         """
         Retrieves data from the Firebase RealtimeDatabase under the specified project name.
 
@@ -200,15 +623,44 @@ class ProjectManager(object):
         ----------
         project_name : str
             The name of the project under which the data will be stored.
+        lazy : bool, optional
+            If True, returns a view that downloads each subtree of the project on first access
+            (ex: ``project_manager.get_project_data(name, lazy=True).building_plan.LastBuiltIndex``).
+            Default is False.
 
         Returns
         -------
-        data : dict
-            The data retrieved from the database at the point of fetching.
+        data : dict or :class:`compas_xr.realtime_database.DatabaseView`
+            The data retrieved from the database at the point of fetching, or the lazy view of the data.
 
         """
+        if lazy:
+            return self.database.view_deep_reference([project_name])
         return self.database.get_data(project_name)
 
+    def get_project_objects(self, project_name):
+        """
+        Retrieves the data of a project from the Firebase RealtimeDatabase and reconstructs its COMPAS objects.
+
+        Projects uploaded with the default and the normalized schema are both read.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project.
+
+        Returns
+        -------
+        dict
+            The "QRFrames" and "assembly" assemblies, the "building_plan",
+            and the "beams" and "joints" of a timber assembly or the "parts" of an assembly, keyed by part key.
+
+        """
+        data = self.get_project_data(project_name)
+        if not data:
+            raise Exception("Project {} does not exist!".format(project_name))
+        return project_objects_from_data(data)
+
     def upload_compas_object_to_storage(self, compas_object, cloud_file_name, pretty=True):
         """
         Uploads an assembly to the Firebase Storage.
@@ -248,6 +700,10 @@ class ProjectManager(object):
         """
         Edits a building plan step in the Firebase RealtimeDatabase under the specified project name.
 
+        Only the actor, is_built, is_planned and priority fields of the step are written, in a single multi-path update,
+        so concurrent changes to other fields of the step (ex: by AR devices) are preserved.
+        The key is checked with a shallow read of the step first, which only downloads the names of its fields.
+
         Parameters
         ----------
         project_name : str
@@ -267,16 +723,185 @@ class ProjectManager(object):
         -------
         None
 
+        Raises
+        ------
+        Exception
+            If the building plan of the project has no step with the key.
+
+        """
+        step_reference_list = [project_name, "building_plan", "data", "steps", key]
+        # A partial update of a missing step would create a step without its dtype, which no longer decodes
+        step = self.database.get_shallow_data_from_deep_reference(step_reference_list)
+        if not isinstance(step, dict) or "dtype" not in step:
+            raise Exception("No building plan step {} found in project {}".format(key, project_name))
+        database_reference_list = step_reference_list + ["data"]
+        updates = {"actor": actor, "is_built": is_built, "is_planned": is_planned, "priority": priority}
+        self.database.update_data_at_paths(updates, database_reference_list)
+
+    def edit_steps_on_database(self, project_name, step_changes, max_request_size=1024 * 1024, max_workers=4):
+        """
+        Edits many building plan steps in the Firebase RealtimeDatabase under the specified project name at once.
+
+        The changes are written as a few multi-path updates of the building plan instead of one request per step.
+        Only the given fields are written, and the changes of one step are always written together.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data is stored.
+        step_changes : dict of str, dict
+            The changed fields of every step (ex: {"actor": "ROBOT", "priority": 2}), keyed by step key.
+        max_request_size : int, optional
+            The maximum number of bytes of the serialized changes of one request. Default is 1 MB.
+        max_workers : int, optional
+            The maximum number of concurrent requests. Default is 4.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.BatchUpdateReport`
+            The keys of the steps that were edited, and the error of every step that was not.
+
+        """
+        grouped_updates = {}
+        for key, changes in step_changes.items():
+            grouped_updates[str(key)] = dict((("steps", str(key), "data", field), value) for field, value in changes.items())
+        database_reference_list = [project_name, "building_plan", "data"]
+        return self.database.update_data_at_paths_in_batches(grouped_updates, database_reference_list, max_request_size=max_request_size, max_workers=max_workers)
+
+    def query_steps_on_database(self, project_name, query):
+        """
+        Retrieves the building plan steps matching a query from the Firebase RealtimeDatabase, without downloading the other steps.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data is stored.
+        query : :class:`compas_xr.realtime_database.DatabaseQuery`
+            The query selecting the steps, ordered by a path relative to the step (ex: ``DatabaseQuery("data/priority", equal_to=2)``).
+            Queries ordered by a field need an ``.indexOn`` rule for the field on the steps of the project.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            The data of the matching steps, keyed by step key, in query order.
+
+        """
+        steps_reference_list = [project_name, "building_plan", "data", "steps"]
+        return self.database.query_data_from_deep_reference(query, steps_reference_list)
+
+    def get_unbuilt_steps_from_database(self, project_name, priority=None):
+        """
+        Retrieves the building plan steps that are not built from the Firebase RealtimeDatabase.
+
+        The database filters the steps by one field, by priority if one is given and by ``is_built`` otherwise.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data is stored.
+        priority : int, optional
+            Retrieves only the steps of this priority. Default is None.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            The data of the unbuilt steps, keyed by step key.
+
+        """
+        if priority is None:
+            return self.query_steps_on_database(project_name, DatabaseQuery("data/is_built", equal_to=False))
+        steps = self.query_steps_on_database(project_name, DatabaseQuery("data/priority", equal_to=priority))
+        for key in [key for key, step in steps.items() if step["data"].get("is_built")]:
+            del steps[key]
+        return steps
+
+    def get_next_priority_steps_from_database(self, project_name):
+        """
+        Retrieves the unbuilt building plan steps of the lowest priority from the Firebase RealtimeDatabase.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data is stored.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            The data of the steps of the next priority group, keyed by step key. Empty if all steps are built.
+
+        """
+        steps = self.get_unbuilt_steps_from_database(project_name)
+        if not steps:
+            return steps
+        priority = min(step["data"].get("priority", 0) for step in steps.values())
+        for key in [key for key, step in steps.items() if step["data"].get("priority", 0) != priority]:
+            del steps[key]
+        return steps
+
+    def mirror_project_state(self, project_name, callback=None):
+        """
+        Keeps an in-memory copy of the building plan data of a project current, following its changes in the Firebase RealtimeDatabase.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data is stored.
+        callback : callable, optional
+            A function called as ``callback(changed_paths)`` after every change of the building plan data. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.DatabaseMirror`
+            The started mirror, call its ``close`` method to stop following the project.
+
+        """
+        buiding_plan_data_reference_list = [project_name, "building_plan", "data"]
+        return self.database.mirror_deep_reference(buiding_plan_data_reference_list, callback=callback)
+
+    def track_project_state(self, assembly, project_name, timbers=False):
+        """
+        Creates a tracker that follows the building plan of a project and only processes the steps that changed.
+
+        Parameters
+        ----------
+        assembly : :class:`compas.datastructures.Assembly` or :class:`compas_timber.assembly.TimberAssembly`
+            The assembly in which the project is based off of: Used for part visulization.
+        project_name : str
+            The name of the project under which the data is stored.
+        timbers : bool, optional
+            Whether the assembly is a TimberAssembly, whose parts are visualized by their blanks. Default is False.
+
+        Returns
+        -------
+        :class:`compas_xr.project.ProjectStateTracker`
+            The tracker, following a mirror of the building plan data. Call ``tracker.mirror.close()`` to stop following the project.
+
+        """
+        tracker = ProjectStateTracker(assembly, timbers=timbers)
+        tracker.mirror = self.mirror_project_state(project_name, callback=tracker.on_change)
+        return tracker
+
+    def _update_tracker(self, tracker, project_name, mirror=None):
+        """
+        Refreshes a tracker from its own mirror, or from the building plan data of the project otherwise.
         """
-        database_reference_list = [project_name, "building_plan", "data", "steps", key, "data"]
-        current_data = self.database.get_data_from_deep_reference(database_reference_list)
-        current_data["actor"] = actor
-        current_data["is_built"] = is_built
-        current_data["is_planned"] = is_planned
-        current_data["priority"] = priority
-        self.database.upload_data_to_deep_reference(current_data, database_reference_list)
+        if tracker.mirror:
+            return tracker.refresh()
+        return tracker.update(self._get_building_plan_data(project_name, mirror))
 
-    def visualize_project_state_timbers(self, timber_assembly, project_name):
+    def _get_building_plan_data(self, project_name, mirror=None):
+        """
+        Returns the building plan data of a project from the mirror if one is given, or downloads it otherwise.
+        """
+        if not mirror:
+            buiding_plan_data_reference_list = [project_name, "building_plan", "data"]
+            return self.database.get_data_from_deep_reference(buiding_plan_data_reference_list)
+        current_state_data = mirror.get_data()
+        if current_state_data is None:
+            raise Exception("No data received yet for the building plan of project {}".format(project_name))
+        return current_state_data
+
+    def visualize_project_state_timbers(self, timber_assembly, project_name, mirror=None, tracker=None):
         """
         Retrieves and visualizes data from the Firebase RealtimeDatabase under the specified project name.
 
@@ -286,6 +911,10 @@ class ProjectManager(object):
             The assembly in which the project is based off of: Used for part visulization.
         project_name : str
             The name of the project under which the data will be stored.
+        mirror : :class:`compas_xr.realtime_database.DatabaseMirror`, optional
+            The mirror of the project state to read from instead of downloading it, see :meth:`mirror_project_state`.
+        tracker : :class:`compas_xr.project.ProjectStateTracker`, optional
+            The tracker holding the previous state, which then only processes the changed steps, see :meth:`track_project_state`.
 
         Returns
         -------
@@ -303,9 +932,10 @@ class ProjectManager(object):
             The parts that have not been built by a robot.
 
         """
+        if tracker:
+            return self._update_tracker(tracker, project_name, mirror)
         nodes = timber_assembly.graph.__data__["node"]
-        buiding_plan_data_reference_list = [project_name, "building_plan", "data"]
-        current_state_data = self.database.get_data_from_deep_reference(buiding_plan_data_reference_list)
+        current_state_data = self._get_building_plan_data(project_name, mirror)
 
         built_human = []
         unbuilt_human = []
@@ -353,7 +983,7 @@ class ProjectManager(object):
                     unbuilt_robot.append(part.blank)
         return last_built_index, step_locations, built_human, unbuilt_human, built_robot, unbuilt_robot
 
-    def visualize_project_state(self, assembly, project_name):
+    def visualize_project_state(self, assembly, project_name, mirror=None, tracker=None):
         """
         Retrieves and visualizes data from the Firebase RealtimeDatabase under the specified project name.
 
@@ -363,6 +993,10 @@ class ProjectManager(object):
             The assembly in which the project is based off of: Used for part visulization.
         project_name : str
             The name of the project under which the data is stored.
+        mirror : :class:`compas_xr.realtime_database.DatabaseMirror`, optional
+            The mirror of the project state to read from instead of downloading it, see :meth:`mirror_project_state`.
+        tracker : :class:`compas_xr.project.ProjectStateTracker`, optional
+            The tracker holding the previous state, which then only processes the changed steps, see :meth:`track_project_state`.
 
         Returns
         -------
@@ -380,8 +1014,9 @@ class ProjectManager(object):
             The parts that have not been built by a robot.
 
         """
-        buiding_plan_data_reference_list = [project_name, "building_plan", "data"]
-        current_state_data = self.database.get_data_from_deep_reference(buiding_plan_data_reference_list)
+        if tracker:
+            return self._update_tracker(tracker, project_name, mirror)
+        current_state_data = self._get_building_plan_data(project_name, mirror)
         nodes = assembly.graph.__data__["node"]
 
         built_human = []
@@ -0,0 +1,154 @@
+import json
+
+from compas.data import DataDecoder
+
+from compas_xr.realtime_database.database_view import as_dict
+
+NORMALIZED_SCHEMA = "normalized"
+TIMBER_ASSEMBLY_DTYPE = "compas_timber.assembly/TimberAssembly"
+ASSEMBLY_DTYPE = "compas.datastructures/Assembly"
+
+
+class _DatabaseDecoder(DataDecoder):
+    """
+    Decodes COMPAS objects whose None values were dropped by the Realtime Database, by restoring the missing keys as None.
+    """
+
+    def object_hook(self, o):
+        if "dtype" not in o:
+            return o
+        o["data"] = dict(o.get("data") or {})
+        while True:
+            try:
+                return super(_DatabaseDecoder, self).object_hook(o)
+            except KeyError as e:
+                key = e.args[0] if e.args else None
+                if key is None or key in o["data"]:
+                    raise
+                o["data"][key] = None
+
+
+def _decode(data):
+    return json.loads(json.dumps(data), cls=_DatabaseDecoder)
+
+
+def normalized_assembly_data(assembly):
+    """
+    Returns the data of an assembly whose graph nodes refer to their parts by key, instead of holding them.
+
+    The parts are stored once, next to the assembly (ex: under "beams" and "joints" of the project).
+    The graph edges are listed as ``[u, v]`` or ``[u, v, attributes]`` items, because the Realtime Database drops the
+    empty attribute dicts, and with them the edges, of the ``{u: {v: attributes}}`` layout of COMPAS graphs.
+
+    Parameters
+    ----------
+    assembly : :class:`compas.datastructures.Assembly` or :class:`compas_timber.assembly.TimberAssembly`
+        The assembly to normalize.
+
+    Returns
+    -------
+    dict
+        The normalized data of the assembly.
+
+    """
+    graph = assembly.graph
+    nodes = {}
+    for key, attr in graph.nodes(data=True):
+        attr = dict(attr)
+        if "part" in attr:
+            attr["part"] = attr["part"].key
+        nodes[key] = attr
+    edges = []
+    for (u, v), attr in graph.edges(data=True):
+        edges.append([u, v, attr] if attr else [u, v])
+    return {
+        "dtype": assembly.__dtype__,
+        "graph": {
+            "attributes": graph.attributes,
+            "default_node_attributes": graph.default_node_attributes,
+            "default_edge_attributes": graph.default_edge_attributes,
+            "node": nodes,
+            "edges": edges,
+            "max_node": graph._max_node,
+        },
+        "attributes": assembly.attributes,
+    }
+
+
+def _graph_data(graph_data, parts):
+    nodes = {}
+    for key, attr in as_dict(graph_data.get("node")).items():
+        attr = dict(attr)
+        part = attr.get("part")
+        if part is not None and not isinstance(part, dict):
+            attr["part"] = parts[str(part)]
+        nodes[key] = attr
+
+    edges = dict((key, {}) for key in nodes)
+    for u, neighbors in as_dict(graph_data.get("edge")).items():
+        for v, attr in as_dict(neighbors).items():
+            edges[u][v] = attr or {}
+    for edge in graph_data.get("edges") or []:
+        edges[str(edge[0])][str(edge[1])] = edge[2] if len(edge) > 2 else {}
+
+    return {
+        "attributes": graph_data.get("attributes") or {},
+        "default_node_attributes": graph_data.get("default_node_attributes") or {},
+        "default_edge_attributes": graph_data.get("default_edge_attributes") or {},
+        "node": nodes,
+        "edge": edges,
+        "max_node": graph_data.get("max_node", -1),
+    }
+
+
+def _assembly_from_data(assembly_data, dtype, parts=None):
+    data = {"graph": _graph_data(assembly_data.get("graph") or {}, parts or {}), "attributes": assembly_data.get("attributes") or {}}
+    # Decoding the JSON decodes the parts and the assembly with their COMPAS classes
+    return _decode({"dtype": assembly_data.get("dtype") or dtype, "data": data})
+
+
+def project_objects_from_data(data):
+    """
+    Reconstructs the COMPAS objects of a project from its data in the Realtime Database.
+
+    Both the default and the normalized project schema are read, see :meth:`compas_xr.project.ProjectManager.create_project_data_from_compas`.
+    The beams, joints or parts are the instances held by the assembly.
+
+    Parameters
+    ----------
+    data : dict
+        The data of the project, as returned by :meth:`compas_xr.project.ProjectManager.get_project_data`.
+
+    Returns
+    -------
+    dict
+        The "QRFrames" and "assembly" assemblies, the "building_plan",
+        and the "beams" and "joints" of a timber assembly or the "parts" of an assembly, keyed by part key.
+
+    """
+    timbers = "beams" in data
+    parts = as_dict(data.get("beams"))
+    parts.update(as_dict(data.get("joints")))
+    parts.update(as_dict(data.get("parts")))
+
+    assembly = _assembly_from_data(data.get("assembly") or {}, TIMBER_ASSEMBLY_DTYPE if timbers else ASSEMBLY_DTYPE, parts)
+    objects = {
+        "QRFrames": _assembly_from_data(data.get("QRFrames") or {}, ASSEMBLY_DTYPE),
+        "assembly": assembly,
+        "building_plan": None,
+    }
+    if timbers:
+        objects["beams"] = dict((str(beam.key), beam) for beam in assembly.beams)
+        objects["joints"] = dict((str(joint.key), joint) for joint in assembly.joints)
+    else:
+        objects["parts"] = dict((str(part.key), part) for part in assembly.parts())
+
+    building_plan = data.get("building_plan")
+    if building_plan:
+        building_plan = dict(building_plan)
+        building_plan_data = dict(building_plan.get("data") or {})
+        steps = as_dict(building_plan_data.get("steps"))
+        building_plan_data["steps"] = [steps[key] for key in sorted(steps, key=lambda key: (0, int(key), "") if key.isdigit() else (1, 0, key))]
+        building_plan["data"] = building_plan_data
+        objects["building_plan"] = _decode(building_plan)
+    return objects
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import tempfile
+
+from compas_xr.realtime_database.database_view import as_dict
+
+
+def _pruned(value):
+    """
+    The Realtime Database does not store None and empty objects, pruning them keeps the snapshot equal to the stored tree.
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            item = _pruned(item)
+            if item is not None:
+                pruned[str(key)] = item
+        return pruned or None
+    if isinstance(value, list):
+        pruned = [_pruned(item) for item in value]
+        return pruned if any(item is not None for item in pruned) else None
+    return value
+
+
+def diff_trees(old, new, ignored_keys=("guid",)):
+    """
+    Computes the multi-path update that turns one JSON tree into another.
+
+    Objects (and lists, which the Realtime Database stores as objects with integer keys) are compared key by key,
+    any other changed value is replaced as a whole, and removed values are deleted with None.
+    The paths never overlap, so the updates can be sent as a single multi-path update.
+    Changes of ignored keys are only sent together with a changed parent (ex: the guids of COMPAS objects that are
+    recreated with the same data on every run).
+
+    Parameters
+    ----------
+    old : dict
+        The tree that is currently stored.
+    new : dict
+        The tree that should be stored.
+    ignored_keys : tuple of str, optional
+        The keys whose changes alone are not sent. Default is ``("guid",)``.
+
+    Returns
+    -------
+    dict of str, Any
+        The changed values, keyed by their path separated by "/".
+
+    """
+    updates = {}
+    _diff(as_dict(old), as_dict(new), [], updates, ignored_keys)
+    return updates
+
+
+def _diff(old, new, path, updates, ignored_keys):
+    for key in set(old) | set(new):
+        if key in ignored_keys and key in old and key in new:
+            continue
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value == new_value:
+            continue
+        if isinstance(old_value, (dict, list)) and isinstance(new_value, (dict, list)):
+            _diff(as_dict(old_value), as_dict(new_value), path + [key], updates, ignored_keys)
+        else:
+            updates["/".join(path + [key])] = new_value
+
+
+class ProjectSnapshot(object):
+    """
+    A ProjectSnapshot keeps a local copy of the data tree last published to a project of the Realtime Database.
+
+    The ProjectManager compares the tree to publish with the snapshot and sends only the changed paths,
+    so the size and duration of a publish scale with the change instead of with the project.
+    Snapshots are keyed by database and project name, so projects with the same name in different databases do not share a snapshot.
+
+    Parameters
+    ----------
+    project_name : str
+        The name of the project.
+    snapshot_directory : str, optional
+        The directory in which snapshots are kept. Defaults to a ``compas_xr_snapshots`` folder in the temp directory.
+    database_url : str, optional
+        The URL of the database the project is published to, see :func:`compas_xr.utilities.database_url_from_config`. Default is None.
+
+    Attributes
+    ----------
+    project_name : str
+        The name of the project.
+    database_url : str
+        The URL of the database the project is published to.
+    file_path : str
+        The path of the snapshot file.
+    """
+
+    def __init__(self, project_name, snapshot_directory=None, database_url=None):
+        snapshot_directory = snapshot_directory or os.path.join(tempfile.gettempdir(), "compas_xr_snapshots")
+        if not os.path.exists(snapshot_directory):
+            os.makedirs(snapshot_directory)
+        self.project_name = project_name
+        self.database_url = database_url
+        file_name = project_name
+        if database_url:
+            file_name = "{}_{}".format(project_name, hashlib.sha1(database_url.encode("utf-8")).hexdigest()[:16])
+        self.file_path = os.path.join(snapshot_directory, "{}.json".format(file_name))
+
+    @staticmethod
+    def tree_from_data(data):
+        """
+        Returns the JSON tree the Realtime Database stores for JSON data, without None and empty values.
+
+        Parameters
+        ----------
+        data : dict
+            The JSON data of the project.
+
+        Returns
+        -------
+        dict
+            The stored tree.
+
+        """
+        return _pruned(data) or {}
+
+    def load(self):
+        """
+        Reads the snapshot.
+
+        Returns
+        -------
+        dict or None
+            The tree last published to the project, or None if there is no snapshot.
+
+        """
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            with open(self.file_path) as snapshot_file:
+                return json.load(snapshot_file)
+        except ValueError:
+            return None
+
+    def save(self, tree):
+        """
+        Replaces the snapshot.
+
+        Parameters
+        ----------
+        tree : dict
+            The tree published to the project.
+
+        Returns
+        -------
+        None
+
+        """
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as snapshot_file:
+            json.dump(tree, snapshot_file)
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+        os.rename(temp_path, self.file_path)
+
+    def clear(self):
+        """
+        Removes the snapshot, the next publish uploads the whole project.
+
+        Returns
+        -------
+        None
+
+        """
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
@@ -0,0 +1,209 @@
+import bisect
+import threading
+
+from compas.geometry import Frame
+
+from compas_xr.realtime_database.database_view import as_dict
+
+
+class ProjectStateTracker(object):
+    """
+    A ProjectStateTracker keeps the visualization state of a project up to date one building plan step at a time.
+
+    The ProjectStateTracker class holds the location, actor, built state and part of every step, indexed by step key,
+    together with the built and unbuilt parts of both actors and the last built index.
+    A refresh only processes the steps that changed since the previous one, so following a large building plan
+    costs time proportional to the number of changed steps instead of the number of steps.
+    The changed steps are either found by comparing the downloaded building plan data with the previous one,
+    or reported by the :class:`compas_xr.realtime_database.DatabaseMirror` of the building plan through :meth:`on_change`.
+
+    Parameters
+    ----------
+    assembly : :class:`compas.datastructures.Assembly` or :class:`compas_timber.assembly.TimberAssembly`
+        The assembly in which the project is based off of: Used for part visulization.
+    timbers : bool, optional
+        Whether the assembly is a TimberAssembly, whose parts are visualized by their blanks. Default is False.
+    mirror : :class:`compas_xr.realtime_database.DatabaseMirror`, optional
+        The mirror of the building plan data to refresh from, its callback should be :meth:`on_change`. Default is None.
+
+    Attributes
+    ----------
+    assembly : :class:`compas.datastructures.Assembly` or :class:`compas_timber.assembly.TimberAssembly`
+        The assembly in which the project is based off of.
+    timbers : bool
+        Whether the parts are visualized by their blanks.
+    mirror : :class:`compas_xr.realtime_database.DatabaseMirror`
+        The mirror of the building plan data to refresh from.
+    last_built_index : str
+        The index of the last built part in the project.
+
+    Notes
+    -----
+    The lists returned by :meth:`update` and :meth:`refresh` are updated in place by later refreshes, they should be
+    copied to keep the state of a specific moment.
+    """
+
+    BUCKETS = ("locations", "built_human", "unbuilt_human", "built_robot", "unbuilt_robot")
+
+    def __init__(self, assembly, timbers=False, mirror=None):
+        self.assembly = assembly
+        self.timbers = timbers
+        self.mirror = mirror
+        self.last_built_index = None
+        self._nodes = assembly.graph.__data__["node"]
+        self._steps = {}
+        self._sort_keys = dict((bucket, []) for bucket in self.BUCKETS)
+        self._items = dict((bucket, []) for bucket in self.BUCKETS)
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._needs_full_update = True
+
+    @property
+    def state(self):
+        """
+        tuple : The last built index, step locations and built/unbuilt human/robot parts, as returned by :meth:`update`.
+        """
+        items = self._items
+        return (
+            self.last_built_index,
+            items["locations"],
+            items["built_human"],
+            items["unbuilt_human"],
+            items["built_robot"],
+            items["unbuilt_robot"],
+        )
+
+    @staticmethod
+    def _sort_key(step_key):
+        return (0, int(step_key), "") if step_key.isdigit() else (1, 0, step_key)
+
+    def on_change(self, changed_paths):
+        """
+        Records the steps changed in the mirror of the building plan data, to be applied by the next :meth:`refresh`.
+
+        Parameters
+        ----------
+        changed_paths : list of list of str
+            The changed paths relative to the building plan data, as reported by the mirror.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            for path in changed_paths:
+                if len(path) >= 2 and path[0] == "steps":
+                    self._pending.add(path[1])
+                elif not path or path[0] == "steps":
+                    self._needs_full_update = True
+
+    def refresh(self):
+        """
+        Applies the steps changed in the mirror since the previous refresh.
+
+        Returns
+        -------
+        tuple
+            The last built index, step locations and built/unbuilt human/robot parts, as returned by :meth:`update`.
+
+        """
+        if not self.mirror:
+            raise Exception("ProjectStateTracker has no mirror to refresh from!")
+        with self._lock:
+            full_update = self._needs_full_update
+            pending = self._pending
+            self._needs_full_update = False
+            self._pending = set()
+
+        if full_update:
+            building_plan_data = self.mirror.get_data()
+            if building_plan_data is None:
+                with self._lock:
+                    self._needs_full_update = True
+                raise Exception("No data received yet for the building plan")
+            return self.update(building_plan_data)
+
+        self.last_built_index = self.mirror.get_data(["LastBuiltIndex"])
+        for step_key in pending:
+            step = self.mirror.get_data(["steps", step_key])
+            self._apply_step(step_key, step["data"] if step else None)
+        return self.state
+
+    def update(self, building_plan_data, changed_step_keys=None):
+        """
+        Applies the building plan data retrieved from the database.
+
+        Parameters
+        ----------
+        building_plan_data : dict
+            The building plan data of the project, including its steps and last built index.
+        changed_step_keys : list of str, optional
+            The keys of the steps that changed since the previous update.
+            Default is None, in which case every step is compared with its previous data.
+
+        Returns
+        -------
+        last_built_index : str
+            The index of the last built part in the project.
+        step_locations : list of :class:`compas.geometry.Frame`
+            The locations of the building plan steps.
+        built_human : list of :class:`compas.datastructures.Part`
+            The parts that have been built by a human.
+        unbuilt_human : list of :class:`compas.datastructures.Part`
+            The parts that have not been built by a human.
+        built_robot : list of :class:`compas.datastructures.Part`
+            The parts that have been built by a robot.
+        unbuilt_robot : list of :class:`compas.datastructures.Part`
+            The parts that have not been built by a robot.
+
+        """
+        self.last_built_index = building_plan_data.get("LastBuiltIndex")
+        steps = as_dict(building_plan_data.get("steps"))
+        if changed_step_keys is None:
+            changed_step_keys = [key for key in steps if steps[key].get("data") != self._steps.get(key, (None,))[0]]
+            changed_step_keys.extend(key for key in self._steps if key not in steps)
+        for step_key in changed_step_keys:
+            step_key = str(step_key)
+            step = steps.get(step_key)
+            self._apply_step(step_key, step.get("data") if step else None)
+        return self.state
+
+    def _apply_step(self, step_key, step_data):
+        previous = self._steps.pop(step_key, None)
+        if previous:
+            self._remove("locations", step_key)
+            self._remove(previous[1], step_key)
+        if not step_data:
+            return
+
+        step_data = dict(step_data)
+        assembly_element_id = step_data["element_ids"][0]
+        if self.timbers:
+            part = self._nodes[assembly_element_id]["part"].blank
+            bucket = "human" if step_data.get("actor") == "HUMAN" else "robot"
+        else:
+            part = self._nodes[str(assembly_element_id)]["part"]
+            if step_data.get("actor") == "HUMAN":
+                bucket = "human"
+            elif step_data.get("actor") == "ROBOT":
+                bucket = "robot"
+            else:
+                raise Exception("Part actor is Unknown!")
+        bucket = ("built_" if step_data.get("is_built") else "unbuilt_") + bucket
+
+        self._steps[step_key] = (step_data, bucket)
+        self._insert("locations", step_key, Frame.__from_data__(step_data["location"]))
+        self._insert(bucket, step_key, part)
+
+    def _insert(self, bucket, step_key, item):
+        sort_key = self._sort_key(step_key)
+        index = bisect.bisect_left(self._sort_keys[bucket], sort_key)
+        self._sort_keys[bucket].insert(index, sort_key)
+        self._items[bucket].insert(index, item)
+
+    def _remove(self, bucket, step_key):
+        sort_key = self._sort_key(step_key)
+        index = bisect.bisect_left(self._sort_keys[bucket], sort_key)
+        del self._sort_keys[bucket][index]
+        del self._items[bucket][index]
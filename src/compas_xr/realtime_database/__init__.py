@@ -15,6 +15,14 @@ Classes
     :nosignatures:
 
     RealtimeDatabase
+    BatchUpdateReport
+    DatabaseMirror
+    DatabaseQuery
+    DatabaseView
+    LocalRealtimeDatabase
+    ReplicaDatabase
+    ReplicaSyncReport
+    WriteQueue
 
 """
 
@@ -25,4 +33,23 @@ if sys.platform == "cli":
 else:
     from compas_xr.realtime_database.realtime_database_pyrebase import RealtimeDatabase
 
-__all__ = ["RealtimeDatabase"]
+from compas_xr.realtime_database.batch_update import BatchUpdateReport
+from compas_xr.realtime_database.database_mirror import DatabaseMirror
+from compas_xr.realtime_database.database_query import DatabaseQuery
+from compas_xr.realtime_database.database_view import DatabaseView
+from compas_xr.realtime_database.realtime_database_local import LocalRealtimeDatabase
+from compas_xr.realtime_database.replica_database import ReplicaDatabase
+from compas_xr.realtime_database.replica_database import ReplicaSyncReport
+from compas_xr.realtime_database.write_queue import WriteQueue
+
+__all__ = [
+    "RealtimeDatabase",
+    "BatchUpdateReport",
+    "DatabaseMirror",
+    "DatabaseQuery",
+    "DatabaseView",
+    "LocalRealtimeDatabase",
+    "ReplicaDatabase",
+    "ReplicaSyncReport",
+    "WriteQueue",
+]
@@ -0,0 +1,100 @@
+import json
+
+from compas.data import json_dumps
+
+
+class BatchUpdateReport(object):
+    """
+    A BatchUpdateReport collects the outcome of a batched multi-path update.
+
+    Attributes
+    ----------
+    updated : list of str
+        The keys of the groups that were written, in completion order.
+    failed : dict of str, str
+        The error message of every group that could not be written, keyed by group key.
+    requests : int
+        The number of update requests that were sent.
+    elapsed : float
+        The wall time of the update in seconds.
+    """
+
+    def __init__(self):
+        self.updated = []
+        self.failed = {}
+        self.requests = 0
+        self.elapsed = 0.0
+
+    def __str__(self):
+        return "BatchUpdateReport, updated={}, failed={}, requests={}, seconds={:.2f}".format(len(self.updated), len(self.failed), self.requests, self.elapsed)
+
+    @property
+    def succeeded(self):
+        """
+        bool : True if every group was written.
+        """
+        return not self.failed
+
+
+def normalize_update_paths(updates):
+    """
+    Converts the paths of multi-path updates to strings separated by "/" without leading or trailing "/".
+
+    Parameters
+    ----------
+    updates : dict
+        The updates, keyed by their path as string or as list of names.
+
+    Returns
+    -------
+    dict of str, Any
+        The updates, keyed by their path as string.
+
+    """
+    path_updates = {}
+    for path, value in updates.items():
+        if not isinstance(path, str):
+            path = "/".join(str(name) for name in path)
+        path_updates[path.strip("/")] = value
+    return path_updates
+
+
+def chunk_grouped_updates(grouped_updates, max_request_size):
+    """
+    Splits groups of multi-path updates into chunks whose serialized size stays below a limit.
+
+    The paths of one group always end up in the same chunk, so every group is written atomically.
+    A group that is larger than the limit on its own is placed in a chunk of its own.
+
+    Parameters
+    ----------
+    grouped_updates : dict of str, dict
+        The updates of every group, keyed by group key. The updates are keyed by their path relative to a shared reference.
+    max_request_size : int
+        The maximum number of bytes of the serialized updates of one chunk.
+
+    Returns
+    -------
+    list of tuple(list of str, dict)
+        The group keys and the merged updates of every chunk.
+
+    """
+    chunks = []
+    keys = []
+    updates = {}
+    size = 2
+    for key in sorted(grouped_updates, key=str):
+        group = json.loads(json_dumps(grouped_updates[key]))
+        # Every path/value pair costs its key, value, colon, comma and a separating space
+        group_size = sum(len(json.dumps(path)) + len(json.dumps(value)) + 4 for path, value in group.items())
+        if keys and size + group_size > max_request_size:
+            chunks.append((keys, updates))
+            keys = []
+            updates = {}
+            size = 2
+        keys.append(key)
+        updates.update(group)
+        size += group_size
+    if keys:
+        chunks.append((keys, updates))
+    return chunks
@@ -0,0 +1,214 @@
+import copy
+import threading
+
+from compas_xr.realtime_database.database_view import as_dict
+
+
+class DatabaseMirror(object):
+    """
+    A DatabaseMirror keeps an in-memory copy of a Realtime Database location current.
+
+    The DatabaseMirror class subscribes to the location with
+    :meth:`compas_xr.realtime_database.RealtimeDatabase.stream_data_from_reference`
+    and applies every ``put`` and ``patch`` event to its copy, so reading the data does not need a request.
+    After every applied event the callback is called with the paths that changed, relative to the location.
+
+    Parameters
+    ----------
+    database : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The database to follow.
+    reference_list : list of str
+        The names in sequence order of the location to mirror (ex: ["project", "building_plan", "data"]).
+    callback : callable, optional
+        A function called as ``callback(changed_paths)`` after every applied event,
+        with the list of changed paths as lists of names. Default is None.
+
+    Attributes
+    ----------
+    reference_list : list of str
+        The names in sequence order of the mirrored location.
+    callback : callable
+        The function called with the changed paths after every applied event.
+    stream : :class:`compas_xr.utilities.EventStream`
+        The stream the mirror is following, None until the mirror is started.
+    """
+
+    def __init__(self, database, reference_list, callback=None):
+        self.database = database
+        self.reference_list = list(reference_list)
+        self.callback = callback
+        self.stream = None
+        self._data = None
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+
+    def start(self):
+        """
+        Subscribes to the mirrored location.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.DatabaseMirror`
+            The mirror itself.
+
+        """
+        if not self.stream:
+            self.stream = self.database.stream_data_from_deep_reference(self.apply_event, self.reference_list)
+        return self
+
+    def close(self):
+        """
+        Stops following the mirrored location. The last received data remains readable.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.stream:
+            self.stream.close()
+
+    def wait_until_synced(self, timeout=None):
+        """
+        Waits until the full data of the location was received once.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns
+        -------
+        bool
+            True if the data was received within the timeout.
+
+        """
+        return self._synced.wait(timeout)
+
+    def get_data(self, path=None):
+        """
+        Returns a copy of the mirrored data, or of the data at a path within it.
+
+        Parameters
+        ----------
+        path : list of str, optional
+            The names in sequence order of the path relative to the mirrored location. Default is the whole location.
+
+        Returns
+        -------
+        Any
+            A deep copy of the data, or None if there is no data at the path.
+
+        """
+        with self._lock:
+            return copy.deepcopy(self._get([str(name) for name in path or []]))
+
+    def apply_event(self, event_type, path, data):
+        """
+        Applies a ``put`` or ``patch`` event of the database stream to the mirrored data.
+
+        Parameters
+        ----------
+        event_type : str
+            The type of the event, "put" replaces the data at the path and "patch" updates its children.
+        path : str
+            The path of the event relative to the mirrored location (ex: "/steps/3/data").
+        data : Any
+            The data of the event. None deletes the data at the path.
+
+        Returns
+        -------
+        list of list of str
+            The changed paths.
+
+        """
+        names = [name for name in path.split("/") if name]
+        with self._lock:
+            if event_type == "put":
+                old = self._get(names)
+                self._set(names, data)
+                changed = list(self._diff(names, old, data))
+            elif event_type == "patch":
+                changed = []
+                for key, value in data.items():
+                    child_names = names + [name for name in key.split("/") if name]
+                    old = self._get(child_names)
+                    self._set(child_names, value)
+                    changed.extend(self._diff(child_names, old, value))
+            else:
+                raise Exception("Unknown database event type {}".format(event_type))
+        if not names and event_type == "put":
+            self._synced.set()
+        if changed and self.callback:
+            self.callback(changed)
+        return changed
+
+    @staticmethod
+    def _child(node, name):
+        if isinstance(node, dict):
+            return node.get(name)
+        # Firebase sends children with consecutive integer keys as a list
+        if isinstance(node, list) and name.isdigit() and int(name) < len(node):
+            return node[int(name)]
+        return None
+
+    @staticmethod
+    def _assign(node, name, value):
+        if isinstance(node, dict):
+            if value is None:
+                node.pop(name, None)
+            else:
+                node[name] = value
+            return
+        index = int(name)
+        if index >= len(node):
+            node.extend([None] * (index + 1 - len(node)))
+        node[index] = value
+
+    def _get(self, names):
+        node = self._data
+        for name in names:
+            node = self._child(node, name)
+            if node is None:
+                return None
+        return node
+
+    def _set(self, names, value):
+        if not names:
+            self._data = value
+            return
+        if not isinstance(self._data, (dict, list)):
+            self._data = {}
+        parent, parent_name, node = None, None, self._data
+        for index, name in enumerate(names):
+            if isinstance(node, list) and not name.isdigit():
+                # A list only holds integer keys, continue with the equivalent dict
+                node = as_dict(node)
+                if parent is None:
+                    self._data = node
+                else:
+                    self._assign(parent, parent_name, node)
+            if index == len(names) - 1:
+                break
+            child = self._child(node, name)
+            if not isinstance(child, (dict, list)):
+                child = {}
+                self._assign(node, name, child)
+            parent, parent_name, node = node, name, child
+        self._assign(node, names[-1], value)
+
+    def _diff(self, names, old, new):
+        """
+        Yields the deepest paths at which two versions of the data differ.
+        """
+        old_is_object = isinstance(old, (dict, list))
+        new_is_object = isinstance(new, (dict, list))
+        # A missing value differs from an object by the children of the object
+        if (old_is_object or new_is_object) and (old_is_object or old is None) and (new_is_object or new is None):
+            old = as_dict(old)
+            new = as_dict(new)
+            for key in set(old) | set(new):
+                for path in self._diff(names + [key], old.get(key), new.get(key)):
+                    yield path
+        elif old != new:
+            yield names
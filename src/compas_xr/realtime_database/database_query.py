@@ -0,0 +1,190 @@
+import json
+from collections import OrderedDict
+
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
+KEY = "$key"
+VALUE = "$value"
+
+
+def query_url(url, parameters):
+    """
+    Appends query parameters to the REST url of a database reference.
+
+    Parameters
+    ----------
+    url : str
+        The url, with or without query parameters.
+    parameters : dict of str, str
+        The parameters to append.
+
+    Returns
+    -------
+    str
+        The url with the parameters.
+
+    """
+    if not parameters:
+        return url
+    separator = "" if url.endswith(("?", "&")) else "&" if "?" in url else "?"
+    return url + separator + urlencode(sorted(parameters.items()))
+
+
+def _sort_value(value):
+    """
+    Ranks values in the order of Firebase queries: null, false, true, numbers, strings, objects.
+    """
+    if value is None:
+        return (0, 0)
+    if value is False:
+        return (1, 0)
+    if value is True:
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str) or type(value).__name__ == "unicode":
+        return (4, value)
+    return (5, 0)
+
+
+def _sort_key(key):
+    """
+    Ranks keys in the order of Firebase queries: keys that parse as 32-bit integers first, numerically, then strings.
+    """
+    try:
+        number = int(key)
+    except ValueError:
+        number = None
+    if number is not None and str(number) == key and -(2**31) <= number < 2**31:
+        return (0, number, "")
+    return (1, 0, key)
+
+
+def _child_value(value, path):
+    for name in path:
+        if isinstance(value, list):
+            value = value[int(name)] if name.isdigit() and int(name) < len(value) else None
+        elif isinstance(value, dict):
+            value = value.get(name)
+        else:
+            return None
+    return value
+
+
+class DatabaseQuery(object):
+    """
+    A DatabaseQuery selects the children of a Realtime Database location by key, by value or by the value of a nested child.
+
+    The query is sent to the database with :meth:`compas_xr.realtime_database.RealtimeDatabase.query_data_from_deep_reference`,
+    so only the matching children are downloaded. Queries ordered by a child need an ``.indexOn`` rule for the child
+    at the queried location in the database rules (ex: ``"steps": {".indexOn": ["data/priority", "data/is_built"]}``).
+    The same query can be evaluated locally on data with :meth:`evaluate`.
+
+    Parameters
+    ----------
+    order_by : str
+        The path of the nested child to order by separated by "/" (ex: "data/priority"),
+        or ``"$key"`` and ``"$value"`` to order by key or by value.
+    equal_to : Any, optional
+        Selects the children whose ordered value equals this value.
+    start_at : Any, optional
+        Selects the children whose ordered value is not smaller than this value.
+    end_at : Any, optional
+        Selects the children whose ordered value is not larger than this value.
+    limit_to_first : int, optional
+        Selects at most this number of the first matching children.
+    limit_to_last : int, optional
+        Selects at most this number of the last matching children.
+
+    Attributes
+    ----------
+    order_by : str
+        The path of the nested child the children are ordered by, or ``"$key"`` or ``"$value"``.
+    equal_to, start_at, end_at : Any
+        The filters of the ordered value, None if not set.
+    limit_to_first, limit_to_last : int
+        The limits of the number of children, None if not set.
+    """
+
+    def __init__(self, order_by, equal_to=None, start_at=None, end_at=None, limit_to_first=None, limit_to_last=None):
+        if equal_to is not None and (start_at is not None or end_at is not None):
+            raise Exception("equal_to cannot be combined with start_at or end_at")
+        if limit_to_first is not None and limit_to_last is not None:
+            raise Exception("limit_to_first cannot be combined with limit_to_last")
+        if order_by == KEY and any(value is not None and not isinstance(value, str) for value in (equal_to, start_at, end_at)):
+            raise Exception("Queries ordered by key can only be filtered by strings")
+        self.order_by = order_by.strip("/")
+        self.equal_to = equal_to
+        self.start_at = start_at
+        self.end_at = end_at
+        self.limit_to_first = limit_to_first
+        self.limit_to_last = limit_to_last
+
+    def __repr__(self):
+        parameters = ", ".join("{}={!r}".format(name, value) for name, value in sorted(self.parameters().items()))
+        return "DatabaseQuery({})".format(parameters)
+
+    def parameters(self):
+        """
+        Returns the query parameters of the REST API of the Realtime Database.
+
+        Returns
+        -------
+        dict of str, str
+            The JSON encoded parameters.
+
+        """
+        parameters = {"orderBy": json.dumps(self.order_by)}
+        for name, value in (("equalTo", self.equal_to), ("startAt", self.start_at), ("endAt", self.end_at)):
+            if value is not None:
+                parameters[name] = json.dumps(value)
+        for name, value in (("limitToFirst", self.limit_to_first), ("limitToLast", self.limit_to_last)):
+            if value is not None:
+                parameters[name] = str(int(value))
+        return parameters
+
+    def _ordered_value(self, key, value):
+        if self.order_by == KEY:
+            return key
+        if self.order_by == VALUE:
+            return value
+        return _child_value(value, self.order_by.split("/"))
+
+    def evaluate(self, data):
+        """
+        Evaluates the query on the data of a location, like the Realtime Database does.
+
+        Parameters
+        ----------
+        data : dict or list
+            The data of the queried location.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            The matching children, keyed by key, in query order.
+
+        """
+        if isinstance(data, list):
+            children = [(str(index), value) for index, value in enumerate(data) if value is not None]
+        elif isinstance(data, dict):
+            children = [(str(key), value) for key, value in data.items() if value is not None]
+        else:
+            children = []
+
+        sort_value = _sort_key if self.order_by == KEY else _sort_value
+        ordered = sorted(children, key=lambda child: (sort_value(self._ordered_value(*child)), _sort_key(child[0])))
+        if self.equal_to is not None:
+            ordered = [child for child in ordered if sort_value(self._ordered_value(*child)) == sort_value(self.equal_to)]
+        if self.start_at is not None:
+            ordered = [child for child in ordered if sort_value(self._ordered_value(*child)) >= sort_value(self.start_at)]
+        if self.end_at is not None:
+            ordered = [child for child in ordered if sort_value(self._ordered_value(*child)) <= sort_value(self.end_at)]
+        if self.limit_to_first is not None:
+            ordered = ordered[: self.limit_to_first]
+        if self.limit_to_last is not None:
+            ordered = ordered[len(ordered) - self.limit_to_last :] if self.limit_to_last else []
+        return OrderedDict(ordered)
@@ -0,0 +1,194 @@
+import copy
+
+_NOT_LOADED = object()
+
+
+class DatabaseView(object):
+    """
+    A DatabaseView reads the data of a Realtime Database location lazily, one subtree at a time.
+
+    The keys of the location are listed with a shallow query, which returns the keys of an object without the data
+    nested under them, and the values of its primitive children. Objects nested under the location are returned as
+    views themselves, so reading ``view["building_plan"]["LastBuiltIndex"]`` only downloads the keys of the project
+    and of the building plan instead of the whole project. Keys are also readable as attributes
+    (ex: ``view.building_plan.LastBuiltIndex``).
+    Everything read is kept, call :meth:`refresh` to read the location again.
+
+    Parameters
+    ----------
+    database : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The database to read from.
+    reference_list : list of str
+        The names in sequence order of the location to view (ex: ["project"]).
+
+    Attributes
+    ----------
+    reference_list : list of str
+        The names in sequence order of the viewed location.
+    """
+
+    def __init__(self, database, reference_list):
+        self.database = database
+        self.reference_list = [str(name) for name in reference_list]
+        # The keys of the location, mapped to True for objects and to their value for primitives
+        self._shallow = None
+        self._data = _NOT_LOADED
+        self._children = {}
+
+    def __repr__(self):
+        return "DatabaseView({!r})".format("/".join(self.reference_list))
+
+    def _keys(self):
+        if self._shallow is None:
+            if self._data is not _NOT_LOADED:
+                self._shallow = as_dict(self._data)
+            else:
+                shallow = self.database.get_shallow_data_from_deep_reference(self.reference_list)
+                if shallow is None:
+                    raise Exception("No data found at database path {}".format("/".join(self.reference_list)))
+                if not isinstance(shallow, (dict, list)):
+                    raise Exception("Database path {} holds a value, not an object".format("/".join(self.reference_list)))
+                self._shallow = as_dict(shallow)
+        return self._shallow
+
+    def _child(self, key, value):
+        if key in self._children:
+            return self._children[key]
+        if isinstance(value, (dict, list)):
+            # The full data of the location was loaded, the data of the child is part of it
+            child = DatabaseView(self.database, self.reference_list + [key])
+            child._data = value
+        elif value is True and self._data is _NOT_LOADED:
+            # Shallow queries truncate objects to True, which reads the same as a boolean value
+            shallow = self.database.get_shallow_data_from_deep_reference(self.reference_list + [key])
+            if not isinstance(shallow, (dict, list)):
+                return shallow
+            child = DatabaseView(self.database, self.reference_list + [key])
+            child._shallow = as_dict(shallow)
+        else:
+            return value
+        self._children[key] = child
+        return child
+
+    def __getitem__(self, key):
+        key = str(key)
+        keys = self._keys()
+        if key not in keys:
+            raise KeyError(key)
+        return self._child(key, keys[key])
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError("{!r} has no key {!r}".format(self, name))
+
+    def __contains__(self, key):
+        return str(key) in self._keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def keys(self):
+        """
+        Lists the keys of the viewed location.
+
+        Returns
+        -------
+        list of str
+            The keys.
+
+        """
+        return list(self._keys())
+
+    def items(self):
+        """
+        Lists the keys of the viewed location with their values, or views of their objects.
+
+        Returns
+        -------
+        list of tuple
+            The ``(key, value)`` pairs.
+
+        """
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key, default=None):
+        """
+        Reads the value of a key, or a view of its object.
+
+        Parameters
+        ----------
+        key : str
+            The key to read.
+        default : Any, optional
+            The value returned if the key does not exist. Default is None.
+
+        Returns
+        -------
+        Any
+            The primitive value, a :class:`DatabaseView` of the object, or the default.
+
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_data(self):
+        """
+        Reads the full data of the viewed location, with a single request.
+
+        Returns
+        -------
+        dict
+            The data of the location.
+
+        """
+        if self._data is _NOT_LOADED:
+            self._data = self.database.get_data_from_deep_reference(self.reference_list)
+            # The children are read from the loaded data from now on
+            self._shallow = None
+            self._children = {}
+        return copy.deepcopy(self._data)
+
+    def refresh(self):
+        """
+        Forgets everything read, the next read requests the data again.
+
+        Returns
+        -------
+        None
+
+        """
+        self._shallow = None
+        self._data = _NOT_LOADED
+        self._children = {}
+
+
+def as_dict(collection):
+    """
+    Returns the children of an object of the Realtime Database as a dict.
+
+    The Realtime Database returns objects with consecutive integer keys as lists, with None for the missing keys,
+    and returns None instead of empty objects.
+
+    Parameters
+    ----------
+    collection : dict or list or None
+        The object, as returned by the database.
+
+    Returns
+    -------
+    dict of str, Any
+        The children of the object, keyed by their key as a string.
+
+    """
+    if isinstance(collection, list):
+        return dict((str(index), value) for index, value in enumerate(collection) if value is not None)
+    return dict((str(key), value) for key, value in (collection or {}).items())
@@ -1,18 +1,15 @@
 import json
 import os
 import sys
-import threading
 
 import clr
 from compas.data import json_dumps
 
+from compas_xr.realtime_database.database_query import query_url
 from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
-
-try:
-    from urllib.request import urlopen
-except ImportError:
-    from urllib import urlopen
-
+from compas_xr.utilities import EventStream
+from compas_xr.utilities import HttpClient
+from compas_xr.utilities import TaskExecutor
 
 lib_dir = os.path.join(os.path.dirname(__file__), "..", "dependencies")
 if lib_dir not in sys.path:
@@ -78,16 +75,12 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
 
         return RealtimeDatabase._shared_database
 
-    def _start_async_call(self, fn, timeout=10):
+    def _start_async_call(self, task_factory, timeout=10):
         """
         Manages asynchronous calls to the RealtimeDatabase.
+        The task is awaited on the shared TaskExecutor, which raises an AsyncTimeoutError if it does not complete within the timeout.
         """
-        result = {}
-        result["event"] = threading.Event()
-        async_thread = threading.Thread(target=fn, args=(result,))
-        async_thread.start()
-        async_thread.join(timeout=timeout)
-        return result["data"]
+        return TaskExecutor.shared().run(task_factory, timeout=timeout)
 
     def _get_file_from_remote(self, url):
         """
@@ -95,7 +88,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         It also checks if the data is None or == null (firebase return if no data)
         """
         try:
-            file_content = urlopen(url).read()
+            file_content = HttpClient.shared().get(url).content
         except Exception as e:
             raise Exception("Unable to get file from url {}. Error={}".format(url, str(e)))
 
@@ -104,12 +97,11 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         else:
             raise Exception("unable to get file from url {}".format(url))
 
-    # TODO: Can this be configured to be a global callback for all methods where I pass the task and the result? This would simplify the code a lot.
-    def _task_callback(self, task, result):
-        task_awaiter = task.GetAwaiter()
-        task_awaiter.OnCompleted(lambda: result["event"].set())
-        result["event"].wait()
-        result["data"] = True
+    def _build_url(self, database_reference):
+        """
+        Builds the REST url of a database reference, requests to it are sent over the shared HttpClient.
+        """
+        return self._start_async_call(lambda: database_reference.BuildUrlAsync())
 
     def construct_reference(self, parentname):
         """
@@ -214,15 +206,8 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         None
         """
         self._ensure_database()
-
-        def _begin_delete(result):
-            deletetask = database_reference.DeleteAsync()
-            delete_data = deletetask.GetAwaiter()
-            delete_data.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = True
-
-        self._start_async_call(_begin_delete)
+        url = self._build_url(database_reference)
+        HttpClient.shared().delete(url)
 
     def get_data_from_reference(self, database_reference):
         """
@@ -240,15 +225,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
 
         """
         self._ensure_database()
-
-        def _begin_build_url(result):
-            urlbuldtask = database_reference.BuildUrlAsync()
-            task_url = urlbuldtask.GetAwaiter()
-            task_url.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = urlbuldtask.Result
-
-        url = self._start_async_call(_begin_build_url)
+        url = self._build_url(database_reference)
         json_data = self._get_file_from_remote(url)
 
         # TODO: json.load(data) vs. json_loads(data)
@@ -261,8 +238,99 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         data = json.loads(json_data)
         return data
 
+    def get_shallow_data_from_reference(self, database_reference):
+        """
+        Method for retrieving the keys of the data at a constructed database reference with a shallow query.
+
+        Parameters
+        ----------
+        database_reference: 'Firebase.Database.Query.ChildQuery'
+            Reference to the database location where the keys will be retreived from.
+
+        Returns
+        -------
+        Any
+            The keys of the object mapped to True or to their primitive value, the primitive value,
+            or None if there is no data.
+
+        """
+        self._ensure_database()
+        url = query_url(self._build_url(database_reference), {"shallow": "true"})
+        try:
+            json_data = HttpClient.shared().get(url).text
+        except Exception as e:
+            raise Exception("Unable to get keys from url {}. Error={}".format(url, str(e)))
+        return json.loads(json_data)
+
+    def query_data_from_reference(self, query, database_reference):
+        """
+        Method for retrieving the children matching a query from a constructed database reference.
+
+        Parameters
+        ----------
+        query : :class:`compas_xr.realtime_database.DatabaseQuery`
+            The query selecting the children.
+        database_reference: 'Firebase.Database.Query.ChildQuery'
+            Reference to the database location where the children will be retreived from.
+
+        Returns
+        -------
+        dict or list
+            The matching children, unordered.
+
+        """
+        self._ensure_database()
+        url = query_url(self._build_url(database_reference), query.parameters())
+        try:
+            json_data = HttpClient.shared().get(url).text
+        except Exception as e:
+            raise Exception("Unable to query url {}. Error={}".format(url, str(e)))
+        return json.loads(json_data) or {}
+
+    def update_data_in_reference(self, updates, database_reference):
+        """
+        Method for updating several paths under a constructed database reference in a single request.
+
+        Parameters
+        ----------
+        updates : dict of str, Any
+            The values to be written, keyed by their path relative to the database reference.
+            Values should be JSON serializable.
+        database_reference: 'Firebase.Database.Query.ChildQuery'
+            Reference to the database location the paths are relative to.
+
+        Returns
+        -------
+        None
+        """
+        self._ensure_database()
+        serialized_data = json_dumps(updates)
+        url = self._build_url(database_reference)
+        HttpClient.shared().patch(url, serialized_data)
+
     def stream_data_from_reference(self, callback, database_reference):
-        raise NotImplementedError("Function Under Developement")
+        """
+        Subscribes to the data at a constructed database reference.
+
+        The callback is first called with the full data at the reference as a "put" event at the path "/",
+        and then for every change, on a background thread. Dropped connections are reopened automatically.
+
+        Parameters
+        ----------
+        callback : callable
+            A function called as ``callback(event_type, path, data)`` for every "put" and "patch" event,
+            with the path of the changed data relative to the reference (ex: "/steps/3/data").
+        database_reference: 'Firebase.Database.Query.ChildQuery'
+            Reference to the database location to subscribe to.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.EventStream`
+            The open stream, call its ``close`` method to unsubscribe.
+        """
+        self._ensure_database()
+        url = self._build_url(database_reference)
+        return EventStream(url, callback).start()
 
     def upload_data_to_reference(self, data, database_reference):
         """
@@ -281,12 +349,5 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         """
         self._ensure_database()
         serialized_data = json_dumps(data)
-
-        def _begin_upload(result):
-            uploadtask = database_reference.PutAsync(serialized_data)
-            task_upload = uploadtask.GetAwaiter()
-            task_upload.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = True
-
-        self._start_async_call(_begin_upload)
+        url = self._build_url(database_reference)
+        HttpClient.shared().put(url, serialized_data)
@@ -1,5 +1,14 @@
 import json
 import os
+import time
+
+from compas_xr.realtime_database.batch_update import BatchUpdateReport
+from compas_xr.realtime_database.batch_update import chunk_grouped_updates
+from compas_xr.realtime_database.batch_update import normalize_update_paths
+from compas_xr.realtime_database.database_mirror import DatabaseMirror
+from compas_xr.realtime_database.database_view import DatabaseView
+from compas_xr.utilities import WorkerPool
+from compas_xr.utilities import wait_all
 
 
 class RealtimeDatabaseInterface(object):
@@ -25,9 +34,18 @@ class RealtimeDatabaseInterface(object):
     def upload_data_to_reference(self, data, database_reference):
         raise NotImplementedError("Implemented on child classes")
 
+    def update_data_in_reference(self, updates, database_reference):
+        raise NotImplementedError("Implemented on child classes")
+
     def get_data_from_reference(self, database_reference):
         raise NotImplementedError("Implemented on child classes")
 
+    def get_shallow_data_from_reference(self, database_reference):
+        raise NotImplementedError("Implemented on child classes")
+
+    def query_data_from_reference(self, query, database_reference):
+        raise NotImplementedError("Implemented on child classes")
+
     def delete_data_from_reference(self, database_reference):
         raise NotImplementedError("Implemented on child classes")
 
@@ -93,6 +111,75 @@ class RealtimeDatabaseInterface(object):
         database_reference = self.construct_reference_from_list(reference_list)
         self.upload_data_to_reference(data, database_reference)
 
+    def update_data_at_paths(self, updates, reference_list):
+        """
+        Updates several values under specified reference names in list order with a single multi-path update.
+
+        Only the given paths are written, all other data under the reference is left untouched,
+        and all paths are written atomically: either every value is applied or none of them is.
+
+        Parameters
+        ----------
+        updates : dict
+            The values to be written, keyed by their path relative to the reference.
+            Paths are either strings separated by "/" (ex: "steps/3/data/actor") or lists of names.
+            A value of None deletes the data at its path. Values need to be JSON serializable.
+        reference_list : list of str
+            The names in sequence order of the reference the paths are relative to.
+
+        Returns
+        -------
+        None
+
+        """
+        if not updates:
+            return
+        database_reference = self.construct_reference_from_list(reference_list)
+        self.update_data_in_reference(normalize_update_paths(updates), database_reference)
+
+    def update_data_at_paths_in_batches(self, grouped_updates, reference_list, max_request_size=1024 * 1024, max_workers=4):
+        """
+        Writes many groups of multi-path updates under specified reference names in list order with as few requests as possible.
+
+        The groups are merged into chunks that stay below the maximum request size, and the chunks are sent concurrently.
+        The paths of one group are always sent in the same request, so every group is either written completely or not at all.
+
+        Parameters
+        ----------
+        grouped_updates : dict of str, dict
+            The updates of every group, keyed by group key (ex: a building plan step key).
+            Every update is keyed by its path relative to the reference, as in :meth:`update_data_at_paths`.
+        reference_list : list of str
+            The names in sequence order of the reference the paths are relative to.
+        max_request_size : int, optional
+            The maximum number of bytes of the serialized updates of one request. Default is 1 MB.
+        max_workers : int, optional
+            The maximum number of concurrent requests. Default is 4.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.BatchUpdateReport`
+            The groups that were written, and the error of every group that was not.
+
+        """
+        report = BatchUpdateReport()
+        start = time.time()
+        path_groups = dict((key, normalize_update_paths(updates)) for key, updates in grouped_updates.items())
+        chunks = chunk_grouped_updates(path_groups, max_request_size)
+        report.requests = len(chunks)
+
+        with WorkerPool(max_workers=max_workers) as pool:
+            futures = [(keys, pool.submit(self.update_data_at_paths, updates, reference_list)) for keys, updates in chunks]
+            for keys, future in futures:
+                error = future.exception()
+                if error:
+                    for key in keys:
+                        report.failed[key] = str(error)
+                else:
+                    report.updated.extend(keys)
+        report.elapsed = time.time() - start
+        return report
+
     def upload_data_from_file(self, path_local, refernce_name):
         """
         Uploads data to the Firebase Realtime Database under specified reference name from a file.
@@ -173,6 +260,130 @@ class RealtimeDatabaseInterface(object):
         database_reference = self.construct_reference_from_list(reference_list)
         return self.get_data_from_reference(database_reference)
 
+    def get_shallow_data_from_deep_reference(self, reference_list):
+        """
+        Retrieves the data under specified reference names in list order with a shallow query.
+
+        A shallow query returns the value of a primitive, and the keys of an object mapped to True
+        without downloading the data nested under them.
+        Values of the object that are primitives are returned as they are.
+
+        Parameters
+        ----------
+        reference_list : list of str
+            The names in sequence order in which the data is nested.
+
+        Returns
+        -------
+        Any
+            The keys of the object mapped to True or to their primitive value, the primitive value,
+            or None if there is no data.
+
+        """
+        database_reference = self.construct_reference_from_list(reference_list)
+        return self.get_shallow_data_from_reference(database_reference)
+
+    def query_data_from_deep_reference(self, query, reference_list):
+        """
+        Retrieves the children matching a query under specified reference names in list order.
+
+        Only the matching children are downloaded, the query is evaluated by the database.
+
+        Parameters
+        ----------
+        query : :class:`compas_xr.realtime_database.DatabaseQuery`
+            The query selecting the children (ex: ``DatabaseQuery("data/priority", equal_to=2)``).
+        reference_list : list of str
+            The names in sequence order in which the queried data is nested.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            The matching children, keyed by key, in query order.
+
+        """
+        database_reference = self.construct_reference_from_list(reference_list)
+        # The database returns the matching children unordered, and as a list if their keys are consecutive integers
+        return query.evaluate(self.query_data_from_reference(query, database_reference))
+
+    def view_deep_reference(self, reference_list):
+        """
+        Creates a lazy view of the data under specified reference names in list order.
+
+        Parameters
+        ----------
+        reference_list : list of str
+            The names in sequence order in which the data is nested.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.DatabaseView`
+            The view, which only requests the data that is read.
+
+        """
+        return DatabaseView(self, reference_list)
+
+    def get_data_from_deep_references(self, reference_lists, max_workers=8):
+        """
+        Retreives data from the Firebase Realtime Database under several lists of reference names concurrently.
+
+        Parameters
+        ----------
+        reference_lists : list of list of str
+            The lists of names in sequence order in which each data is nested.
+        max_workers : int, optional
+            The maximum number of concurrent requests. Default is 8.
+
+        Returns
+        -------
+        list
+            The retrieved data, in the order of the reference lists.
+
+        """
+        with WorkerPool(max_workers=max_workers) as pool:
+            futures = [pool.submit(self.get_data_from_deep_reference, reference_list) for reference_list in reference_lists]
+            return wait_all(futures)
+
+    def stream_data_from_deep_reference(self, callback, reference_list):
+        """
+        Subscribes to the data in the Firebase Realtime Database under specified reference names in list order.
+
+        Parameters
+        ----------
+        callback : callable
+            A function called as ``callback(event_type, path, data)`` for every "put" and "patch" event,
+            with the path of the changed data relative to the reference (ex: "/steps/3/data").
+        reference_list : list of str
+            The names in sequence order in which the data is nested.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.EventStream`
+            The open stream, call its ``close`` method to unsubscribe.
+
+        """
+        database_reference = self.construct_reference_from_list(reference_list)
+        return self.stream_data_from_reference(callback, database_reference)
+
+    def mirror_deep_reference(self, reference_list, callback=None):
+        """
+        Keeps an in-memory copy of the data under specified reference names in list order current.
+
+        Parameters
+        ----------
+        reference_list : list of str
+            The names in sequence order in which the data is nested.
+        callback : callable, optional
+            A function called as ``callback(changed_paths)`` after every change of the data. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.DatabaseMirror`
+            The started mirror.
+
+        """
+        return DatabaseMirror(self, reference_list, callback=callback).start()
+
     def delete_data(self, reference_name):
         """
         Deletes data from the Firebase Realtime Database under specified reference name.
@@ -0,0 +1,481 @@
+import json
+import os
+import threading
+import time
+
+from compas.data import json_dumps
+
+from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
+from compas_xr.utilities import local_directory_from_config
+
+try:
+    import sqlite3
+except ImportError:
+    # IronPython has no sqlite3
+    sqlite3 = None
+
+INVALID_KEY_CHARACTERS = ".$#[]/"
+SERVER_TIMESTAMP = {".sv": "timestamp"}
+
+
+def _validate_key(key):
+    if not key or any(character in key for character in INVALID_KEY_CHARACTERS) or any(ord(character) < 32 for character in key):
+        raise Exception("Invalid database key {!r}, keys cannot be empty or contain . $ # [ ] / or control characters".format(key))
+
+
+def _leaves(value, path, leaves):
+    """
+    Flattens JSON data into its primitive values keyed by path, dropping None values and empty objects like Firebase does.
+    """
+    if value == SERVER_TIMESTAMP:
+        value = int(time.time() * 1000)
+    if isinstance(value, list):
+        value = dict((str(index), item) for index, item in enumerate(value))
+    if isinstance(value, dict):
+        for key, item in value.items():
+            key = str(key)
+            _validate_key(key)
+            _leaves(item, path + [key], leaves)
+    elif value is not None:
+        leaves.append(("/".join(path), json.dumps(value)))
+    return leaves
+
+
+def _as_array(node):
+    """
+    Returns objects the way Firebase does, as a list if all keys are integers and more than half of the indices are set.
+    """
+    if not node:
+        return node
+    indices = []
+    for key in node:
+        if not key.isdigit() or (len(key) > 1 and key[0] == "0"):
+            return node
+        indices.append(int(key))
+    length = max(indices) + 1
+    if len(indices) * 2 <= length:
+        return node
+    return [node.get(str(index)) for index in range(length)]
+
+
+def _tree(rows, prefix_length):
+    """
+    Rebuilds the JSON data of a location from the paths and values of its primitive values.
+    """
+    root = {}
+    for path, value in rows:
+        names = path[prefix_length:].split("/") if len(path) > prefix_length else []
+        if not names:
+            return json.loads(value)
+        node = root
+        for name in names[:-1]:
+            node = node.setdefault(name, {})
+        node[names[-1]] = json.loads(value)
+    return _arrays(root)
+
+
+def _arrays(node):
+    if isinstance(node, dict):
+        return _as_array(dict((key, _arrays(value)) for key, value in node.items()))
+    return node
+
+
+class _DatabaseFile(object):
+    """
+    The SQLite file of a LocalRealtimeDatabase, shared by all instances with the same file, and their subscriptions.
+
+    Every primitive value of the JSON tree is a row keyed by its path, so a location is read with a single range scan
+    over the paths starting with the location path followed by "/".
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS nodes (path TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.connection.commit()
+        self.lock = threading.RLock()
+        self.subscriptions = []
+
+    def _rows(self, path):
+        if not path:
+            return self.connection.execute("SELECT path, value FROM nodes ORDER BY path").fetchall()
+        # "/" sorts directly before "0", so the range holds all paths below the location
+        query = "SELECT path, value FROM nodes WHERE path = ? OR (path >= ? AND path < ?) ORDER BY path"
+        return self.connection.execute(query, (path, path + "/", path + "0")).fetchall()
+
+    def read(self, names):
+        path = "/".join(names)
+        with self.lock:
+            rows = self._rows(path)
+        if not rows:
+            return None
+        return _tree(rows, len(path) + 1 if path else 0)
+
+    def read_shallow(self, names):
+        path = "/".join(names)
+        prefix = path + "/" if path else ""
+        shallow = {}
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM nodes WHERE path = ?", (path,)).fetchone()
+            if row:
+                return json.loads(row[0])
+            # Seeks from child to child, skipping the paths below every child instead of reading them
+            query = "SELECT path, value FROM nodes WHERE path >= ? ORDER BY path LIMIT 1"
+            start = prefix
+            while True:
+                row = self.connection.execute(query, (start,)).fetchone()
+                if not row or not row[0].startswith(prefix):
+                    break
+                child = row[0][len(prefix) :].split("/")
+                if len(child) == 1:
+                    # Sibling keys may continue the key of a primitive child with characters sorting before "/" (ex: "a-b" after "a")
+                    shallow[child[0]] = json.loads(row[1])
+                    query = "SELECT path, value FROM nodes WHERE path > ? ORDER BY path LIMIT 1"
+                    start = row[0]
+                else:
+                    # "/" sorts directly before "0", so the paths below an object child all sort before the child followed by "0"
+                    shallow[child[0]] = True
+                    query = "SELECT path, value FROM nodes WHERE path >= ? ORDER BY path LIMIT 1"
+                    start = prefix + child[0] + "0"
+        return shallow or None
+
+    def write(self, writes):
+        """
+        Replaces the data at every path of the writes in a single transaction, and notifies the subscriptions.
+        """
+        paths = set("/".join(names) for names, _ in writes)
+        for names, _ in writes:
+            for index in range(len(names)):
+                if "/".join(names[:index]) in paths:
+                    raise Exception("Path {} is an ancestor of {} in the same update".format("/".join(names[:index]), "/".join(names)))
+
+        with self.lock:
+            with self.connection:
+                for names, value in writes:
+                    path = "/".join(names)
+                    leaves = _leaves(value, names, [])
+                    if path:
+                        self.connection.execute("DELETE FROM nodes WHERE path = ? OR (path >= ? AND path < ?)", (path, path + "/", path + "0"))
+                    else:
+                        self.connection.execute("DELETE FROM nodes")
+                    if leaves:
+                        # Writing below a primitive value replaces it with an object
+                        for index in range(len(names)):
+                            self.connection.execute("DELETE FROM nodes WHERE path = ?", ("/".join(names[:index]),))
+                        self.connection.executemany("INSERT INTO nodes (path, value) VALUES (?, ?)", leaves)
+            events = []
+            for callback, reference in list(self.subscriptions):
+                for names, value in writes:
+                    if names[: len(reference)] == reference:
+                        relative_path = "/" + "/".join(names[len(reference) :])
+                        events.append((callback, relative_path, self.read(names)))
+                    elif reference[: len(names)] == names:
+                        events.append((callback, "/", self.read(reference)))
+        for callback, relative_path, data in events:
+            callback("put", relative_path, data)
+
+
+class _LocalStream(object):
+    """
+    A subscription to a location of a LocalRealtimeDatabase, with the ``close`` method of :class:`compas_xr.utilities.EventStream`.
+    """
+
+    def __init__(self, database_file, callback, reference):
+        self.database_file = database_file
+        self.callback = callback
+        self.reference = reference
+        self.closed = False
+
+    def start(self):
+        with self.database_file.lock:
+            self.database_file.subscriptions.append((self.callback, self.reference))
+            data = self.database_file.read(self.reference)
+        self.callback("put", "/", data)
+        return self
+
+    def close(self):
+        with self.database_file.lock:
+            if (self.callback, self.reference) in self.database_file.subscriptions:
+                self.database_file.subscriptions.remove((self.callback, self.reference))
+        self.closed = True
+
+
+class LocalRealtimeDatabase(RealtimeDatabaseInterface):
+    """
+    A LocalRealtimeDatabase keeps the data of a RealtimeDatabase in a local SQLite file instead of the Firebase Realtime Database.
+
+    The data behaves like in Firebase: None values and empty objects are not stored, objects with integer keys are read as lists,
+    writes replace the data at their path, multi-path updates are atomic, ``{".sv": "timestamp"}`` values are written as the
+    current time in milliseconds, and subscriptions receive a "put" event for every change.
+    The file is ``database.sqlite`` in the local directory of the configuration, see :func:`compas_xr.utilities.local_directory_from_config`,
+    so a :class:`compas_xr.project.ProjectManager` can run without network access (ex: for tests and benchmarks).
+    It is used by the ProjectManager for configurations with ``"backend": "local"``, and needs sqlite3 (not available in IronPython).
+
+    Parameters
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+
+    Attributes
+    ----------
+    config_path : str
+        The path to the configuration JSON file, None for databases opened with :meth:`from_file`.
+    file_path : str
+        The path of the SQLite file.
+    _shared_files : dict, class attribute
+        The open SQLite files, keyed by path.
+    """
+
+    _shared_files = {}
+    _lock = threading.Lock()
+
+    def __init__(self, config_path):
+        if not os.path.exists(config_path):
+            raise Exception("Could not find config file at path {}!".format(config_path))
+        self.config_path = config_path
+        self._open(os.path.join(local_directory_from_config(config_path), "database.sqlite"))
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Opens a local database in a given SQLite file, instead of the one of a configuration.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the SQLite file, created if it does not exist.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.LocalRealtimeDatabase`
+            The database.
+
+        """
+        database = cls.__new__(cls)
+        database.config_path = None
+        database._open(file_path)
+        return database
+
+    def _open(self, file_path):
+        if not sqlite3:
+            raise Exception("The local database needs sqlite3!")
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.file_path = os.path.abspath(file_path)
+        with LocalRealtimeDatabase._lock:
+            if self.file_path not in LocalRealtimeDatabase._shared_files:
+                LocalRealtimeDatabase._shared_files[self.file_path] = _DatabaseFile(self.file_path)
+            self._file = LocalRealtimeDatabase._shared_files[self.file_path]
+
+    def construct_reference(self, parentname):
+        """
+        Constructs a database reference under the specified parent name.
+
+        Parameters
+        ----------
+        parentname : str
+            The name of the parent under which the reference will be constructed.
+
+        Returns
+        -------
+        list of str
+            The constructed database reference.
+
+        """
+        return self.construct_reference_from_list([parentname])
+
+    def construct_child_refrence(self, parentname, childname):
+        """
+        Constructs a database reference under the specified parent name & child name.
+
+        Parameters
+        ----------
+        parentname : str
+            The name of the parent under which the reference will be constructed.
+        childname : str
+            The name of the child under which the reference will be constructed.
+
+        Returns
+        -------
+        list of str
+            The constructed database reference.
+
+        """
+        return self.construct_reference_from_list([parentname, childname])
+
+    def construct_grandchild_refrence(self, parentname, childname, grandchildname):
+        """
+        Constructs a database reference under the specified parent name, child name, & grandchild name.
+
+        Parameters
+        ----------
+        parentname : str
+            The name of the parent under which the reference will be constructed.
+        childname : str
+            The name of the child under which the reference will be constructed.
+        grandchildname : str
+            The name of the grandchild under which the reference will be constructed.
+
+        Returns
+        -------
+        list of str
+            The constructed database reference.
+
+        """
+        return self.construct_reference_from_list([parentname, childname, grandchildname])
+
+    def construct_reference_from_list(self, reference_list):
+        """
+        Constructs a database reference under the specified refrences in list order.
+
+        Parameters
+        ----------
+        reference_list : list of str
+            The name of the parent under which the reference will be constructed.
+
+        Returns
+        -------
+        list of str
+            The constructed database reference.
+
+        """
+        reference = []
+        for name in reference_list:
+            # Like Firebase, names may contain "/" and empty path segments are ignored
+            for key in str(name).split("/"):
+                if key:
+                    _validate_key(key)
+                    reference.append(key)
+        return reference
+
+    def delete_data_from_reference(self, database_reference):
+        """
+        Method for deleting data from a constructed database reference.
+
+        Parameters
+        ----------
+        database_reference: list of str
+            Reference to the database location where the data will be deleted from.
+
+        Returns
+        -------
+        None
+        """
+        self._file.write([(database_reference, None)])
+
+    def get_data_from_reference(self, database_reference):
+        """
+        Method for retrieving data from a constructed database reference.
+
+        Parameters
+        ----------
+        database_reference: list of str
+            Reference to the database location where the data will be retreived from.
+
+        Returns
+        -------
+        dict
+            The retrieved data as a dictionary.
+
+        """
+        data = self._file.read(database_reference)
+        if data is None:
+            raise Exception("No data found at database path {}".format("/".join(database_reference)))
+        return data
+
+    def get_shallow_data_from_reference(self, database_reference):
+        """
+        Method for retrieving the keys of the data at a constructed database reference with a shallow query.
+
+        Parameters
+        ----------
+        database_reference: list of str
+            Reference to the database location where the keys will be retreived from.
+
+        Returns
+        -------
+        Any
+            The keys of the object mapped to True or to their primitive value, the primitive value,
+            or None if there is no data.
+
+        """
+        return self._file.read_shallow(database_reference)
+
+    def query_data_from_reference(self, query, database_reference):
+        """
+        Method for retrieving the children matching a query from a constructed database reference.
+
+        Parameters
+        ----------
+        query : :class:`compas_xr.realtime_database.DatabaseQuery`
+            The query selecting the children.
+        database_reference: list of str
+            Reference to the database location where the children will be retreived from.
+
+        Returns
+        -------
+        dict
+            The matching children.
+
+        """
+        return dict(query.evaluate(self._file.read(database_reference)))
+
+    def update_data_in_reference(self, updates, database_reference):
+        """
+        Method for updating several paths under a constructed database reference in a single request.
+
+        Parameters
+        ----------
+        updates : dict of str, Any
+            The values to be written, keyed by their path relative to the database reference.
+            Values should be JSON serializable.
+        database_reference: list of str
+            Reference to the database location the paths are relative to.
+
+        Returns
+        -------
+        None
+        """
+        updates = json.loads(json_dumps(updates))
+        writes = [(database_reference + self.construct_reference_from_list([path]), value) for path, value in updates.items()]
+        self._file.write(writes)
+
+    def stream_data_from_reference(self, callback, database_reference):
+        """
+        Subscribes to the data at a constructed database reference.
+
+        The callback is first called with the full data at the reference as a "put" event at the path "/",
+        and then with a "put" event for every change, on the thread that wrote the change.
+
+        Parameters
+        ----------
+        callback : callable
+            A function called as ``callback(event_type, path, data)`` for every event,
+            with the path of the changed data relative to the reference (ex: "/steps/3/data").
+        database_reference: list of str
+            Reference to the database location to subscribe to.
+
+        Returns
+        -------
+        object
+            The open stream, call its ``close`` method to unsubscribe.
+        """
+        return _LocalStream(self._file, callback, database_reference).start()
+
+    def upload_data_to_reference(self, data, database_reference):
+        """
+        Method for uploading data to a constructed database reference.
+
+        Parameters
+        ----------
+        data : Any
+            The data to be uploaded. Data should be JSON serializable.
+        database_reference: list of str
+            Reference to the database location where the data will be uploaded.
+
+        Returns
+        -------
+        None
+        """
+        self._file.write([(database_reference, json.loads(json_dumps(data)))])
@@ -4,11 +4,15 @@ from __future__ import print_function
 
 import json
 import os
+from copy import copy
 
 import pyrebase
 from compas.data import json_dumps
 
+from compas_xr.realtime_database.database_query import query_url
 from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
+from compas_xr.utilities import EventStream
+from compas_xr.utilities import HttpClient
 
 
 class RealtimeDatabase(RealtimeDatabaseInterface):
@@ -59,6 +63,28 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         if not RealtimeDatabase._shared_database:
             raise Exception("Could not initialize database!")
 
+    def _new_reference(self):
+        """
+        Returns a copy of the shared database with an empty path and query.
+        pyrebase keeps the reference path on the database object itself, so references built concurrently
+        from the shared database would overwrite each other's path.
+        """
+        self._ensure_database()
+        database_reference = copy(RealtimeDatabase._shared_database)
+        database_reference.path = ""
+        database_reference.build_query = {}
+        return database_reference
+
+    def _send(self, method, database_reference, data=None, parameters=None):
+        """
+        Sends a request for a database reference over the shared HttpClient and returns the response text.
+        """
+        url = query_url(database_reference.build_request_url(None), parameters)
+        headers = database_reference.build_headers()
+        # None is written as "null", which deletes the data at the reference
+        body = json.dumps(data) if method in ("PUT", "PATCH") else None
+        return HttpClient.shared().request(method, url, body=body, headers=headers).text
+
     def construct_reference(self, parentname):
         """
         Constructs a database reference under the specified parent name.
@@ -74,7 +100,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname)
+        return self._new_reference().child(parentname)
 
     def construct_child_refrence(self, parentname, childname):
         """
@@ -93,7 +119,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname).child(childname)
+        return self._new_reference().child(parentname).child(childname)
 
     def construct_grandchild_refrence(self, parentname, childname, grandchildname):
         """
@@ -114,7 +140,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname).child(childname).child(grandchildname)
+        return self._new_reference().child(parentname).child(childname).child(grandchildname)
 
     def construct_reference_from_list(self, reference_list):
         """
@@ -131,7 +157,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        reference = RealtimeDatabase._shared_database
+        reference = self._new_reference()
         for ref in reference_list:
             reference = reference.child(ref)
         return reference
@@ -150,7 +176,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         None
         """
         self._ensure_database()
-        database_reference.remove()
+        self._send("DELETE", database_reference)
 
     def get_data_from_reference(self, database_reference):
         """
@@ -168,13 +194,97 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
 
         """
         self._ensure_database()
-        database_directory = database_reference.get()
-        data = database_directory.val()
-        data_dict = dict(data)
-        return data_dict
+        path = database_reference.path
+        json_data = self._send("GET", database_reference)
+        if json_data == "null":
+            raise Exception("No data found at database path {}".format(path))
+        return json.loads(json_data)
+
+    def get_shallow_data_from_reference(self, database_reference):
+        """
+        Method for retrieving the keys of the data at a constructed database reference with a shallow query.
+
+        Parameters
+        ----------
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location where the keys will be retreived from.
+
+        Returns
+        -------
+        Any
+            The keys of the object mapped to True or to their primitive value, the primitive value,
+            or None if there is no data.
+
+        """
+        self._ensure_database()
+        json_data = self._send("GET", database_reference.shallow())
+        return json.loads(json_data)
+
+    def query_data_from_reference(self, query, database_reference):
+        """
+        Method for retrieving the children matching a query from a constructed database reference.
+
+        Parameters
+        ----------
+        query : :class:`compas_xr.realtime_database.DatabaseQuery`
+            The query selecting the children.
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location where the children will be retreived from.
+
+        Returns
+        -------
+        dict or list
+            The matching children, unordered.
+
+        """
+        self._ensure_database()
+        json_data = self._send("GET", database_reference, parameters=query.parameters())
+        return json.loads(json_data) or {}
+
+    def update_data_in_reference(self, updates, database_reference):
+        """
+        Method for updating several paths under a constructed database reference in a single request.
+
+        Parameters
+        ----------
+        updates : dict of str, Any
+            The values to be written, keyed by their path relative to the database reference.
+            Values should be JSON serializable.
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location the paths are relative to.
+
+        Returns
+        -------
+        None
+        """
+        self._ensure_database()
+        json_string = json_dumps(updates)
+        self._send("PATCH", database_reference, json.loads(json_string))
 
     def stream_data_from_reference(self, callback, database_reference):
-        raise NotImplementedError("Function Under Developement")
+        """
+        Subscribes to the data at a constructed database reference.
+
+        The callback is first called with the full data at the reference as a "put" event at the path "/",
+        and then for every change, on a background thread. Dropped connections are reopened automatically.
+
+        Parameters
+        ----------
+        callback : callable
+            A function called as ``callback(event_type, path, data)`` for every "put" and "patch" event,
+            with the path of the changed data relative to the reference (ex: "/steps/3/data").
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location to subscribe to.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.EventStream`
+            The open stream, call its ``close`` method to unsubscribe.
+        """
+        self._ensure_database()
+        url = database_reference.build_request_url(None)
+        headers = database_reference.build_headers()
+        return EventStream(url, callback, headers=headers).start()
 
     def upload_data_to_reference(self, data, database_reference):
         """
@@ -194,4 +304,4 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         self._ensure_database()
         # TODO: Check if this is stupid... it provides the functionality of making it work with compas objects and consistency across both child classes
         json_string = json_dumps(data)
-        database_reference.set(json.loads(json_string))
+        self._send("PUT", database_reference, json.loads(json_string))
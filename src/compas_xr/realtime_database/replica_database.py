@@ -0,0 +1,578 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+from compas_xr.realtime_database.database_mirror import DatabaseMirror
+from compas_xr.realtime_database.database_view import as_dict
+from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
+from compas_xr.realtime_database.realtime_database_local import SERVER_TIMESTAMP
+from compas_xr.realtime_database.realtime_database_local import LocalRealtimeDatabase
+
+BUILDING_PLAN_DATA_PATH = ["building_plan", "data"]
+STEPS_PATH = ["building_plan", "data", "steps"]
+SYNC_STEPS_PATH = ["sync", "steps"]
+CLOCKS_KEY = "ReplicaClocks"
+MIRROR_TIMEOUT = 30
+
+
+def _now():
+    return int(time.time() * 1000)
+
+
+class ReplicaSyncReport(object):
+    """
+    A ReplicaSyncReport collects the outcome of a synchronization of a ReplicaDatabase.
+
+    Attributes
+    ----------
+    pushed : list of str
+        The paths whose local data was written to the remote database.
+    pulled : list of str
+        The paths whose remote data was written to the replica.
+    discarded : list of str
+        The pending local paths that were dropped, because their step was changed later on the remote database.
+    error : str
+        The error that interrupted the synchronization (ex: no connection), None if it completed.
+    """
+
+    def __init__(self):
+        self.pushed = []
+        self.pulled = []
+        self.discarded = []
+        self.error = None
+
+    def __str__(self):
+        return "ReplicaSyncReport, pushed={}, pulled={}, discarded={}, error={}".format(len(self.pushed), len(self.pulled), len(self.discarded), self.error)
+
+    @property
+    def succeeded(self):
+        """
+        bool : True if the synchronization completed.
+        """
+        return self.error is None
+
+
+class ReplicaDatabase(RealtimeDatabaseInterface):
+    """
+    A ReplicaDatabase reads and writes the projects of a RealtimeDatabase in a local replica, and synchronizes them in the background.
+
+    Reads and writes only touch the replica, a :class:`compas_xr.realtime_database.LocalRealtimeDatabase` on disk,
+    so they take local disk time and keep working without connection. Written paths are kept as pending,
+    and :meth:`sync` pushes the current replica data of the pending paths to the remote database, and pulls the building plan
+    of the replicated projects. Repeated writes of a path are pushed once, with their latest data.
+    The building plans and step stamps are followed with a :class:`compas_xr.realtime_database.DatabaseMirror` per location,
+    so a synchronization only pulls the steps whose change events were received, instead of downloading the building plan again.
+
+    Conflicts are resolved per building plan step by last writer wins. The replica keeps a base copy of every step,
+    the remote step as it was last pulled or pushed, and a remote step that differs from its base copy was changed remotely.
+    Every push stamps the changed steps under ``<project>/sync/steps/<key>`` with the time of the local change, in server time,
+    and a pending local change of a step is discarded if the remote step was changed later. Writers that do not stamp their
+    changes (ex: the XR app marking a step as built) are dated when the replica receives their change event, so they win over the
+    local changes that were pending by then. Changes of other data are pushed as they are,
+    and other parts of a project than the building plan are pulled on first access, or with :meth:`pull_project`.
+
+    The building plans of the projects replicated with :meth:`replicate`, and of the replicated top level keys holding a building plan,
+    are pulled. Other top level keys (ex: ``ApplicationSettings``) are only pushed. A top level key that could not be pulled
+    on first access (ex: without connection) is pulled by the next synchronization. The clock offset is measured at
+    ``ReplicaClocks/<replica_id>``, which is deleted again right after.
+
+    The replica is stored with sqlite3, which IronPython does not provide, so the ReplicaDatabase is not available in Rhino and Grasshopper.
+
+    Parameters
+    ----------
+    remote : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The database to replicate.
+    replica_directory : str
+        The directory of the replica and of its pending paths.
+
+    Attributes
+    ----------
+    remote : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The replicated database.
+    local : :class:`compas_xr.realtime_database.LocalRealtimeDatabase`
+        The replica.
+    base : :class:`compas_xr.realtime_database.LocalRealtimeDatabase`
+        The base copies of the steps and of their stamps, as ``<project>/steps/<key>`` and ``<project>/stamps/<key>``.
+    replica_id : str
+        The identifier of the replica, used to measure the clock offset.
+    online : bool
+        Whether the last synchronization reached the remote database, None before the first synchronization.
+    clock_offset : int
+        The difference between the server clock and the local clock in milliseconds, measured when the connection is (re)established.
+    """
+
+    def __init__(self, remote, replica_directory):
+        if sys.platform == "cli":
+            raise Exception("The replica database needs sqlite3, which is not available in IronPython!")
+        if not os.path.exists(replica_directory):
+            os.makedirs(replica_directory)
+        self.remote = remote
+        self.local = LocalRealtimeDatabase.from_file(os.path.join(replica_directory, "replica.sqlite"))
+        self.base = LocalRealtimeDatabase.from_file(os.path.join(replica_directory, "base.sqlite"))
+        self.state_path = os.path.join(replica_directory, "replica_state.json")
+        self.replica_id = uuid.uuid4().hex
+        self.online = None
+        self.clock_offset = 0
+        self._pending = {}
+        self._projects = set()
+        self._replicated = set()
+        self._unreplicated = set()
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._mirrors = {}
+        self._changes = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._load_state()
+
+    @property
+    def pending(self):
+        """
+        dict of str, int : The local time in milliseconds of the last unsynchronized write of every pending path.
+        """
+        with self._lock:
+            return dict(self._pending)
+
+    @property
+    def projects(self):
+        """
+        list of str : The names of the replicated projects.
+        """
+        with self._lock:
+            return sorted(self._projects)
+
+    def _load_state(self):
+        if not os.path.exists(self.state_path):
+            return
+        with open(self.state_path) as state_file:
+            state = json.load(state_file)
+        self.replica_id = state.get("replica_id", self.replica_id)
+        self._pending = state.get("pending", {})
+        self._projects = set(state.get("projects", []))
+        self._replicated = set(state.get("replicated", self._projects))
+        self._unreplicated = set(state.get("unreplicated", []))
+        self.clock_offset = state.get("clock_offset", 0)
+
+    def _save_state(self):
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, "w") as state_file:
+            state = {
+                "replica_id": self.replica_id,
+                "pending": self._pending,
+                "projects": sorted(self._projects),
+                "replicated": sorted(self._replicated),
+                "unreplicated": sorted(self._unreplicated),
+                "clock_offset": self.clock_offset,
+            }
+            json.dump(state, state_file)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        os.rename(temp_path, self.state_path)
+
+    def _mark_pending(self, reference_lists):
+        """
+        Records written paths, a path below a pending path is pushed with it.
+        """
+        now = _now()
+        for names in reference_lists:
+            if not names:
+                raise Exception("The replica holds projects, data can only be written below a project")
+            self._add_if_project(names[0])
+            path = "/".join(names)
+            ancestors = ["/".join(names[:index]) for index in range(1, len(names))]
+            covering = [ancestor for ancestor in ancestors if ancestor in self._pending]
+            if covering:
+                self._pending[covering[0]] = now
+                continue
+            for pending_path in [pending_path for pending_path in self._pending if pending_path.startswith(path + "/")]:
+                del self._pending[pending_path]
+            self._pending[path] = now
+        self._save_state()
+
+    def _pending_below(self, names):
+        path = "/".join(names)
+        return [pending_path for pending_path in self._pending if pending_path == path or pending_path.startswith(path + "/")]
+
+    def _pending_above(self, names):
+        return any("/".join(names[:index]) in self._pending for index in range(1, len(names)))
+
+    def _local_data(self, names):
+        try:
+            return self.local.get_data_from_deep_reference(names)
+        except Exception:
+            return None
+
+    def _set_local_data(self, names, data):
+        if data is None:
+            self.local.delete_data_from_deep_reference(names)
+        else:
+            self.local.upload_data_to_deep_reference(data, names)
+
+    def _add_if_project(self, key):
+        if key not in self._projects and self.local.get_shallow_data_from_deep_reference([key, "building_plan"]) is not None:
+            self._projects.add(key)
+
+    def _ensure_replicated(self, database_reference):
+        if database_reference and database_reference[0] not in self._replicated:
+            self._replicate(database_reference[0])
+
+    def replicate(self, project_name):
+        """
+        Adds a project to the replica, pulls it if the replica does not hold it yet, and pulls its building plan on every synchronization.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.ReplicaSyncReport`
+            The outcome of the pull, with an error if the project could not be pulled.
+
+        """
+        with self._lock:
+            self._projects.add(project_name)
+        return self._replicate(project_name)
+
+    def _replicate(self, key):
+        report = ReplicaSyncReport()
+        try:
+            self._pull_unreplicated(key, report)
+        except Exception as e:
+            report.error = str(e)
+        return report
+
+    def _pull_unreplicated(self, key, report):
+        """
+        Pulls a top level key the replica does not hold yet, it is only marked as replicated once the pull succeeded.
+        """
+        if self.local.get_shallow_data_from_deep_reference([key]) is None:
+            try:
+                self.pull_project(key, report)
+            except Exception:
+                with self._lock:
+                    self._unreplicated.add(key)
+                    self._save_state()
+                raise
+        with self._lock:
+            self._unreplicated.discard(key)
+            self._replicated.add(key)
+            self._add_if_project(key)
+            self._save_state()
+
+    def pull_project(self, project_name, report=None):
+        """
+        Replaces the replica of a project with the remote project, keeping the data of pending paths.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project.
+        report : :class:`compas_xr.realtime_database.ReplicaSyncReport`, optional
+            The report the pulled paths are added to. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.ReplicaSyncReport`
+            The outcome of the pull.
+
+        """
+        report = report or ReplicaSyncReport()
+        remote_keys = self.remote.get_shallow_data_from_deep_reference([project_name]) or {}
+        data = self.remote.get_data(project_name) if remote_keys else {}
+        steps = as_dict(as_dict(as_dict(data.get(STEPS_PATH[0])).get(STEPS_PATH[1])).get(STEPS_PATH[2]))
+        stamps = as_dict(as_dict(data.get(SYNC_STEPS_PATH[0])).get(SYNC_STEPS_PATH[1]))
+        with self._lock:
+            self._set_base_data([project_name], {"steps": steps, "stamps": stamps})
+            for key in set(as_dict(remote_keys)) | set(as_dict(self.local.get_shallow_data_from_deep_reference([project_name]))):
+                names = [project_name, key]
+                if self._pending_below(names) or self._pending_above(names):
+                    continue
+                self._set_local_data(names, data.get(key))
+                report.pulled.append("/".join(names))
+        return report
+
+    def _base_data(self, names):
+        try:
+            return self.base.get_data_from_deep_reference(names)
+        except Exception:
+            return None
+
+    def _set_base_data(self, names, data):
+        if data:
+            self.base.upload_data_to_deep_reference(data, names)
+        elif self.base.get_shallow_data_from_deep_reference(names) is not None:
+            self.base.delete_data_from_deep_reference(names)
+
+    def _set_base_step(self, project_name, key, step, stamp):
+        self._set_base_data([project_name, "steps", key], step)
+        self._set_base_data([project_name, "stamps", key], stamp)
+
+    def _remote_change_time(self, project_name, key, remote_step, stamp, received):
+        """
+        Returns the server time of the remote change of a step since its base copy, None if the step was not changed remotely.
+        """
+        base_step = self._base_data([project_name, "steps", key])
+        if remote_step == base_step:
+            return None
+        if stamp and stamp > (self._base_data([project_name, "stamps", key]) or 0):
+            return stamp
+        # The change was not stamped by its writer, it is dated when its event was received
+        return received + self.clock_offset
+
+    def _project_mirrors(self, project_name):
+        if project_name not in self._mirrors:
+            with self._lock:
+                # The first synchronization compares the whole building plan
+                self._changes[project_name] = None
+            plan = DatabaseMirror(self.remote, [project_name] + BUILDING_PLAN_DATA_PATH, lambda paths: self._on_remote_change(project_name, paths))
+            stamps = DatabaseMirror(self.remote, [project_name] + SYNC_STEPS_PATH, lambda paths: self._on_remote_change(project_name, [["steps"] + path for path in paths]))
+            self._mirrors[project_name] = (plan.start(), stamps.start())
+        return self._mirrors[project_name]
+
+    def _on_remote_change(self, project_name, paths):
+        """
+        Records the building plan keys and steps changed by an event of the mirrors, with the local time the event was received.
+        """
+        received = _now()
+        with self._lock:
+            changes = self._changes.get(project_name)
+            if changes is None:
+                return
+            for path in paths:
+                if not path or path == ["steps"]:
+                    self._changes[project_name] = None
+                    return
+                changes["/".join(path[:2]) if path[0] == "steps" else path[0]] = received
+
+    def _measure_clock(self):
+        # A location of its own, so the measurement does not end up in the data read by the apps
+        clock_path = [CLOCKS_KEY, self.replica_id]
+        start = _now()
+        self.remote.upload_data_to_deep_reference(SERVER_TIMESTAMP, clock_path)
+        server_time = self.remote.get_data_from_deep_reference(clock_path)
+        self.clock_offset = int(server_time - (start + _now()) // 2)
+        self.remote.delete_data_from_deep_reference(clock_path)
+
+    def _pull_building_plan(self, project_name, report):
+        plan_mirror, stamps_mirror = self._project_mirrors(project_name)
+        if not (plan_mirror.wait_until_synced(MIRROR_TIMEOUT) and stamps_mirror.wait_until_synced(MIRROR_TIMEOUT)):
+            raise Exception("The building plan of {} was not received from the remote database".format(project_name))
+
+        with self._lock:
+            plan_names = [project_name] + BUILDING_PLAN_DATA_PATH
+            if self._pending_above(plan_names) or "/".join(plan_names) in self._pending:
+                return
+            changes = self._changes[project_name]
+            if changes is None:
+                plan_data = as_dict(plan_mirror.get_data())
+                if not plan_data:
+                    return
+                received = _now()
+                local_plan_keys = as_dict(self.local.get_shallow_data_from_deep_reference(plan_names))
+                local_steps = as_dict(self.local.get_shallow_data_from_deep_reference([project_name] + STEPS_PATH))
+                changes = dict((key, received) for key in set(plan_data) | set(local_plan_keys) if key != "steps")
+                for key in set(as_dict(plan_data.get("steps"))) | set(local_steps):
+                    changes["steps/" + key] = received
+            self._changes[project_name] = {}
+
+            steps_names = [project_name] + STEPS_PATH
+            for change, received in sorted(changes.items()):
+                if not change.startswith("steps/"):
+                    names = plan_names + [change]
+                    if not self._pending_below(names):
+                        self._pull_value(names, plan_mirror.get_data([change]), report)
+                    continue
+                if "/".join(steps_names) in self._pending:
+                    continue
+                key = change.split("/")[1]
+                names = steps_names + [key]
+                remote_step = plan_mirror.get_data(["steps", key])
+                stamp = stamps_mirror.get_data([key])
+                pending_paths = self._pending_below(names)
+                remote_changed = self._remote_change_time(project_name, key, remote_step, stamp, received)
+                self._set_base_step(project_name, key, remote_step, stamp)
+                if pending_paths:
+                    # Last writer wins, the local change is compared in server time
+                    changed = max(self._pending[path] for path in pending_paths) + self.clock_offset
+                    if remote_changed is None or remote_changed <= changed:
+                        continue
+                    for path in pending_paths:
+                        del self._pending[path]
+                        report.discarded.append(path)
+                    self._save_state()
+                self._pull_value(names, remote_step, report)
+
+    def _pull_value(self, names, remote_data, report):
+        if self._local_data(names) != remote_data:
+            self._set_local_data(names, remote_data)
+            report.pulled.append("/".join(names))
+
+    def _push_project(self, project_name, report):
+        with self._lock:
+            entries = dict((path, changed) for path, changed in self._pending.items() if path.split("/")[0] == project_name)
+            values = dict((path, self._local_data(path.split("/"))) for path in entries)
+        if not entries:
+            return
+
+        updates = {}
+        stamps = {}
+        for path, changed in entries.items():
+            names = path.split("/")
+            if len(names) == 1:
+                if values[path] is None:
+                    self.remote.delete_data(project_name)
+                else:
+                    self.remote.upload_data(values[path], project_name)
+                continue
+            updates["/".join(names[1:])] = values[path]
+            if names[1:4] == STEPS_PATH and len(names) > 4:
+                stamp_path = "/".join(SYNC_STEPS_PATH + [names[4]])
+                stamps[stamp_path] = max(stamps.get(stamp_path, 0), changed + self.clock_offset)
+        for stamp_path, stamp in stamps.items():
+            if not any(stamp_path == path or stamp_path.startswith(path + "/") for path in updates):
+                updates[stamp_path] = stamp
+        if updates:
+            self.remote.update_data_at_paths(updates, [project_name])
+
+        with self._lock:
+            for stamp_path, stamp in stamps.items():
+                key = stamp_path.split("/")[-1]
+                self._set_base_step(project_name, key, self._local_data([project_name] + STEPS_PATH + [key]), stamp)
+            for path, changed in entries.items():
+                # Paths written again during the push stay pending
+                if self._pending.get(path) == changed:
+                    del self._pending[path]
+                report.pushed.append(path)
+            self._save_state()
+
+    def sync(self):
+        """
+        Pulls the top level keys that could not be replicated yet and the building plans of the replicated projects,
+        and pushes the pending paths of all top level keys.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.ReplicaSyncReport`
+            The outcome of the synchronization, with the error if the remote database could not be reached.
+
+        """
+        report = ReplicaSyncReport()
+        with self._sync_lock:
+            try:
+                with self._lock:
+                    unreplicated = sorted((self._unreplicated | self._projects) - self._replicated)
+                    keys = sorted(self._projects | set(unreplicated) | set(path.split("/")[0] for path in self._pending))
+                if keys and not self.online:
+                    self._measure_clock()
+                for key in unreplicated:
+                    self._pull_unreplicated(key, report)
+                projects = self.projects
+                for key in keys:
+                    if key in projects:
+                        self._pull_building_plan(key, report)
+                    self._push_project(key, report)
+                self.online = True
+            except Exception as e:
+                report.error = str(e)
+                self.online = False
+        return report
+
+    def start(self, interval=5.0, max_interval=60.0):
+        """
+        Synchronizes the replica in a background thread, immediately and then periodically.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The number of seconds between synchronizations. Default is 5.
+        max_interval : float, optional
+            The maximum number of seconds between retries while the remote database cannot be reached,
+            the interval is doubled after every failed synchronization. Default is 60.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.ReplicaDatabase`
+            The replica itself.
+
+        """
+        if self._thread:
+            return self
+
+        def run():
+            delay = 0
+            while not self._stop.wait(delay):
+                report = self.sync()
+                delay = interval if report.succeeded else min(max(delay, interval) * 2, max_interval)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def close(self):
+        """
+        Stops the background synchronization and the mirrors of the building plans.
+        Pending paths stay pending, and are pushed by the next synchronization.
+
+        Returns
+        -------
+        None
+
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for mirrors in self._mirrors.values():
+            for mirror in mirrors:
+                mirror.close()
+        self._mirrors = {}
+
+    def construct_reference(self, parentname):
+        return self.local.construct_reference(parentname)
+
+    def construct_child_refrence(self, parentname, childname):
+        return self.local.construct_child_refrence(parentname, childname)
+
+    def construct_grandchild_refrence(self, parentname, childname, grandchildname):
+        return self.local.construct_grandchild_refrence(parentname, childname, grandchildname)
+
+    def construct_reference_from_list(self, reference_list):
+        return self.local.construct_reference_from_list(reference_list)
+
+    def get_data_from_reference(self, database_reference):
+        self._ensure_replicated(database_reference)
+        return self.local.get_data_from_reference(database_reference)
+
+    def get_shallow_data_from_reference(self, database_reference):
+        self._ensure_replicated(database_reference)
+        return self.local.get_shallow_data_from_reference(database_reference)
+
+    def query_data_from_reference(self, query, database_reference):
+        self._ensure_replicated(database_reference)
+        return self.local.query_data_from_reference(query, database_reference)
+
+    def stream_data_from_reference(self, callback, database_reference):
+        self._ensure_replicated(database_reference)
+        return self.local.stream_data_from_reference(callback, database_reference)
+
+    def upload_data_to_reference(self, data, database_reference):
+        with self._lock:
+            self.local.upload_data_to_reference(data, database_reference)
+            self._mark_pending([database_reference])
+
+    def update_data_in_reference(self, updates, database_reference):
+        with self._lock:
+            self.local.update_data_in_reference(updates, database_reference)
+            self._mark_pending([database_reference + self.local.construct_reference_from_list([path]) for path in updates])
+
+    def delete_data_from_reference(self, database_reference):
+        with self._lock:
+            self.local.delete_data_from_reference(database_reference)
+            self._mark_pending([database_reference])
@@ -0,0 +1,315 @@
+import json
+import threading
+import time
+
+from compas.data import json_dumps
+
+from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
+
+
+def _set_in(data, names, value):
+    """
+    Returns JSON data with the value at a path below it replaced, like the Realtime Database applies a write below a location.
+    """
+    if not names:
+        return value
+    if isinstance(data, list):
+        data = dict((str(index), item) for index, item in enumerate(data) if item is not None)
+    elif not isinstance(data, dict):
+        data = {}
+    data[names[0]] = _set_in(data.get(names[0]), names[1:], value)
+    if data[names[0]] is None:
+        del data[names[0]]
+    return data
+
+
+class WriteQueue(RealtimeDatabaseInterface):
+    """
+    A WriteQueue delays the writes to a RealtimeDatabase, and sends the writes of a time window as one multi-path update.
+
+    Writes to the same path within the window are coalesced, only the latest data of every path is sent,
+    and a write below a queued path is merged into the data of the queued path.
+    The queued writes are sent by a background thread when the window since the first queued write has passed,
+    with one multi-path update per top level key (ex: per project), or right away with :meth:`flush`.
+    Reads of a location with queued writes at, above or below it flush the queue first, so they always include the queued writes,
+    reads of other locations leave the queue as it is.
+    Batch updates flush the queue and are then sent right away, so their report only counts the groups that were written.
+
+    The number of queued paths is bounded: a write of a new path to a full queue flushes it, and waits until there is room.
+    Writes that could not be sent stay queued, are retried by the next flush, and the error is raised by :meth:`flush`.
+
+    Parameters
+    ----------
+    database : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The database the writes are sent to.
+    window : float, optional
+        The number of seconds writes are queued before they are sent. Default is 0.1.
+    max_size : int, optional
+        The maximum number of queued paths. Default is 1000.
+    timeout : float, optional
+        The maximum number of seconds a write waits for room in a full queue before raising an exception. Default is 30.
+
+    Attributes
+    ----------
+    database : :class:`compas_xr.realtime_database.RealtimeDatabase`
+        The database the writes are sent to.
+    window : float
+        The number of seconds writes are queued before they are sent.
+    max_size : int
+        The maximum number of queued paths.
+    timeout : float
+        The maximum number of seconds a write waits for room in a full queue.
+    writes : int
+        The number of queued writes.
+    requests : int
+        The number of requests that were sent to the database.
+    _shared_queues : dict of str, :class:`WriteQueue`, class attribute
+        The queues shared by the writers of the same database, keyed by the key given to :meth:`shared`.
+    """
+
+    _shared_queues = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, database, window=0.1, max_size=1000, timeout=30.0):
+        self.database = database
+        self.window = window
+        self.max_size = max_size
+        self.timeout = timeout
+        self.writes = 0
+        self.requests = 0
+        self._queue = {}
+        self._first_write = None
+        self._error = None
+        self._closed = False
+        self._flush_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @classmethod
+    def shared(cls, key, database, window=0.1):
+        """
+        Returns the queue shared by the writers of a database, creating it if needed.
+
+        Writers that are created again and again (ex: a ProjectManager per Grasshopper solution) share one queue and its background thread,
+        instead of starting a thread each. The queue keeps the database and the window it was created with, until it is closed.
+
+        Parameters
+        ----------
+        key : str
+            The key identifying the database (ex: the path of its configuration).
+        database : :class:`compas_xr.realtime_database.RealtimeDatabase`
+            The database the writes are sent to, if the queue is created.
+        window : float, optional
+            The number of seconds writes are queued before they are sent, if the queue is created. Default is 0.1.
+
+        Returns
+        -------
+        :class:`compas_xr.realtime_database.WriteQueue`
+            The shared queue.
+
+        """
+        with cls._shared_lock:
+            queue = cls._shared_queues.get(key)
+            if queue is None or queue._closed:
+                queue = cls._shared_queues[key] = cls(database, window=window)
+            return queue
+
+    def __len__(self):
+        with self._condition:
+            return len(self._queue)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._queue or self._error):
+                    # Failed writes are retried by the next write or flush, instead of in a loop
+                    self._condition.wait()
+                if self._closed:
+                    return
+                delay = self._first_write + self.window - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def _queued_ancestor(self, names):
+        for index in range(1, len(names)):
+            ancestor = "/".join(names[:index])
+            if ancestor in self._queue:
+                return ancestor
+        return None
+
+    def _enqueue(self, writes):
+        """
+        Queues the data of several paths, given as lists of names.
+        """
+        if not all(names for names, _ in writes):
+            raise Exception("Writes to the root of the database are not queued")
+        writes = [(names, json.loads(json_dumps(data)) if data is not None else None) for names, data in writes]
+        deadline = time.time() + self.timeout
+        with self._condition:
+            for names, data in writes:
+                path = "/".join(names)
+                if path not in self._queue and self._queued_ancestor(names) is None:
+                    self._wait_for_room(deadline)
+                ancestor = self._queued_ancestor(names)
+                if ancestor is not None:
+                    self._queue[ancestor] = _set_in(self._queue[ancestor], names[len(ancestor.split("/")) :], data)
+                else:
+                    for queued_path in [queued_path for queued_path in self._queue if queued_path.startswith(path + "/")]:
+                        del self._queue[queued_path]
+                    self._queue[path] = data
+                self.writes += 1
+            if self._first_write is None:
+                self._first_write = time.time()
+            self._error = None
+            self._condition.notify_all()
+
+    def _wait_for_room(self, deadline):
+        while len(self._queue) >= self.max_size:
+            # Backpressure, the full queue is sent right away and the writer waits for it
+            self._first_write = 0
+            self._error = None
+            self._condition.notify_all()
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise Exception("The write queue is full, {} paths were not sent within {} seconds".format(len(self._queue), self.timeout))
+            self._condition.wait(remaining)
+            if self._error is not None:
+                raise Exception("The write queue is full, and could not be sent: {}".format(self._error))
+
+    def flush(self):
+        """
+        Sends the queued writes, with one multi-path update per top level key.
+
+        Returns
+        -------
+        int
+            The number of paths that were sent.
+
+        """
+        with self._flush_lock:
+            with self._condition:
+                queue = self._queue
+                self._queue = {}
+                self._first_write = None
+            groups = {}
+            for path, data in queue.items():
+                names = path.split("/")
+                groups.setdefault(names[0], {})["/".join(names[1:])] = data
+            sent = 0
+            try:
+                for key in sorted(groups):
+                    updates = groups[key]
+                    if "" in updates:
+                        # A queued top level key holds all queued writes below it
+                        self._write_top_level(key, updates[""])
+                    else:
+                        self.database.update_data_at_paths(updates, [key])
+                    self.requests += 1
+                    sent += len(updates)
+                    for path in updates:
+                        queue.pop("/".join([key, path]) if path else key)
+            except Exception as e:
+                with self._condition:
+                    for path, data in queue.items():
+                        names = path.split("/")
+                        # Writes queued during the flush are newer than the unsent ones, and are applied on top of them
+                        if path in self._queue or self._queued_ancestor(names) is not None:
+                            continue
+                        for queued_path in sorted(queued_path for queued_path in self._queue if queued_path.startswith(path + "/")):
+                            data = _set_in(data, queued_path.split("/")[len(names) :], self._queue.pop(queued_path))
+                        self._queue[path] = data
+                    if self._queue and self._first_write is None:
+                        self._first_write = time.time()
+                    self._error = e
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._condition.notify_all()
+            return sent
+
+    def _write_top_level(self, key, data):
+        if data is None:
+            self.database.delete_data(key)
+        else:
+            self.database.upload_data(data, key)
+
+    def close(self):
+        """
+        Sends the queued writes and stops the background thread.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+
+    def construct_reference(self, parentname):
+        return self.construct_reference_from_list([parentname])
+
+    def construct_child_refrence(self, parentname, childname):
+        return self.construct_reference_from_list([parentname, childname])
+
+    def construct_grandchild_refrence(self, parentname, childname, grandchildname):
+        return self.construct_reference_from_list([parentname, childname, grandchildname])
+
+    def construct_reference_from_list(self, reference_list):
+        # References of the queue are lists of names, converted to references of the database when they are sent
+        return [name for path in reference_list for name in str(path).split("/") if name]
+
+    def _reference(self, database_reference):
+        return self.database.construct_reference_from_list(database_reference)
+
+    def _flush_for_read(self, database_reference):
+        """
+        Flushes the queue if it holds writes at, above or below the location that is read.
+        """
+        path = "/".join(database_reference)
+        with self._condition:
+            overlapping = [
+                queued_path for queued_path in self._queue if not path or queued_path == path or queued_path.startswith(path + "/") or path.startswith(queued_path + "/")
+            ]
+        if overlapping or self._error is not None:
+            self.flush()
+
+    def get_data_from_reference(self, database_reference):
+        self._flush_for_read(database_reference)
+        return self.database.get_data_from_reference(self._reference(database_reference))
+
+    def get_shallow_data_from_reference(self, database_reference):
+        self._flush_for_read(database_reference)
+        return self.database.get_shallow_data_from_reference(self._reference(database_reference))
+
+    def query_data_from_reference(self, query, database_reference):
+        self._flush_for_read(database_reference)
+        return self.database.query_data_from_reference(query, self._reference(database_reference))
+
+    def update_data_at_paths_in_batches(self, grouped_updates, reference_list, max_request_size=1024 * 1024, max_workers=4):
+        self.flush()
+        return self.database.update_data_at_paths_in_batches(grouped_updates, reference_list, max_request_size, max_workers)
+
+    def stream_data_from_reference(self, callback, database_reference):
+        self.flush()
+        return self.database.stream_data_from_reference(callback, self._reference(database_reference))
+
+    def upload_data_to_reference(self, data, database_reference):
+        self._enqueue([(database_reference, data)])
+
+    def update_data_in_reference(self, updates, database_reference):
+        self._enqueue([(database_reference + self.construct_reference_from_list([path]), data) for path, data in updates.items()])
+
+    def delete_data_from_reference(self, database_reference):
+        self._enqueue([(database_reference, None)])
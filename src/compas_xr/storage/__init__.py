@@ -15,6 +15,13 @@ Classes
     :nosignatures:
 
     Storage
+    LocalStorage
+    StorageCache
+    SyncManifest
+    SyncReport
+    UploadEngine
+    UploadError
+    UploadReport
 
 """
 
@@ -25,4 +32,12 @@ if sys.platform == "cli":
 else:
     from compas_xr.storage.storage_pyrebase import Storage
 
-__all__ = ["Storage"]
+from compas_xr.storage.storage_cache import StorageCache
+from compas_xr.storage.storage_local import LocalStorage
+from compas_xr.storage.sync_manifest import SyncManifest
+from compas_xr.storage.sync_manifest import SyncReport
+from compas_xr.storage.upload_engine import UploadEngine
+from compas_xr.storage.upload_engine import UploadError
+from compas_xr.storage.upload_engine import UploadReport
+
+__all__ = ["Storage", "LocalStorage", "StorageCache", "SyncManifest", "SyncReport", "UploadEngine", "UploadError", "UploadReport"]
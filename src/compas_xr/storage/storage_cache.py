@@ -0,0 +1,289 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from compas.data import json_loads
+
+try:
+    from urllib.parse import parse_qsl
+    from urllib.parse import urlencode
+    from urllib.parse import urlsplit
+except ImportError:
+    from urllib import urlencode
+
+    from urlparse import parse_qsl
+    from urlparse import urlsplit
+
+
+class StorageCache(object):
+    """
+    A StorageCache keeps downloaded storage files on disk, and the most recently read ones in memory.
+
+    Every read revalidates the cached file against the object metadata of the Firebase Storage,
+    so a warm read costs one small metadata request instead of a full download and deserialization.
+    Files are keyed by their storage path and identified by the object generation (falling back to its md5 hash),
+    and the least recently used files are evicted once the cache exceeds its size limit.
+    The access order is kept in memory and only written to the index when files are added or evicted, or with :meth:`close`,
+    so reads served from the cache do not write to disk.
+
+    Parameters
+    ----------
+    cache_directory : str, optional
+        The directory in which downloaded files are kept. Defaults to a ``compas_xr_storage_cache`` folder in the temp directory.
+    max_size : int, optional
+        The maximum number of bytes kept on disk. Default is 512 MB.
+    max_memory_items : int, optional
+        The maximum number of files kept in memory. Default is 16.
+    share_objects : bool, optional
+        Whether the deserialized objects are kept in memory and returned to every read, instead of a new object per read. Default is False.
+
+    Attributes
+    ----------
+    cache_directory : str
+        The directory in which downloaded files are kept.
+    max_size : int
+        The maximum number of bytes kept on disk.
+    max_memory_items : int
+        The maximum number of files kept in memory.
+    share_objects : bool
+        Whether the deserialized objects are kept in memory and returned to every read, instead of a new object per read.
+    hits : int
+        The number of reads that did not download the file.
+    misses : int
+        The number of reads that downloaded the file.
+
+    Notes
+    -----
+    Without ``share_objects``, the memory layer keeps the JSON text of the files, and every read deserializes a new object from it,
+    which saves reading the file but not deserializing it. With ``share_objects``, the memory layer keeps the deserialized objects,
+    so reads served from memory cost no deserialization, but they return the same object, which should be copied before being modified.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_directory=None, max_size=512 * 1024 * 1024, max_memory_items=16, share_objects=False):
+        self.cache_directory = cache_directory or os.path.join(tempfile.gettempdir(), "compas_xr_storage_cache")
+        self.max_size = max_size
+        self.max_memory_items = max_memory_items
+        self.share_objects = share_objects
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._index_changed = False
+        if not os.path.exists(self.cache_directory):
+            os.makedirs(self.cache_directory)
+        self._index = self._load_index()
+
+    @property
+    def size(self):
+        """
+        int : The number of bytes currently kept on disk.
+        """
+        return sum(entry["size"] for entry in self._index.values())
+
+    def _load_index(self):
+        index_path = os.path.join(self.cache_directory, self.INDEX_NAME)
+        if not os.path.exists(index_path):
+            return {}
+        try:
+            with open(index_path) as index_file:
+                index = json.load(index_file)
+        except ValueError:
+            return {}
+        # Drop entries whose file was removed outside of the cache
+        return dict((key, entry) for key, entry in index.items() if os.path.exists(self._file_path(entry["file"])))
+
+    def _save_index(self):
+        index_path = os.path.join(self.cache_directory, self.INDEX_NAME)
+        temp_path = index_path + ".tmp"
+        with open(temp_path, "w") as index_file:
+            json.dump(self._index, index_file)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        os.rename(temp_path, index_path)
+        self._index_changed = False
+
+    def _file_path(self, file_name):
+        return os.path.join(self.cache_directory, file_name)
+
+    @staticmethod
+    def split_url(url):
+        """
+        Splits a storage download url into its cache key and the url of the object metadata.
+
+        Parameters
+        ----------
+        url : str
+            The download url of the storage object.
+
+        Returns
+        -------
+        key : str
+            The storage path of the object, including the bucket.
+        metadata_url : str
+            The url returning the object metadata as JSON.
+
+        """
+        parts = urlsplit(url)
+        query = [(name, value) for name, value in parse_qsl(parts.query) if name != "alt"]
+        metadata_url = "{}://{}{}".format(parts.scheme, parts.netloc, parts.path)
+        if query:
+            metadata_url = "{}?{}".format(metadata_url, urlencode(query))
+        return parts.path, metadata_url
+
+    @staticmethod
+    def version_from_metadata(metadata):
+        """
+        Extracts the content version of a storage object from its metadata.
+
+        Parameters
+        ----------
+        metadata : dict
+            The object metadata returned by the Firebase Storage.
+
+        Returns
+        -------
+        str
+            The generation of the object, or its md5 hash if the generation is missing.
+
+        """
+        version = metadata.get("generation") or metadata.get("md5Hash") or metadata.get("etag") or metadata.get("updated")
+        if not version:
+            raise Exception("Storage metadata does not contain a version: {}".format(metadata))
+        return str(version)
+
+    def get_data(self, url, fetch):
+        """
+        Retrieves the deserialized data of a storage object, downloading it only if the cached version is outdated.
+
+        Parameters
+        ----------
+        url : str
+            The download url of the storage object.
+        fetch : callable
+            A function taking a url and returning the content at that url as string.
+
+        Returns
+        -------
+        data : dict or Compas Class Object
+            The deserialized data of the storage object.
+
+        """
+        key, metadata_url = self.split_url(url)
+        version = self.version_from_metadata(json.loads(fetch(metadata_url)))
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached and cached[0] == version:
+                self._memory.pop(key)
+                self._memory[key] = cached
+                self._touch(key)
+                self.hits += 1
+            else:
+                cached = None
+                content = self._read(key, version)
+        if cached:
+            return cached[1] if self.share_objects else json_loads(cached[1])
+
+        if content is None:
+            content = fetch(url)
+            with self._lock:
+                self.misses += 1
+                self._write(key, version, content)
+        else:
+            with self._lock:
+                self.hits += 1
+
+        text = content if isinstance(content, str) else content.decode("utf-8")
+        data = json_loads(text)
+        with self._lock:
+            self._memory.pop(key, None)
+            self._memory[key] = (version, data if self.share_objects else text)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+        return data
+
+    def _touch(self, key):
+        entry = self._index.get(key)
+        if entry:
+            entry["accessed"] = time.time()
+            self._index_changed = True
+
+    def _read(self, key, version):
+        entry = self._index.get(key)
+        if not entry or entry["version"] != version:
+            return None
+        file_path = self._file_path(entry["file"])
+        if not os.path.exists(file_path):
+            self._index.pop(key)
+            return None
+        with open(file_path, "rb") as cached_file:
+            content = cached_file.read()
+        entry["accessed"] = time.time()
+        self._index_changed = True
+        return content
+
+    def _write(self, key, version, content):
+        if not isinstance(content, bytes):
+            content = content.encode("utf-8")
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        with open(self._file_path(file_name), "wb") as cached_file:
+            cached_file.write(content)
+        self._index[key] = {"file": file_name, "version": version, "size": len(content), "accessed": time.time()}
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        total = self.size
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["accessed"]):
+            if total <= self.max_size:
+                break
+            self._remove(key)
+            total -= entry["size"]
+
+    def _remove(self, key):
+        entry = self._index.pop(key, None)
+        self._memory.pop(key, None)
+        if entry and os.path.exists(self._file_path(entry["file"])):
+            os.remove(self._file_path(entry["file"]))
+
+    def close(self):
+        """
+        Writes the access order of the cached files to the index, so the next instance evicts the least recently used files first.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if self._index_changed:
+                self._save_index()
+
+    def invalidate(self, url=None):
+        """
+        Removes a storage object, or every storage object, from the cache.
+
+        Parameters
+        ----------
+        url : str, optional
+            The download url of the storage object to remove. Removes everything if None.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if url is None:
+                keys = list(self._index) + list(self._memory)
+            else:
+                keys = [self.split_url(url)[0]]
+            for key in keys:
+                self._remove(key)
+            self._save_index()
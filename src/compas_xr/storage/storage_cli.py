@@ -1,7 +1,6 @@
 import json
 import os
 import sys
-import threading
 
 import clr
 from compas.data import json_dumps
@@ -11,11 +10,10 @@ from System.IO import MemoryStream
 from System.Text import Encoding
 
 from compas_xr.storage.storage_interface import StorageInterface
-
-try:
-    from urllib.request import urlopen
-except ImportError:
-    from urllib import urlopen
+from compas_xr.storage.storage_interface import content_in_range
+from compas_xr.storage.storage_interface import range_headers
+from compas_xr.utilities import HttpClient
+from compas_xr.utilities import TaskExecutor
 
 lib_dir = os.path.join(os.path.dirname(__file__), "..", "dependencies")
 if lib_dir not in sys.path:
@@ -39,19 +37,24 @@ class Storage(StorageInterface):
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache : :class:`compas_xr.storage.StorageCache`, optional
+        The cache used to avoid downloading unchanged files again. Default is None.
 
     Attributes
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache : :class:`compas_xr.storage.StorageCache`
+        The cache used to avoid downloading unchanged files again.
     _shared_storage : pyrebase.Storage, class attribute
         The shared pyrebase.Storage instance representing the connection to the Firebase Storage.
     """
 
     _shared_storage = None
 
-    def __init__(self, config_path):
+    def __init__(self, config_path, cache=None):
         self.config_path = config_path
+        self.cache = cache
         self.storage = self._ensure_storage()
 
     def _ensure_storage(self):
@@ -75,16 +78,12 @@ class Storage(StorageInterface):
 
         return Storage._shared_storage
 
-    def _start_async_call(self, fn, timeout=10):
+    def _start_async_call(self, task_factory, timeout=10):
         """
         Manages asynchronous calls to the Storage.
+        The task is awaited on the shared TaskExecutor, which raises an AsyncTimeoutError if it does not complete within the timeout.
         """
-        result = {}
-        result["event"] = threading.Event()
-        async_thread = threading.Thread(target=fn, args=(result,))
-        async_thread.start()
-        async_thread.join(timeout=timeout)
-        return result["data"]
+        return TaskExecutor.shared().run(task_factory, timeout=timeout)
 
     def _get_file_from_remote(self, url):
         """
@@ -92,7 +91,7 @@ class Storage(StorageInterface):
         It also checks if the data is None or == null (firebase return if no data)
         """
         try:
-            file_content = urlopen(url).read()
+            file_content = HttpClient.shared().get(url).content
         except Exception as e:
             raise Exception("Unable to get file from url {}. Error={}".format(url, str(e)))
 
@@ -102,13 +101,6 @@ class Storage(StorageInterface):
         else:
             raise Exception("unable to get file from url {}".format(url))
 
-    # TODO: Same as RTDB: Can I turn this into a gloabal call back that can be used inside of every method?
-    def _task_callback(task, result):
-        task_awaiter = task.GetAwaiter()
-        task_awaiter.OnCompleted(lambda: result["event"].set())
-        result["event"].wait()
-        result["data"] = True
-
     def construct_reference(self, cloud_file_name):
         """
         Constructs a storage reference for the specified cloud file name.
@@ -168,6 +160,7 @@ class Storage(StorageInterface):
     def get_data_from_reference(self, storage_refrence):
         """
         Retrieves data from the specified storage reference.
+        If the storage has a cache, the data is only downloaded if it changed since it was cached.
 
         Parameters
         ----------
@@ -182,18 +175,36 @@ class Storage(StorageInterface):
         """
         self._ensure_storage()
 
-        def _begin_download(result):
-            downloadurl_task = storage_refrence.GetDownloadUrlAsync()
-            task_download = downloadurl_task.GetAwaiter()
-            task_download.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = downloadurl_task.Result
-
-        url = self._start_async_call(_begin_download)
+        url = self._start_async_call(lambda: storage_refrence.GetDownloadUrlAsync())
+        if self.cache:
+            return self.cache.get_data(url, self._get_file_from_remote)
         data = self._get_file_from_remote(url)
         desearialized_data = json_loads(data)
         return desearialized_data
 
+    def get_bytes_from_reference(self, storage_reference, byte_range=None):
+        """
+        Retrieves the raw content of a file, or of a byte range of it, from the specified storage reference.
+        Byte ranges are requested with an HTTP Range header, so only the requested bytes are transferred.
+
+        Parameters
+        ----------
+        storage_reference : Firebase.Storage.FirebaseStorageReference
+            The storage reference pointing to the desired file.
+        byte_range : tuple of int, optional
+            The start and stop offset of the bytes to retrieve, like a slice. Default is None, which retrieves the whole file.
+
+        Returns
+        -------
+        bytes
+            The retrieved content.
+
+        """
+        self._ensure_storage()
+        url = self._start_async_call(lambda: storage_reference.GetDownloadUrlAsync())
+        response = HttpClient.shared().get(url, headers=range_headers(byte_range))
+        return content_in_range(response, byte_range)
+
     def upload_bytes_to_reference_from_local_file(self, file_path, storage_reference):
         """
         Uploads data from bytes to the specified storage reference from a local file.
@@ -216,14 +227,7 @@ class Storage(StorageInterface):
         byte_data = File.ReadAllBytes(file_path)
         stream = MemoryStream(byte_data)
 
-        def _begin_upload(result):
-            uploadtask = storage_reference.PutAsync(stream)
-            task_upload = uploadtask.GetAwaiter()
-            task_upload.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = True
-
-        self._start_async_call(_begin_upload)
+        self._start_async_call(lambda: storage_reference.PutAsync(stream))
 
     def upload_data_to_reference(self, data, storage_reference, pretty=True):
         """
@@ -248,11 +252,21 @@ class Storage(StorageInterface):
         byte_data = Encoding.UTF8.GetBytes(serialized_data)
         stream = MemoryStream(byte_data)
 
-        def _begin_upload(result):
-            uploadtask = storage_reference.PutAsync(stream)
-            task_upload = uploadtask.GetAwaiter()
-            task_upload.OnCompleted(lambda: result["event"].set())
-            result["event"].wait()
-            result["data"] = True
+        self._start_async_call(lambda: storage_reference.PutAsync(stream))
+
+    def delete_data_from_reference(self, storage_reference):
+        """
+        Deletes the file at the specified storage reference.
+
+        Parameters
+        ----------
+        storage_reference : Firebase.Storage.FirebaseStorageReference
+            The storage reference pointing to the file to be deleted.
+
+        Returns
+        ------
+        None
 
-        self._start_async_call(_begin_upload)
+        """
+        self._ensure_storage()
+        self._start_async_call(lambda: storage_reference.DeleteAsync())
@@ -4,6 +4,32 @@ from copy import deepcopy
 
 from compas.data import json_dump
 
+from compas_xr.storage.sync_manifest import SyncManifest
+from compas_xr.storage.sync_manifest import SyncReport
+from compas_xr.storage.upload_engine import UploadEngine
+from compas_xr.storage.upload_engine import UploadError
+
+
+def range_headers(byte_range=None):
+    """
+    Returns the HTTP headers requesting a byte range of a file, given as start and stop offset like a slice.
+    """
+    if not byte_range:
+        return None
+    start, stop = byte_range
+    if stop <= start:
+        raise Exception("Invalid byte range {}".format(byte_range))
+    return {"Range": "bytes={}-{}".format(start, stop - 1)}
+
+
+def content_in_range(response, byte_range=None):
+    """
+    Returns the requested byte range of a response, servers that ignore the Range header answer with the whole file.
+    """
+    if byte_range and response.status == 200:
+        return response.content[byte_range[0] : byte_range[1]]
+    return response.content
+
 
 class StorageInterface(object):
     """
@@ -31,6 +57,12 @@ class StorageInterface(object):
     def upload_bytes_to_reference_from_local_file(self, file_path, storage_reference):
         raise NotImplementedError("Implemented on child classes")
 
+    def get_bytes_from_reference(self, storage_reference, byte_range=None):
+        raise NotImplementedError("Implemented on child classes")
+
+    def delete_data_from_reference(self, storage_reference):
+        raise NotImplementedError("Implemented on child classes")
+
     def upload_data(self, data, cloud_file_name, pretty=True):
         """
         Uploads data to the Firebase Storage under specified cloud file name.
@@ -165,27 +197,129 @@ class StorageInterface(object):
         storage_reference = self.construct_reference_from_list(new_path_list)
         self.upload_bytes_to_reference_from_local_file(file_path, storage_reference)
 
-    def upload_files_as_bytes_from_directory_to_deep_reference(self, directory_path, cloud_path_list):
+    def upload_files_as_bytes_from_directory_to_deep_reference(self, directory_path, cloud_path_list, max_workers=8, journal_path=None, raise_on_error=True):
         """
         Uploads all files in specified directory as bytes to the Firebase Storage at specified cloud path in list order.
 
+        The files are uploaded concurrently by an :class:`compas_xr.storage.upload_engine.UploadEngine`.
+        Failed files do not stop the upload of the other files, they are listed in the report,
+        which is raised with an :class:`compas_xr.storage.upload_engine.UploadError` once all files were attempted.
+
         Parameters
         ----------
         directory_path : str
             The local path of the directory in which files are stored.
         cloud_path_list : list of str
             The list of reference names under which the file will be stored.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+        raise_on_error : bool, optional
+            Whether to raise an :class:`compas_xr.storage.upload_engine.UploadError` if some files were not uploaded,
+            instead of only listing them in the returned report. Default is True.
 
         Returns
         -------
-        None
+        :class:`compas_xr.storage.upload_engine.UploadReport`
+            The per-file outcome and the throughput of the upload.
 
         """
         if not os.path.exists(directory_path) or not os.path.isdir(directory_path):
             raise FileNotFoundError("Directory not found: {}".format(directory_path))
-        for file_name in os.listdir(directory_path):
+        file_paths = []
+        for file_name in sorted(os.listdir(directory_path)):
             file_path = os.path.join(directory_path, file_name)
-            self.upload_file_as_bytes_to_deep_reference(file_path, cloud_path_list)
+            if os.path.isfile(file_path):
+                file_paths.append(file_path)
+        engine = UploadEngine(self, max_workers=max_workers, journal_path=journal_path)
+        report = engine.upload_files(file_paths, cloud_path_list)
+        if raise_on_error and (report.failed or report.skipped):
+            raise UploadError(report)
+        return report
+
+    def sync_directory_to_deep_reference(self, directory_path, cloud_path_list, delete_orphans=False, max_workers=8, journal_path=None):
+        """
+        Synchronizes all files in specified directory to the Firebase Storage at specified cloud path in list order.
+
+        The content hashes of the local files are compared against the :class:`compas_xr.storage.SyncManifest`
+        stored next to the files, and only added or changed files are uploaded.
+        The manifest is updated afterwards, files that failed to upload keep their previous entry so they are retried on the next sync.
+
+        Parameters
+        ----------
+        directory_path : str
+            The local path of the directory in which files are stored.
+        cloud_path_list : list of str
+            The list of reference names under which the files are stored.
+        delete_orphans : bool, optional
+            Whether remote files that no longer exist locally should be deleted. Default is False.
+        max_workers : int, optional
+            The maximum number of concurrent uploads. Default is 8.
+        journal_path : str, optional
+            The path of a file to which the status of every finished upload is appended as a JSON line. Default is None.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.SyncReport`
+            The outcome of the synchronization.
+
+        """
+        if not os.path.exists(directory_path) or not os.path.isdir(directory_path):
+            raise FileNotFoundError("Directory not found: {}".format(directory_path))
+        cloud_path_list = list(cloud_path_list)
+        manifest_path_list = cloud_path_list + [SyncManifest.FILE_NAME]
+
+        local_manifest = SyncManifest.from_directory(directory_path)
+        try:
+            remote_manifest = SyncManifest.__from_data__(self.get_data_from_deep_reference(manifest_path_list))
+        except Exception:
+            # No manifest was published to this folder yet, so every local file is treated as added
+            remote_manifest = SyncManifest()
+        added, changed, unchanged, orphaned = local_manifest.diff(remote_manifest)
+
+        engine = UploadEngine(self, max_workers=max_workers, journal_path=journal_path)
+        file_paths = [os.path.join(directory_path, file_name) for file_name in added + changed]
+        report = SyncReport(engine.upload_files(file_paths, cloud_path_list), added, changed, unchanged)
+
+        files = dict(remote_manifest.files)
+        for file_path in report.upload.uploaded:
+            file_name = os.path.basename(file_path)
+            files[file_name] = local_manifest.files[file_name]
+
+        for file_name in orphaned:
+            if not delete_orphans:
+                report.orphaned.append(file_name)
+                continue
+            try:
+                self.delete_data_from_reference(self.construct_reference_from_list(cloud_path_list + [file_name]))
+            except Exception as e:
+                report.failed_deletes[file_name] = str(e)
+                report.orphaned.append(file_name)
+                continue
+            files.pop(file_name)
+            report.deleted.append(file_name)
+
+        if report.upload.uploaded or report.deleted or not remote_manifest.files:
+            self.upload_data_to_deep_reference(SyncManifest(files).__data__(), manifest_path_list, pretty=False)
+        return report
+
+    def delete_data_from_deep_reference(self, cloud_path_list):
+        """
+        Deletes a file from the Firebase Storage under specified reference names in list order.
+
+        Parameters
+        ----------
+        cloud_path_list : list of str
+            The list of reference names under which the file is stored.
+
+        Returns
+        -------
+        None
+
+        """
+        storage_reference = self.construct_reference_from_list(cloud_path_list)
+        self.delete_data_from_reference(storage_reference)
 
     # TODO: This works as it should, but I have a lot of problems with json_loads
     def get_data(self, cloud_file_name):
@@ -248,6 +382,26 @@ class StorageInterface(object):
         storage_reference = self.construct_reference_from_list(cloud_path_list)
         return self.get_data_from_reference(storage_reference)
 
+    def get_bytes_from_deep_reference(self, cloud_path_list, byte_range=None):
+        """
+        Retrieves the raw content of a file, or of a byte range of it, from the Firebase Storage for specified cloud path.
+
+        Parameters
+        ----------
+        cloud_path_list : list of str
+            The list of reference names under which the file is stored.
+        byte_range : tuple of int, optional
+            The start and stop offset of the bytes to retrieve, like a slice. Default is None, which retrieves the whole file.
+
+        Returns
+        -------
+        bytes
+            The retrieved content.
+
+        """
+        storage_reference = self.construct_reference_from_list(cloud_path_list)
+        return self.get_bytes_from_reference(storage_reference, byte_range)
+
     # TODO: This worked with Frame.__data__ but not with TimberAssembly.__data__
     def download_data_to_json(self, cloud_file_name, path_local, pretty=True):
         """
@@ -0,0 +1,239 @@
+import os
+import shutil
+
+from compas.data import json_dumps
+from compas.data import json_loads
+
+from compas_xr.storage.storage_interface import StorageInterface
+from compas_xr.utilities import local_directory_from_config
+
+
+class LocalStorage(StorageInterface):
+    """
+    A LocalStorage keeps the files of a Storage in a local directory instead of the Firebase Storage.
+
+    Storage paths map to files below the ``storage`` folder of the local directory of the configuration,
+    see :func:`compas_xr.utilities.local_directory_from_config`, so a :class:`compas_xr.project.ProjectManager` can run without network access
+    (ex: for tests and benchmarks). It is used by the ProjectManager for configurations with ``"backend": "local"``.
+
+    Parameters
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+    cache : :class:`compas_xr.storage.StorageCache`, optional
+        Unused, local files are always read directly. Default is None.
+
+    Attributes
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+    root : str
+        The directory holding the files.
+    """
+
+    def __init__(self, config_path, cache=None):
+        if not os.path.exists(config_path):
+            raise Exception("Path Does Not Exist: {}".format(config_path))
+        self.config_path = config_path
+        self.cache = cache
+        self.root = os.path.join(local_directory_from_config(config_path), "storage")
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+
+    def _file_path(self, storage_reference):
+        return os.path.join(self.root, *storage_reference)
+
+    def construct_reference(self, cloud_file_name):
+        """
+        Constructs a storage reference for the specified cloud file name.
+
+        Parameters
+        ----------
+        cloud_file_name : str
+            The name of the cloud file.
+
+        Returns
+        -------
+        list of str
+            The constructed storage reference.
+
+        """
+        return self.construct_reference_from_list([cloud_file_name])
+
+    def construct_reference_with_folder(self, cloud_folder_name, cloud_file_name):
+        """
+        Constructs a storage reference for the specified cloud folder name and file name.
+
+        Parameters
+        ----------
+        cloud_folder_name : str
+            The name of the cloud folder.
+        cloud_file_name : str
+            The name of the cloud file.
+
+        Returns
+        -------
+        list of str
+            The constructed storage reference.
+
+        """
+        return self.construct_reference_from_list([cloud_folder_name, cloud_file_name])
+
+    def construct_reference_from_list(self, cloud_path_list):
+        """
+        Constructs a storage reference for consecutive cloud folders in list order.
+
+        Parameters
+        ----------
+        cloud_path_list : list of str
+            The list of cloud path names.
+
+        Returns
+        -------
+        list of str
+            The constructed storage reference.
+
+        """
+        storage_reference = []
+        for path in cloud_path_list:
+            # Like Firebase Storage, names may contain "/" and empty path segments are ignored
+            for name in str(path).split("/"):
+                if name in (".", ".."):
+                    raise Exception("Invalid storage path {}".format("/".join(str(path) for path in cloud_path_list)))
+                if name:
+                    storage_reference.append(name)
+        if not storage_reference:
+            raise Exception("Invalid storage path {}".format("/".join(str(path) for path in cloud_path_list)))
+        return storage_reference
+
+    def _write(self, storage_reference, byte_data):
+        file_path = self._file_path(storage_reference)
+        directory = os.path.dirname(file_path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        # Readers never see partially written files
+        temp_path = file_path + ".tmp"
+        with open(temp_path, "wb") as storage_file:
+            storage_file.write(byte_data)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(temp_path, file_path)
+
+    def get_data_from_reference(self, storage_reference):
+        """
+        Retrieves data from the specified storage reference.
+
+        Parameters
+        ----------
+        storage_reference : list of str
+            The storage reference pointing to the desired data.
+
+        Returns
+        -------
+        data : dict or Compas Class Object
+            The deserialized data retrieved from the storage reference.
+
+        """
+        return json_loads(self.get_bytes_from_reference(storage_reference).decode("utf-8"))
+
+    def get_bytes_from_reference(self, storage_reference, byte_range=None):
+        """
+        Retrieves the raw content of a file, or of a byte range of it, from the specified storage reference.
+
+        Parameters
+        ----------
+        storage_reference : list of str
+            The storage reference pointing to the desired file.
+        byte_range : tuple of int, optional
+            The start and stop offset of the bytes to retrieve, like a slice. Default is None, which retrieves the whole file.
+
+        Returns
+        -------
+        bytes
+            The retrieved content.
+
+        """
+        file_path = self._file_path(storage_reference)
+        if not os.path.isfile(file_path):
+            raise Exception("unable to get file {}".format("/".join(storage_reference)))
+        with open(file_path, "rb") as storage_file:
+            if not byte_range:
+                return storage_file.read()
+            start, stop = byte_range
+            if stop <= start:
+                raise Exception("Invalid byte range {}".format(byte_range))
+            storage_file.seek(start)
+            return storage_file.read(stop - start)
+
+    def upload_bytes_to_reference_from_local_file(self, file_path, storage_reference):
+        """
+        Uploads data from bytes to the specified storage reference from a local file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the local file.
+        storage_reference : list of str
+            The storage reference to upload the byte data to.
+
+        Returns
+        ------
+        None
+
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError("File not found: {}".format(file_path))
+        target_path = self._file_path(storage_reference)
+        directory = os.path.dirname(target_path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = target_path + ".tmp"
+        shutil.copyfile(file_path, temp_path)
+        if os.path.exists(target_path):
+            os.remove(target_path)
+        os.rename(temp_path, target_path)
+
+    def upload_data_to_reference(self, data, storage_reference, pretty=True):
+        """
+        Uploads data to the specified storage reference.
+
+        Parameters
+        ----------
+        data : Any should be json serializable
+            The data to be uploaded.
+        storage_reference : list of str
+            The storage reference to upload the data to.
+        pretty : bool, optional
+            Whether to format the JSON data with indentation and line breaks (default is True).
+
+        Returns
+        ------
+        None
+
+        """
+        serialized_data = json_dumps(data, pretty=pretty)
+        self._write(storage_reference, serialized_data.encode("utf-8"))
+
+    def delete_data_from_reference(self, storage_reference):
+        """
+        Deletes the file at the specified storage reference.
+
+        Parameters
+        ----------
+        storage_reference : list of str
+            The storage reference pointing to the file to be deleted.
+
+        Returns
+        ------
+        None
+
+        """
+        file_path = self._file_path(storage_reference)
+        if not os.path.isfile(file_path):
+            raise Exception("unable to delete file {}".format("/".join(storage_reference)))
+        os.remove(file_path)
+        # Storage folders only exist as prefixes of files
+        directory = os.path.dirname(file_path)
+        while directory != self.root and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
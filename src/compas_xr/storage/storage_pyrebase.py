@@ -1,18 +1,22 @@
-import io
 import json
 import os
+from copy import copy
 
 import pyrebase
 from compas.data import json_dumps
 from compas.data import json_loads
 
 from compas_xr.storage.storage_interface import StorageInterface
+from compas_xr.storage.storage_interface import content_in_range
+from compas_xr.storage.storage_interface import range_headers
+from compas_xr.utilities import HttpClient
 
 try:
-    # from urllib.request import urlopen
-    from urllib.request import urlopen
+    from urllib.parse import quote
+    from urllib.parse import urlencode
 except ImportError:
-    from urllib import urlopen
+    from urllib import quote
+    from urllib import urlencode
 
 
 class Storage(StorageInterface):
@@ -26,19 +30,24 @@ class Storage(StorageInterface):
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache : :class:`compas_xr.storage.StorageCache`, optional
+        The cache used to avoid downloading unchanged files again. Default is None.
 
     Attributes
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache : :class:`compas_xr.storage.StorageCache`
+        The cache used to avoid downloading unchanged files again.
     _shared_storage : pyrebase.Storage, class attribute
         The shared pyrebase.Storage instance representing the connection to the Firebase Storage.
     """
 
     _shared_storage = None
 
-    def __init__(self, config_path):
+    def __init__(self, config_path, cache=None):
         self.config_path = config_path
+        self.cache = cache
         self._ensure_storage()
 
     def _ensure_storage(self):
@@ -60,13 +69,24 @@ class Storage(StorageInterface):
         if not Storage._shared_storage:
             raise Exception("Could not initialize storage!")
 
+    def _new_reference(self):
+        """
+        Returns a copy of the shared storage with an empty path.
+        pyrebase keeps the reference path on the storage object itself, so references built concurrently
+        from the shared storage would overwrite each other's path.
+        """
+        self._ensure_storage()
+        storage_reference = copy(Storage._shared_storage)
+        storage_reference.path = ""
+        return storage_reference
+
     def _get_file_from_remote(self, url):
         """
         This function is used to get the information form the source url and returns a string
         It also checks if the data is None or == null (firebase return if no data)
         """
         try:
-            file_content = urlopen(url).read().decode()
+            file_content = HttpClient.shared().get(url).text
         except Exception as e:
             raise Exception("Unable to get file from url {}. Error={}".format(url, str(e)))
 
@@ -76,6 +96,17 @@ class Storage(StorageInterface):
         else:
             raise Exception("unable to get file from url {}".format(url))
 
+    def _put_bytes(self, storage_reference, byte_data):
+        """
+        Uploads bytes to the storage reference over the shared HttpClient.
+        Uploads with service account credentials are left to pyrebase, which uses the google cloud storage client.
+        """
+        if storage_reference.credentials:
+            storage_reference.put(byte_data)
+            return
+        url = "{}/o?{}".format(storage_reference.storage_bucket, urlencode({"name": storage_reference.path}))
+        HttpClient.shared().post(url, byte_data)
+
     def construct_reference(self, cloud_file_name):
         """
         Constructs a storage reference for the specified cloud file name.
@@ -91,7 +122,7 @@ class Storage(StorageInterface):
             The constructed storage reference.
 
         """
-        return Storage._shared_storage.child(cloud_file_name)
+        return self._new_reference().child(cloud_file_name)
 
     def construct_reference_with_folder(self, cloud_folder_name, cloud_file_name):
         """
@@ -110,7 +141,7 @@ class Storage(StorageInterface):
             The constructed storage reference.
 
         """
-        return Storage._shared_storage.child(cloud_folder_name).child(cloud_file_name)
+        return self._new_reference().child(cloud_folder_name).child(cloud_file_name)
 
     def construct_reference_from_list(self, cloud_path_list):
         """
@@ -127,7 +158,7 @@ class Storage(StorageInterface):
             The constructed storage reference.
 
         """
-        storage_reference = Storage._shared_storage
+        storage_reference = self._new_reference()
         for path in cloud_path_list:
             storage_reference = storage_reference.child(path)
         return storage_reference
@@ -135,6 +166,7 @@ class Storage(StorageInterface):
     def get_data_from_reference(self, storage_reference):
         """
         Retrieves data from the specified storage reference.
+        If the storage has a cache, the data is only downloaded if it changed since it was cached.
 
         Parameters
         ----------
@@ -148,10 +180,34 @@ class Storage(StorageInterface):
 
         """
         url = storage_reference.get_url(token=None)
+        if self.cache:
+            return self.cache.get_data(url, self._get_file_from_remote)
         data = self._get_file_from_remote(url)
         deserialized_data = json_loads(data)
         return deserialized_data
 
+    def get_bytes_from_reference(self, storage_reference, byte_range=None):
+        """
+        Retrieves the raw content of a file, or of a byte range of it, from the specified storage reference.
+        Byte ranges are requested with an HTTP Range header, so only the requested bytes are transferred.
+
+        Parameters
+        ----------
+        storage_reference : pyrebase.pyrebase.Storage
+            The storage reference pointing to the desired file.
+        byte_range : tuple of int, optional
+            The start and stop offset of the bytes to retrieve, like a slice. Default is None, which retrieves the whole file.
+
+        Returns
+        -------
+        bytes
+            The retrieved content.
+
+        """
+        url = storage_reference.get_url(token=None)
+        response = HttpClient.shared().get(url, headers=range_headers(byte_range))
+        return content_in_range(response, byte_range)
+
     def upload_bytes_to_reference_from_local_file(self, file_path, storage_reference):
         """
         Uploads data from bytes to the specified storage reference from a local file.
@@ -172,7 +228,7 @@ class Storage(StorageInterface):
             raise FileNotFoundError("File not found: {}".format(file_path))
         with open(file_path, "rb") as file:
             byte_data = file.read()
-        storage_reference.put(byte_data)
+        self._put_bytes(storage_reference, byte_data)
 
     def upload_data_to_reference(self, data, storage_reference, pretty=True):
         """
@@ -193,5 +249,25 @@ class Storage(StorageInterface):
 
         """
         serialized_data = json_dumps(data, pretty=pretty)
-        file_object = io.BytesIO(serialized_data.encode())
-        storage_reference.put(file_object)
+        self._put_bytes(storage_reference, serialized_data.encode())
+
+    def delete_data_from_reference(self, storage_reference):
+        """
+        Deletes the file at the specified storage reference.
+
+        Parameters
+        ----------
+        storage_reference : pyrebase.pyrebase.Storage
+            The storage reference pointing to the file to be deleted.
+
+        Returns
+        ------
+        None
+
+        """
+        path = storage_reference.path
+        if storage_reference.credentials:
+            storage_reference.bucket.delete_blob(path)
+        else:
+            url = "{}/o/{}".format(storage_reference.storage_bucket, quote(path, safe=""))
+            HttpClient.shared().delete(url)
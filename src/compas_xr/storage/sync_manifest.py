@@ -0,0 +1,160 @@
+import hashlib
+import os
+
+
+class SyncManifest(object):
+    """
+    A SyncManifest records the content hash and size of every file in a synchronized storage folder.
+
+    The SyncManifest class is used to compare a local directory against the manifest stored next to the files
+    in the Firebase Storage, so that only added or changed files need to be uploaded.
+
+    Parameters
+    ----------
+    files : dict of str, dict, optional
+        The ``{"md5": str, "size": int}`` entry of every file, keyed by file name.
+
+    Attributes
+    ----------
+    files : dict of str, dict
+        The ``{"md5": str, "size": int}`` entry of every file, keyed by file name.
+    """
+
+    FILE_NAME = "manifest.json"
+
+    def __init__(self, files=None):
+        self.files = files or {}
+
+    def __data__(self):
+        return {"files": self.files}
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(dict(data.get("files") or {}))
+
+    @staticmethod
+    def hash_file(file_path, chunk_size=1 << 20):
+        """
+        Computes the md5 hex digest of a local file, reading it in chunks.
+
+        Parameters
+        ----------
+        file_path : str
+            The local path of the file.
+        chunk_size : int, optional
+            The number of bytes read at once. Default is 1 MB.
+
+        Returns
+        -------
+        str
+            The md5 hex digest of the file content.
+
+        """
+        md5 = hashlib.md5()
+        with open(file_path, "rb") as file:
+            chunk = file.read(chunk_size)
+            while chunk:
+                md5.update(chunk)
+                chunk = file.read(chunk_size)
+        return md5.hexdigest()
+
+    @classmethod
+    def from_directory(cls, directory_path):
+        """
+        Creates a manifest from all files in a local directory.
+
+        Parameters
+        ----------
+        directory_path : str
+            The local path of the directory in which files are stored.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.SyncManifest`
+            The manifest of the directory.
+
+        """
+        files = {}
+        for file_name in sorted(os.listdir(directory_path)):
+            file_path = os.path.join(directory_path, file_name)
+            if file_name == cls.FILE_NAME or not os.path.isfile(file_path):
+                continue
+            files[file_name] = {"md5": cls.hash_file(file_path), "size": os.path.getsize(file_path)}
+        return cls(files)
+
+    def diff(self, remote):
+        """
+        Compares this (local) manifest against a remote manifest.
+
+        Parameters
+        ----------
+        remote : :class:`compas_xr.storage.SyncManifest`
+            The manifest of the files that are currently stored remotely.
+
+        Returns
+        -------
+        added : list of str
+            The names of local files that do not exist remotely.
+        changed : list of str
+            The names of files whose content differs from the remote file.
+        unchanged : list of str
+            The names of files whose content is identical to the remote file.
+        orphaned : list of str
+            The names of remote files that do not exist locally.
+
+        """
+        added, changed, unchanged = [], [], []
+        for file_name in sorted(self.files):
+            remote_entry = remote.files.get(file_name)
+            if remote_entry is None:
+                added.append(file_name)
+            elif remote_entry.get("md5") != self.files[file_name]["md5"]:
+                changed.append(file_name)
+            else:
+                unchanged.append(file_name)
+        orphaned = sorted(file_name for file_name in remote.files if file_name not in self.files)
+        return added, changed, unchanged, orphaned
+
+
+class SyncReport(object):
+    """
+    A SyncReport collects the outcome of a directory synchronization.
+
+    Attributes
+    ----------
+    upload : :class:`compas_xr.storage.UploadReport`
+        The report of the upload of the added and changed files.
+    added : list of str
+        The names of the files that did not exist remotely.
+    changed : list of str
+        The names of the files whose content differed from the remote file.
+    unchanged : list of str
+        The names of the files that were not uploaded because they are identical to the remote file.
+    deleted : list of str
+        The names of the remote orphans that were deleted.
+    orphaned : list of str
+        The names of the remote orphans that are still stored remotely.
+    failed_deletes : dict of str, str
+        The error message of every orphan that could not be deleted, keyed by file name.
+    """
+
+    def __init__(self, upload, added, changed, unchanged):
+        self.upload = upload
+        self.added = added
+        self.changed = changed
+        self.unchanged = unchanged
+        self.deleted = []
+        self.orphaned = []
+        self.failed_deletes = {}
+
+    def __str__(self):
+        return "SyncReport, added={}, changed={}, unchanged={}, deleted={}, orphaned={}, {}".format(
+            len(self.added), len(self.changed), len(self.unchanged), len(self.deleted), len(self.orphaned), self.upload
+        )
+
+    @property
+    def succeeded(self):
+        """
+        bool : True if every added and changed file was uploaded and every requested delete succeeded.
+        """
+        return self.upload.succeeded and not self.failed_deletes
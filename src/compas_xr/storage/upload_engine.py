@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+import time
+
+from compas_xr.utilities import WorkerPool
+
+
+class UploadError(Exception):
+    """
+    Raised when some files of a bulk upload failed or were skipped.
+
+    Attributes
+    ----------
+    report : :class:`UploadReport`
+        The outcome of the upload.
+    """
+
+    def __init__(self, report):
+        self.report = report
+        errors = sorted(report.failed.items())
+        message = "Failed to upload {} of {} files".format(len(report.failed) + len(report.skipped), len(report.uploaded) + len(report.failed) + len(report.skipped))
+        if errors:
+            message += ", {}: {}".format(*errors[0])
+        super(UploadError, self).__init__(message)
+
+
+class UploadReport(object):
+    """
+    An UploadReport collects the outcome of a bulk upload.
+
+    Attributes
+    ----------
+    uploaded : list of str
+        The local paths of the files that were uploaded, in completion order.
+    failed : dict of str, str
+        The error message of every file that could not be uploaded, keyed by local path.
+    skipped : list of str
+        The local paths of the files that were never attempted because the upload was interrupted.
+    total_bytes : int
+        The number of bytes that were uploaded successfully.
+    elapsed : float
+        The wall time of the upload in seconds.
+    interrupted : bool
+        True if the upload was interrupted before all files were attempted.
+    """
+
+    def __init__(self):
+        self.uploaded = []
+        self.failed = {}
+        self.skipped = []
+        self.total_bytes = 0
+        self.elapsed = 0.0
+        self.interrupted = False
+
+    def __str__(self):
+        return "UploadReport, uploaded={}, failed={}, skipped={}, bytes={}, seconds={:.2f}, throughput={:.0f} B/s".format(
+            len(self.uploaded), len(self.failed), len(self.skipped), self.total_bytes, self.elapsed, self.throughput
+        )
+
+    @property
+    def succeeded(self):
+        """
+        bool : True if every file was uploaded.
+        """
+        return not self.failed and not self.skipped and not self.interrupted
+
+    @property
+    def throughput(self):
+        """
+        float : The number of uploaded bytes per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.total_bytes / self.elapsed
+
+
+class UploadEngine(object):
+    """
+    An UploadEngine uploads many local files to a storage with a bounded number of concurrent uploads.
+
+    The UploadEngine class only relies on the shared :class:`compas_xr.storage.storage_interface.StorageInterface`
+    methods, and it can therefore be used by every Storage backend.
+    Every finished file is recorded in the :class:`UploadReport` and, if a journal path is provided,
+    appended as one JSON line to the journal, so that an interrupted run still shows which files made it.
+
+    Parameters
+    ----------
+    storage : :class:`compas_xr.storage.Storage`
+        The storage to which the files are uploaded.
+    max_workers : int, optional
+        The maximum number of concurrent uploads. Default is 8.
+    journal_path : str, optional
+        The path of a file to which the status of every finished upload is appended. Default is None.
+
+    Attributes
+    ----------
+    storage : :class:`compas_xr.storage.Storage`
+        The storage to which the files are uploaded.
+    max_workers : int
+        The maximum number of concurrent uploads.
+    journal_path : str
+        The path of a file to which the status of every finished upload is appended.
+    report : :class:`UploadReport`
+        The report of the most recent upload, also available if that upload was interrupted.
+    """
+
+    def __init__(self, storage, max_workers=8, journal_path=None):
+        self.storage = storage
+        self.max_workers = max_workers
+        self.journal_path = journal_path
+        self.report = None
+        self._lock = threading.Lock()
+
+    def _record(self, report, file_path, cloud_path_list, error=None, size=0):
+        with self._lock:
+            if error is None:
+                report.uploaded.append(file_path)
+                report.total_bytes += size
+            else:
+                report.failed[file_path] = error
+            if self.journal_path:
+                entry = {
+                    "file": file_path,
+                    "reference": "/".join(cloud_path_list + [os.path.basename(file_path)]),
+                    "status": "uploaded" if error is None else "failed",
+                    "error": error,
+                    "time": time.time(),
+                }
+                with open(self.journal_path, "a") as journal:
+                    journal.write(json.dumps(entry) + "\n")
+
+    def _upload_file(self, report, file_path, cloud_path_list):
+        try:
+            size = os.path.getsize(file_path)
+            self.storage.upload_file_as_bytes_to_deep_reference(file_path, cloud_path_list)
+        except Exception as e:
+            self._record(report, file_path, cloud_path_list, error=str(e))
+            return False
+        self._record(report, file_path, cloud_path_list, size=size)
+        return True
+
+    def upload_files(self, file_paths, cloud_path_list):
+        """
+        Uploads local files as bytes to the storage at specified cloud path in list order.
+
+        Failures of single files do not stop the upload, they are collected in the returned report.
+        If the upload is interrupted (ex: KeyboardInterrupt), the uploads in flight are finished,
+        the remaining files are marked as skipped in the report and the interruption is re-raised.
+
+        Parameters
+        ----------
+        file_paths : list of str
+            The local paths of the files to be uploaded.
+        cloud_path_list : list of str
+            The list of reference names under which the files will be stored.
+
+        Returns
+        -------
+        :class:`compas_xr.storage.upload_engine.UploadReport`
+            The outcome of the upload.
+
+        """
+        report = self.report = UploadReport()
+        file_paths = list(file_paths)
+        cloud_path_list = list(cloud_path_list)
+        start = time.time()
+        pool = WorkerPool(max_workers=self.max_workers)
+        futures = []
+        try:
+            for file_path in file_paths:
+                futures.append((file_path, pool.submit(self._upload_file, report, file_path, cloud_path_list)))
+            for _, future in futures:
+                # Waiting in short intervals keeps the main thread responsive to KeyboardInterrupt
+                while not future.wait(0.1):
+                    pass
+        except BaseException:
+            report.interrupted = True
+            pool.shutdown(wait=True, cancel_pending=True)
+            report.skipped = [file_path for file_path, future in futures if future.cancelled]
+            report.skipped.extend(file_paths[len(futures) :])
+            report.elapsed = time.time() - start
+            raise
+        pool.shutdown(wait=True)
+        report.elapsed = time.time() - start
+        return report
@@ -0,0 +1,74 @@
+"""
+********************************************************************************
+compas_xr.utilities
+********************************************************************************
+
+This package contains helpers shared by the storage and realtime database backends.
+
+.. currentmodule:: compas_xr.utilities
+
+Classes
+-------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    EventStream
+    Future
+    HttpClient
+    HttpResponse
+    TaskExecutor
+    WorkerPool
+
+Functions
+---------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    database_url_from_config
+    is_local_backend
+    local_directory_from_config
+    wait_all
+
+Exceptions
+----------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    AsyncTimeoutError
+    HttpError
+
+"""
+
+from compas_xr.utilities.event_stream import EventStream
+from compas_xr.utilities.http_client import HttpClient
+from compas_xr.utilities.http_client import HttpError
+from compas_xr.utilities.http_client import HttpResponse
+from compas_xr.utilities.local_backend import database_url_from_config
+from compas_xr.utilities.local_backend import is_local_backend
+from compas_xr.utilities.local_backend import local_directory_from_config
+from compas_xr.utilities.task_executor import TaskExecutor
+from compas_xr.utilities.task_executor import wait_all
+from compas_xr.utilities.workers import AsyncTimeoutError
+from compas_xr.utilities.workers import Future
+from compas_xr.utilities.workers import WorkerPool
+
+__all__ = [
+    "AsyncTimeoutError",
+    "EventStream",
+    "Future",
+    "HttpClient",
+    "HttpError",
+    "HttpResponse",
+    "TaskExecutor",
+    "WorkerPool",
+    "database_url_from_config",
+    "is_local_backend",
+    "local_directory_from_config",
+    "wait_all",
+]
@@ -0,0 +1,213 @@
+import json
+import socket
+import ssl
+import threading
+
+try:
+    from http.client import HTTPConnection
+    from http.client import HTTPException
+    from http.client import HTTPResponse
+    from http.client import HTTPSConnection
+    from urllib.parse import urljoin
+    from urllib.parse import urlsplit
+except ImportError:
+    from httplib import HTTPConnection
+    from httplib import HTTPException
+    from httplib import HTTPResponse
+    from httplib import HTTPSConnection
+    from urlparse import urljoin
+    from urlparse import urlsplit
+
+from compas_xr.utilities.http_client import HttpError
+
+
+class EventStream(object):
+    """
+    An EventStream follows a Firebase Realtime Database location through the REST streaming protocol.
+
+    The EventStream class keeps one server-sent events connection open on a background thread
+    and calls the callback for every ``put`` and ``patch`` event of the location.
+    Dropped connections are reopened with an increasing delay, and the server then sends the full data
+    of the location again as a ``put`` event at the root path.
+    It only relies on the standard library and works in both IronPython and Python 3.0.
+
+    Parameters
+    ----------
+    url : str
+        The REST url of the database location, ending in ``.json``.
+    callback : callable
+        A function called as ``callback(event_type, path, data)`` for every ``put`` and ``patch`` event,
+        with the path of the changed data relative to the location (ex: "/steps/3/data").
+    headers : dict of str, str, optional
+        Additional request headers (ex: an authorization header).
+    timeout : float, optional
+        The number of seconds without any data, including keep-alive events, after which the connection is reopened.
+        Default is 60, Firebase sends a keep-alive event every 30 seconds.
+    max_reconnect_delay : float, optional
+        The maximum number of seconds to wait before reopening a dropped connection. Default is 30.
+    ssl_context : :class:`ssl.SSLContext`, optional
+        The SSL context used for HTTPS connections. Default is None, which uses the default context.
+
+    Attributes
+    ----------
+    url : str
+        The REST url of the database location.
+    connected : bool
+        True while the connection is open.
+    connections : int
+        The number of times the connection was opened.
+    last_error : Exception
+        The error that closed the connection the last time, or None.
+    """
+
+    IGNORED_EVENTS = ("keep-alive",)
+    CLOSING_EVENTS = ("cancel", "auth_revoked")
+
+    def __init__(self, url, callback, headers=None, timeout=60, max_reconnect_delay=30, ssl_context=None):
+        self.url = url
+        self.callback = callback
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ssl_context = ssl_context
+        self.connected = False
+        self.connections = 0
+        self.last_error = None
+        self._closed = threading.Event()
+        self._connection = None
+        self._socket = None
+        self._thread = None
+
+    def start(self):
+        """
+        Opens the connection on a background thread.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.EventStream`
+            The stream itself.
+
+        """
+        if not self._thread:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def close(self):
+        """
+        Closes the connection and stops reconnecting.
+
+        Returns
+        -------
+        None
+
+        """
+        self._closed.set()
+        # Unblock the pending read, the connection may already have handed its socket over to the response
+        sock = self._socket
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        if self._connection:
+            self._connection.close()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(self.timeout)
+
+    @property
+    def closed(self):
+        """
+        bool : True once the stream was closed, by the caller or by the server.
+        """
+        return self._closed.is_set()
+
+    def _run(self):
+        delay = 0.5
+        while not self._closed.is_set():
+            try:
+                self._listen()
+                delay = 0.5
+            except (HTTPException, HttpError, socket.error, ssl.SSLError, ValueError) as e:
+                self.last_error = e
+            finally:
+                self.connected = False
+                if self._connection:
+                    self._connection.close()
+                    self._connection = None
+                self._socket = None
+            if self._closed.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _open(self, url):
+        parts = urlsplit(url)
+        if parts.scheme.lower() == "https":
+            if self.ssl_context:
+                connection = HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout, context=self.ssl_context)
+            else:
+                connection = HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout)
+        else:
+            connection = HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+        if not hasattr(HTTPResponse, "readline"):
+            # Without a chunk-aware readline, ask for an unchunked body that can be read line by line from the socket
+            connection._http_vsn = 10
+            connection._http_vsn_str = "HTTP/1.0"
+        path = parts.path or "/"
+        if parts.query:
+            path = "{}?{}".format(path, parts.query)
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        headers.update(self.headers)
+        self._connection = connection
+        connection.request("GET", path, headers=headers)
+        self._socket = connection.sock
+        return connection.getresponse()
+
+    def _listen(self):
+        url = self.url
+        response = self._open(url)
+        # Firebase redirects streams to the server that holds the database
+        for _ in range(5):
+            if response.status not in (301, 302, 307, 308):
+                break
+            url = urljoin(url, response.getheader("Location"))
+            self._connection.close()
+            response = self._open(url)
+        if response.status != 200:
+            raise HttpError("GET", url, response.status, response.read())
+
+        self.connected = True
+        self.connections += 1
+        readline = response.readline if hasattr(response, "readline") else response.fp.readline
+        event_type = None
+        data_lines = []
+        while not self._closed.is_set():
+            line = readline()
+            if not line:
+                raise socket.error("Event stream closed by the server")
+            line = line.decode("utf-8") if isinstance(line, bytes) else line
+            line = line.rstrip("\r\n")
+            if not line:
+                if event_type is not None:
+                    self._dispatch(event_type, "\n".join(data_lines))
+                event_type = None
+                data_lines = []
+            elif line.startswith("event:"):
+                event_type = line[6:].strip()
+            elif line.startswith("data:"):
+                data_lines.append(line[5:].strip())
+
+    def _dispatch(self, event_type, data):
+        if event_type in self.IGNORED_EVENTS:
+            return
+        if event_type in self.CLOSING_EVENTS:
+            self.last_error = Exception("Event stream closed by the server with event {}: {}".format(event_type, data))
+            self._closed.set()
+            return
+        payload = json.loads(data)
+        try:
+            self.callback(event_type, payload["path"], payload["data"])
+        except Exception as e:
+            # A failing callback must not stop the stream
+            self.last_error = e
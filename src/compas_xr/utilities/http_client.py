@@ -0,0 +1,369 @@
+import json
+import socket
+import threading
+
+try:
+    from http.client import HTTPConnection
+    from http.client import HTTPException
+    from http.client import HTTPSConnection
+    from urllib.parse import urlsplit
+except ImportError:
+    from httplib import HTTPConnection
+    from httplib import HTTPException
+    from httplib import HTTPSConnection
+    from urlparse import urlsplit
+
+# Requests whose repetition has the same effect, the only ones retried automatically
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+
+
+class HttpError(Exception):
+    """
+    Raised when a request is answered with an unsuccessful status code.
+
+    Attributes
+    ----------
+    method : str
+        The HTTP method of the request.
+    url : str
+        The url of the request.
+    status : int
+        The status code of the response.
+    content : bytes
+        The body of the response.
+    """
+
+    def __init__(self, method, url, status, content):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.content = content
+        super(HttpError, self).__init__("{} {} failed with status {}: {}".format(method, url, status, content[:200]))
+
+
+class HttpResponse(object):
+    """
+    An HttpResponse holds the status, headers and fully read body of a response.
+
+    Attributes
+    ----------
+    status : int
+        The status code of the response.
+    headers : dict of str, str
+        The response headers, keyed by lower case header name.
+    content : bytes
+        The body of the response.
+    """
+
+    def __init__(self, status, headers, content):
+        self.status = status
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        """
+        str : The body of the response decoded as UTF-8.
+        """
+        if isinstance(self.content, str):
+            return self.content
+        return self.content.decode("utf-8")
+
+    def json(self):
+        """
+        Parses the body of the response as JSON.
+
+        Returns
+        -------
+        Any
+            The parsed body.
+
+        """
+        return json.loads(self.text)
+
+
+class HttpClient(object):
+    """
+    An HttpClient sends requests over pooled keep-alive connections.
+
+    The HttpClient class keeps idle connections per host and reuses them for subsequent requests,
+    so consecutive reads and writes to the same Firebase host only pay the TCP and TLS handshake once.
+    It is thread-safe, a connection is only ever used by one request at a time.
+    It only relies on the standard library and works in both IronPython and Python 3.0.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        The maximum number of idle connections kept per host. Default is 10.
+    timeout : float, optional
+        The socket timeout of every request in seconds. Default is 30.
+    ssl_context : :class:`ssl.SSLContext`, optional
+        The SSL context used for HTTPS connections. Default is None, which uses the default context.
+
+    Attributes
+    ----------
+    pool_size : int
+        The maximum number of idle connections kept per host.
+    timeout : float
+        The socket timeout of every request in seconds.
+    _shared_client : :class:`HttpClient`, class attribute
+        The client shared by the storage and realtime database backends.
+    """
+
+    _shared_client = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_size=10, timeout=30, ssl_context=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the client shared by the storage and realtime database backends, creating it if needed.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpClient`
+            The shared client.
+
+        """
+        with cls._shared_lock:
+            if not cls._shared_client:
+                cls._shared_client = cls()
+            return cls._shared_client
+
+    @classmethod
+    def configure_shared(cls, pool_size=10, timeout=30, ssl_context=None):
+        """
+        Replaces the client shared by the storage and realtime database backends.
+
+        Parameters
+        ----------
+        pool_size : int, optional
+            The maximum number of idle connections kept per host. Default is 10.
+        timeout : float, optional
+            The socket timeout of every request in seconds. Default is 30.
+        ssl_context : :class:`ssl.SSLContext`, optional
+            The SSL context used for HTTPS connections. Default is None, which uses the default context.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpClient`
+            The new shared client.
+
+        """
+        with cls._shared_lock:
+            if cls._shared_client:
+                cls._shared_client.close()
+            cls._shared_client = cls(pool_size=pool_size, timeout=timeout, ssl_context=ssl_context)
+            return cls._shared_client
+
+    def _connect(self, scheme, host, port):
+        if scheme == "https":
+            if self.ssl_context:
+                connection = HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context)
+            else:
+                connection = HTTPSConnection(host, port, timeout=self.timeout)
+        else:
+            connection = HTTPConnection(host, port, timeout=self.timeout)
+        connection.connect()
+        # Small requests on a kept-alive connection must not wait for the delayed ACK of the previous one
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+    def _acquire(self, pool_key):
+        with self._lock:
+            idle = self._idle.get(pool_key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(*pool_key), False
+
+    def _release(self, pool_key, connection):
+        with self._lock:
+            idle = self._idle.setdefault(pool_key, [])
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """
+        Closes all idle connections.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def request(self, method, url, body=None, headers=None, raise_for_status=True):
+        """
+        Sends a request and reads the full response.
+
+        GET, HEAD, PUT and DELETE requests that fail on a reused idle connection are sent once more on a new connection.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request (ex: "GET", "PUT", "PATCH").
+        url : str
+            The url of the request.
+        body : str or bytes, optional
+            The body of the request. Strings are encoded as UTF-8.
+        headers : dict of str, str, optional
+            Additional request headers.
+        raise_for_status : bool, optional
+            Whether to raise an :class:`HttpError` for status codes of 400 and above. Default is True.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        pool_key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = "{}?{}".format(path, parts.query)
+        if body is not None and not isinstance(body, bytes):
+            body = body.encode("utf-8")
+        request_headers = {"Connection": "keep-alive"}
+        request_headers.update(headers or {})
+
+        while True:
+            connection, reused = self._acquire(pool_key)
+            try:
+                connection.request(method, path, body, request_headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (HTTPException, socket.error):
+                connection.close()
+                # A pooled connection may have been closed by the server while idle, retry once on a new one.
+                # The server may also have applied the request before the connection closed, so POST and PATCH are not sent twice.
+                if reused and method.upper() in IDEMPOTENT_METHODS:
+                    continue
+                raise
+            break
+
+        response_headers = dict((name.lower(), value) for name, value in response.getheaders())
+        if response_headers.get("connection", "").lower() == "close" or response.version == 10:
+            connection.close()
+        else:
+            self._release(pool_key, connection)
+
+        if raise_for_status and response.status >= 400:
+            raise HttpError(method, url, response.status, content)
+        return HttpResponse(response.status, response_headers, content)
+
+    def get(self, url, headers=None):
+        """
+        Sends a GET request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the request.
+        headers : dict of str, str, optional
+            Additional request headers.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        return self.request("GET", url, headers=headers)
+
+    def put(self, url, body, headers=None):
+        """
+        Sends a PUT request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the request.
+        body : str or bytes
+            The body of the request.
+        headers : dict of str, str, optional
+            Additional request headers.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        return self.request("PUT", url, body=body, headers=headers)
+
+    def post(self, url, body, headers=None):
+        """
+        Sends a POST request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the request.
+        body : str or bytes
+            The body of the request.
+        headers : dict of str, str, optional
+            Additional request headers.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        return self.request("POST", url, body=body, headers=headers)
+
+    def patch(self, url, body, headers=None):
+        """
+        Sends a PATCH request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the request.
+        body : str or bytes
+            The body of the request.
+        headers : dict of str, str, optional
+            Additional request headers.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        return self.request("PATCH", url, body=body, headers=headers)
+
+    def delete(self, url, headers=None):
+        """
+        Sends a DELETE request.
+
+        Parameters
+        ----------
+        url : str
+            The url of the request.
+        headers : dict of str, str, optional
+            Additional request headers.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.HttpResponse`
+            The response.
+
+        """
+        return self.request("DELETE", url, headers=headers)
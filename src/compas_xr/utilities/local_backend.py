@@ -0,0 +1,75 @@
+import json
+import os
+
+LOCAL_BACKEND = "local"
+
+
+def local_directory_from_config(config_path, config=None):
+    """
+    Returns the directory that holds the data of the local backends of a configuration.
+
+    The directory is read from the ``"localPath"`` of the configuration, relative to the configuration file,
+    and defaults to a ``compas_xr_local`` folder next to the configuration file.
+
+    Parameters
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+    config : dict, optional
+        The configuration, read from the file if None.
+
+    Returns
+    -------
+    str
+        The absolute path of the directory.
+
+    """
+    if config is None:
+        with open(config_path) as config_file:
+            config = json.load(config_file)
+    config_directory = os.path.dirname(os.path.abspath(config_path))
+    return os.path.join(config_directory, config.get("localPath") or "compas_xr_local")
+
+
+def database_url_from_config(config_path):
+    """
+    Returns the URL that identifies the RealtimeDatabase of a configuration.
+
+    This is the ``"databaseURL"`` of Firebase configurations, and a file URL of the local directory for the local backend.
+
+    Parameters
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+
+    Returns
+    -------
+    str or None
+        The URL of the database, None if the configuration does not name one.
+
+    """
+    with open(config_path) as config_file:
+        config = json.load(config_file)
+    if config.get("backend") == LOCAL_BACKEND:
+        return "file://" + local_directory_from_config(config_path, config).replace(os.sep, "/")
+    return config.get("databaseURL")
+
+
+def is_local_backend(config_path):
+    """
+    Checks if a configuration selects the local Storage and RealtimeDatabase backends with ``"backend": "local"``.
+
+    Parameters
+    ----------
+    config_path : str
+        The path to the configuration JSON file.
+
+    Returns
+    -------
+    bool
+        True if the local backends are selected.
+
+    """
+    with open(config_path) as config_file:
+        config = json.load(config_file)
+    return config.get("backend") == LOCAL_BACKEND
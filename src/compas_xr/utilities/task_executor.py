@@ -0,0 +1,157 @@
+import threading
+import time
+
+from compas_xr.utilities.workers import AsyncTimeoutError
+from compas_xr.utilities.workers import Future
+
+
+class TaskExecutor(object):
+    """
+    A TaskExecutor turns awaitable .NET tasks into :class:`compas_xr.utilities.Future` objects.
+
+    The TaskExecutor class registers a completion callback on the awaiter of every submitted task,
+    so waiting for a task does not need a thread of its own, and any number of tasks can be in flight at once.
+    It only relies on the ``GetAwaiter().OnCompleted(...)`` and ``GetResult()`` protocol of .NET tasks
+    (ex: ``Task``, ``Task<T>`` and ``FirebaseStorageTask``).
+    The callbacks are registered with ``ConfigureAwait(False)``, so they run on a thread pool thread
+    instead of being posted to the SynchronizationContext of the submitting thread (ex: the Rhino UI thread),
+    which would never run them while that thread blocks on the result.
+
+    Attributes
+    ----------
+    _shared_executor : :class:`TaskExecutor`, class attribute
+        The executor shared by the IronPython storage and realtime database backends.
+    """
+
+    _shared_executor = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the executor shared by the IronPython backends, creating it if needed.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.TaskExecutor`
+            The shared executor.
+
+        """
+        with cls._shared_lock:
+            if not cls._shared_executor:
+                cls._shared_executor = cls()
+            return cls._shared_executor
+
+    def submit(self, task_factory):
+        """
+        Starts a task and returns a future resolving to its result.
+
+        Parameters
+        ----------
+        task_factory : callable
+            A function without arguments that starts and returns an awaitable task (ex: ``lambda: reference.PutAsync(data)``).
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.Future`
+            The future resolving to the result of the task, or to the exception it raised.
+
+        """
+        future = Future()
+        try:
+            awaiter = _awaiter(task_factory())
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        def _on_completed():
+            try:
+                future.set_result(awaiter.GetResult())
+            except Exception as e:
+                future.set_exception(e)
+
+        awaiter.OnCompleted(_on_completed)
+        return future
+
+    def run(self, task_factory, timeout=10):
+        """
+        Starts a task and blocks until its result is available.
+
+        Parameters
+        ----------
+        task_factory : callable
+            A function without arguments that starts and returns an awaitable task.
+        timeout : float, optional
+            The maximum number of seconds to wait for the task. Default is 10.
+
+        Returns
+        -------
+        Any
+            The result of the task.
+
+        Raises
+        ------
+        :class:`compas_xr.utilities.AsyncTimeoutError`
+            If the task did not complete within the timeout.
+
+        """
+        return self.submit(task_factory).result(timeout)
+
+    def map(self, task_factories, timeout=10):
+        """
+        Starts several tasks at once and blocks until all of their results are available.
+
+        Parameters
+        ----------
+        task_factories : list of callable
+            Functions without arguments that start and return an awaitable task.
+        timeout : float, optional
+            The maximum number of seconds to wait for all tasks together. Default is 10.
+
+        Returns
+        -------
+        list
+            The results of the tasks, in the order of the task factories.
+
+        """
+        return wait_all([self.submit(task_factory) for task_factory in task_factories], timeout)
+
+
+def _awaiter(task):
+    # FirebaseStorageTask wraps its Task in TargetTask and cannot be configured itself
+    task = getattr(task, "TargetTask", task)
+    if hasattr(task, "ConfigureAwait"):
+        # Do not capture the SynchronizationContext of the calling thread
+        task = task.ConfigureAwait(False)
+    return task.GetAwaiter()
+
+
+def wait_all(futures, timeout=None):
+    """
+    Waits for several futures with one shared deadline and returns their results.
+
+    Parameters
+    ----------
+    futures : list of :class:`compas_xr.utilities.Future`
+        The futures to wait for.
+    timeout : float, optional
+        The maximum number of seconds to wait for all futures together. Waits indefinitely if None.
+
+    Returns
+    -------
+    list
+        The results of the futures, in the order of the futures.
+
+    Raises
+    ------
+    :class:`compas_xr.utilities.AsyncTimeoutError`
+        If not all futures were resolved within the timeout.
+
+    """
+    deadline = None if timeout is None else time.time() + timeout
+    for future in futures:
+        remaining = None if deadline is None else max(deadline - time.time(), 0)
+        if not future.wait(remaining):
+            pending = len([f for f in futures if not f.done()])
+            raise AsyncTimeoutError("{} of {} operations did not complete within {} seconds".format(pending, len(futures), timeout))
+    return [future.result() for future in futures]
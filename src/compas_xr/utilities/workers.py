@@ -0,0 +1,316 @@
+import threading
+
+try:
+    from queue import Empty
+    from queue import Queue
+except ImportError:
+    from Queue import Empty
+    from Queue import Queue
+
+
+class AsyncTimeoutError(RuntimeError):
+    """
+    Raised when an asynchronous operation does not complete within its timeout.
+    """
+
+
+class Future(object):
+    """
+    A Future represents the eventual result of an operation running on another thread.
+
+    The Future class is a minimal, IronPython compatible counterpart of :class:`concurrent.futures.Future`.
+
+    Attributes
+    ----------
+    cancelled : bool
+        True if the operation was cancelled before it started.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self.cancelled = False
+
+    def done(self):
+        """
+        Checks if the operation has finished, failed or was cancelled.
+
+        Returns
+        -------
+        bool
+            True if the future is resolved.
+
+        """
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+        Cancels the operation if it has not been resolved yet.
+
+        Returns
+        -------
+        bool
+            True if the future was cancelled by this call.
+
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.cancelled = True
+        self._resolve()
+        return True
+
+    def set_result(self, result):
+        """
+        Resolves the future with the result of the operation.
+
+        Parameters
+        ----------
+        result : Any
+            The result of the operation.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._result = result
+        self._resolve()
+
+    def set_exception(self, exception):
+        """
+        Resolves the future with the exception raised by the operation.
+
+        Parameters
+        ----------
+        exception : Exception
+            The exception raised by the operation.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._exception = exception
+        self._resolve()
+
+    def add_done_callback(self, callback):
+        """
+        Adds a callback that is called with the future once it is resolved.
+        If the future is already resolved, the callback is called immediately.
+
+        Parameters
+        ----------
+        callback : callable
+            A function taking the future as its only argument.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def wait(self, timeout=None):
+        """
+        Waits until the future is resolved.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns
+        -------
+        bool
+            True if the future was resolved within the timeout.
+
+        """
+        return self._event.wait(timeout)
+
+    def exception(self, timeout=None):
+        """
+        Returns the exception raised by the operation, or None if it succeeded.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns
+        -------
+        Exception or None
+            The exception raised by the operation.
+
+        Raises
+        ------
+        :class:`compas_xr.utilities.AsyncTimeoutError`
+            If the operation did not complete within the timeout.
+
+        """
+        if not self.wait(timeout):
+            raise AsyncTimeoutError("Operation did not complete within {} seconds".format(timeout))
+        return self._exception
+
+    def result(self, timeout=None):
+        """
+        Returns the result of the operation, re-raising its exception if it failed.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns
+        -------
+        Any
+            The result of the operation.
+
+        Raises
+        ------
+        :class:`compas_xr.utilities.AsyncTimeoutError`
+            If the operation did not complete within the timeout.
+
+        """
+        exception = self.exception(timeout)
+        if self.cancelled:
+            raise RuntimeError("Operation was cancelled")
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def _resolve(self):
+        self._event.set()
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class WorkerPool(object):
+    """
+    A WorkerPool runs submitted functions on a bounded number of reusable daemon threads.
+
+    The WorkerPool class is used wherever several blocking network calls can be overlapped,
+    and it works in both IronPython and Python 3.0 where :mod:`concurrent.futures` is not always available.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The maximum number of threads running submitted functions concurrently. Default is 8.
+
+    Attributes
+    ----------
+    max_workers : int
+        The maximum number of threads running submitted functions concurrently.
+    """
+
+    def __init__(self, max_workers=8):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1, got {}".format(max_workers))
+        self.max_workers = max_workers
+        self._queue = Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=exc_type is None, cancel_pending=exc_type is not None)
+
+    def _adjust_thread_count(self):
+        if len(self._threads) >= self.max_workers:
+            return
+        thread = threading.Thread(target=self._work)
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if future.done():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedules a function to be run on one of the worker threads.
+
+        Parameters
+        ----------
+        fn : callable
+            The function to run.
+        *args
+            Positional arguments passed to the function.
+        **kwargs
+            Keyword arguments passed to the function.
+
+        Returns
+        -------
+        :class:`compas_xr.utilities.Future`
+            The future resolving to the return value of the function.
+
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a WorkerPool that has been shut down")
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            self._adjust_thread_count()
+        return future
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops the worker threads once all submitted functions have been run.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to block until all worker threads have stopped. Default is True.
+        cancel_pending : bool, optional
+            Whether to cancel submitted functions that have not started yet. Default is False.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_pending:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
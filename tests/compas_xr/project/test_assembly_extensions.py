@@ -0,0 +1,131 @@
+import json
+import os
+import pickle
+import tempfile
+
+import pytest
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_xr.project import AssemblyExtensions
+from compas_xr.project import prototype_key
+from compas_xr.project.assembly_extensions import _BeamExportJob
+from compas_xr.project.assembly_extensions import _run_export_jobs
+
+
+def create_mesh_assembly(count):
+    assembly = Assembly()
+    for i in range(count):
+        frame = Frame(Point(i, 2 * i, 0), Vector(1, i, 0), Vector(0, 0, 1))
+        shape = Mesh.from_shape(Box(1.0 + i, 2.0, 0.5, frame=frame))
+        assembly.add_part(Part(name="part {}".format(i), frame=frame, shape=shape))
+    return assembly
+
+
+def read_folder(folder_path):
+    files = {}
+    for name in sorted(os.listdir(folder_path)):
+        with open(os.path.join(folder_path, name)) as obj_file:
+            files[name] = obj_file.read()
+    return files
+
+
+def test_parallel_mesh_export_matches_serial_export():
+    assembly = create_mesh_assembly(8)
+    folder_path = tempfile.mkdtemp()
+    AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "serial", z_to_y_remap=True)
+    AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "parallel", z_to_y_remap=True, max_workers=2)
+
+    serial = read_folder(os.path.join(folder_path, "serial"))
+    assert len(serial) == 8
+    assert serial == read_folder(os.path.join(folder_path, "parallel"))
+
+
+def test_mesh_assembly_glb_export():
+    folder_path = tempfile.mkdtemp()
+    AssemblyExtensions().export_mesh_assembly_glbs(create_mesh_assembly(3), folder_path, "glb")
+    assert sorted(os.listdir(os.path.join(folder_path, "glb"))) == ["0.glb", "1.glb", "2.glb"]
+
+
+def test_instanced_mesh_export_shares_identical_parts():
+    assembly = Assembly()
+    for i in range(6):
+        frame = Frame(Point(i, 2 * i, 0), Vector(1, i, 0), Vector(0, 0, 1))
+        # Two prototypes, placed at different frames
+        shape = Mesh.from_shape(Box(1.0 + i % 2, 2.0, 0.5, frame=frame))
+        assembly.add_part(Part(name="part {}".format(i), frame=frame, shape=shape))
+    folder_path = tempfile.mkdtemp()
+    prototypes = AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "instanced", instancing=True)
+
+    assert prototypes == {"0": "0", "1": "1", "2": "0", "3": "1", "4": "0", "5": "1"}
+    assert sorted(os.listdir(os.path.join(folder_path, "instanced"))) == ["0.obj", "1.obj", "prototypes.json"]
+    with open(os.path.join(folder_path, "instanced", "prototypes.json")) as prototypes_file:
+        assert json.load(prototypes_file) == prototypes
+
+
+def test_beam_prototype_keys_ignore_placement():
+    from compas_timber.parts import Beam
+
+    beams = [
+        Beam(Frame(Point(0, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0)), 3.0, 0.1, 0.2),
+        Beam(Frame(Point(5, 2, 1), Vector(1, 1, 0), Vector(0, 0, 1)), 3.0, 0.1, 0.2),
+        Beam(Frame(Point(5, 2, 1), Vector(1, 1, 0), Vector(0, 0, 1)), 2.5, 0.1, 0.2),
+    ]
+    for key, beam in enumerate(beams):
+        beam.key = key
+    jobs = [_BeamExportJob(beam, Frame.worldXY(), "{}.obj".format(beam.key)) for beam in beams]
+    keys = [prototype_key(job.local_geometry()) for job in jobs]
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+
+def test_mesh_export_writes_levels_of_detail():
+    assembly = Assembly()
+    shape = Mesh.from_shape(Box(1.0, 2.0, 0.5))
+    for _ in range(4):
+        shape = shape.subdivided("quad")
+    assembly.add_part(Part(name="part", frame=Frame.worldXY(), shape=shape))
+    folder_path = tempfile.mkdtemp()
+    AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "lods", lods=[0.05, 0.2])
+
+    export_path = os.path.join(folder_path, "lods")
+    with open(os.path.join(export_path, "lods.json")) as lods_file:
+        assert json.load(lods_file) == {"0": ["0.obj", "lod1/0.obj", "lod2/0.obj"]}
+    vertex_counts = [Mesh.from_obj(os.path.join(export_path, path)).number_of_vertices() for path in ["0.obj", "lod1/0.obj", "lod2/0.obj"]]
+    assert vertex_counts[0] > vertex_counts[1] > vertex_counts[2] > 0
+
+
+def test_glb_export_writes_levels_of_detail():
+    folder_path = tempfile.mkdtemp()
+    AssemblyExtensions().export_mesh_assembly_glbs(create_mesh_assembly(2), folder_path, "glb_lods", lods=[0.05, 0.2])
+
+    export_path = os.path.join(folder_path, "glb_lods")
+    assert sorted(os.listdir(export_path)) == ["0.glb", "1.glb", "lod1", "lod2", "lods.json"]
+    assert sorted(os.listdir(os.path.join(export_path, "lod2"))) == ["0.glb", "1.glb"]
+    with open(os.path.join(export_path, "lods.json")) as lods_file:
+        assert json.load(lods_file) == {"0": ["0.glb", "lod1/0.glb", "lod2/0.glb"], "1": ["1.glb", "lod1/1.glb", "lod2/1.glb"]}
+
+
+def test_beams_with_unpicklable_brep_features_are_exported_serially():
+    from compas.geometry import Brep
+    from compas_timber.parts import Beam
+    from compas_timber.parts import BrepSubtraction
+
+    beams = [Beam(Frame(Point(i, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0)), 3.0, 0.1, 0.2) for i in range(2)]
+    for key, beam in enumerate(beams):
+        beam.key = key
+    # A Brep without a backend cannot be serialized, like a Rhino Brep outside of Rhino
+    beams[1].add_features(BrepSubtraction(object.__new__(Brep)))
+    jobs = [_BeamExportJob(beam, Frame.worldXY(), "{}.obj".format(beam.key)) for beam in beams]
+    pickle.loads(pickle.dumps(jobs[0]))
+    with pytest.raises(Exception):
+        pickle.dumps(jobs[1])
+
+    exported = []
+    _run_export_jobs(lambda job: exported.append(job.key), jobs, max_workers=2)
+    assert exported == [0, 1]
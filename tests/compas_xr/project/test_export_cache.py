@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_xr.project import AssemblyExtensions
+from compas_xr.project import ExportCache
+
+
+def create_parts(count):
+    parts = []
+    for i in range(count):
+        frame = Frame(Point(i, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))
+        parts.append(Part(name="part {}".format(i), frame=frame, shape=Mesh.from_shape(Box(1.0 + i, 1.0, 1.0, frame=frame))))
+    return parts
+
+
+def create_assembly(parts):
+    assembly = Assembly()
+    for part in parts:
+        assembly.add_part(part)
+    return assembly
+
+
+def read(path):
+    with open(path) as obj_file:
+        return obj_file.read()
+
+
+def test_export_cache_only_exports_changed_parts():
+    folder_path = tempfile.mkdtemp()
+    cache = ExportCache(os.path.join(folder_path, "cache"))
+    parts = create_parts(10)
+    AssemblyExtensions().export_mesh_assembly_objs(create_assembly(parts), folder_path, "first", cache=cache)
+    assert (cache.hits, cache.misses) == (0, 10)
+
+    parts[3].attributes["shape"] = Mesh.from_shape(Box(5.0, 5.0, 5.0, frame=parts[3].frame))
+    AssemblyExtensions().export_mesh_assembly_objs(create_assembly(parts), folder_path, "second", cache=cache)
+    assert (cache.hits, cache.misses) == (9, 11)
+
+    AssemblyExtensions().export_mesh_assembly_objs(create_assembly(parts), folder_path, "uncached")
+    for name in os.listdir(os.path.join(folder_path, "uncached")):
+        assert read(os.path.join(folder_path, "second", name)) == read(os.path.join(folder_path, "uncached", name))
+
+    # The export frame is part of the key
+    AssemblyExtensions().export_mesh_assembly_objs(create_assembly(parts), folder_path, "remapped", z_to_y_remap=True, cache=ExportCache(cache.cache_directory))
+    assert read(os.path.join(folder_path, "remapped", "0.obj")) != read(os.path.join(folder_path, "first", "0.obj"))
+
+
+def test_export_cache_eviction_and_invalidation():
+    folder_path = tempfile.mkdtemp()
+    cache = ExportCache(os.path.join(folder_path, "cache"))
+    AssemblyExtensions().export_mesh_assembly_objs(create_assembly(create_parts(4)), folder_path, "export", cache=cache)
+    size = cache.size
+    assert len(ExportCache(cache.cache_directory)._index) == 4
+
+    key = ExportCache.key_from_data("some", "inputs")
+    assert key == ExportCache.key_from_data("some", "inputs")
+    assert key not in cache
+    cache.invalidate(next(iter(cache._index)))
+    assert len(ExportCache(cache.cache_directory)._index) == 3
+
+    cache.max_size = size // 2
+    cache.save()
+    assert 0 < cache.size <= size // 2
+    cache.invalidate()
+    assert cache.size == 0
+    assert os.listdir(cache.cache_directory) == [ExportCache.INDEX_NAME]
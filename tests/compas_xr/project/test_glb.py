@@ -0,0 +1,40 @@
+import os
+import struct
+import tempfile
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_xr.project import mesh_to_glb
+from compas_xr.project import read_glb
+from compas_xr.project import write_glb
+
+
+def test_glb_layout():
+    mesh = Mesh.from_shape(Box(2.0, 1.0, 0.5))
+    content = mesh_to_glb(mesh, name="beam")
+    magic, version, length = struct.unpack_from("<III", content, 0)
+    json_length, json_type = struct.unpack_from("<II", content, 12)
+    binary_length, binary_type = struct.unpack_from("<II", content, 20 + json_length)
+
+    assert (magic, version, length) == (0x46546C67, 2, len(content))
+    assert json_type == 0x4E4F534A and binary_type == 0x004E4942
+    assert json_length % 4 == 0 and binary_length % 4 == 0
+    # 8 float32 vertices and 12 uint32 triangles
+    assert binary_length == 8 * 3 * 4 + 12 * 3 * 4
+    assert b'"name":"beam"' in content
+
+
+def test_glb_round_trip():
+    frame = Frame(Point(1, 2, 3), Vector(1, 1, 0), Vector(0, 0, 1))
+    mesh = Mesh.from_shape(Box(2.0, 1.0, 0.5, frame=frame)).subdivided("quad")
+    file_path = os.path.join(tempfile.mkdtemp(), "0.glb")
+    write_glb(mesh, file_path)
+
+    vertices, faces = read_glb(file_path)
+    expected_vertices, expected_faces = mesh.to_vertices_and_faces(triangulated=True)
+    assert [list(face) for face in faces] == expected_faces
+    for vertex, expected in zip(vertices, expected_vertices):
+        assert max(abs(a - b) for a, b in zip(vertex, expected)) < 1e-6
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+
+import pytest
+from compas_xr.project import MeshBundle
+from compas_xr.project import ProjectManager
+
+
+class BytesStorage(object):
+    def __init__(self):
+        self.files = {}
+        self.requested_ranges = []
+
+    def upload_file_as_bytes_to_deep_reference(self, file_path, cloud_path_list):
+        with open(file_path, "rb") as file:
+            self.files["/".join(cloud_path_list + [os.path.basename(file_path)])] = file.read()
+
+    def get_data_from_deep_reference(self, cloud_path_list):
+        return json.loads(self.files["/".join(cloud_path_list)].decode("utf-8"))
+
+    def get_bytes_from_deep_reference(self, cloud_path_list, byte_range=None):
+        self.requested_ranges.append(byte_range)
+        content = self.files["/".join(cloud_path_list)]
+        return content[byte_range[0] : byte_range[1]] if byte_range else content
+
+
+@pytest.fixture
+def export_directory():
+    directory = tempfile.mkdtemp()
+    for key in range(12):
+        with open(os.path.join(directory, "{}.obj".format(key)), "w") as obj_file:
+            obj_file.write("# OBJ\no Mesh\n" + "v {0} {0} {0}\n".format(key) * (key + 1))
+    with open(os.path.join(directory, "manifest.json"), "w") as manifest_file:
+        manifest_file.write("{}")
+    return directory
+
+
+def read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_bundle_packs_parts_with_index(export_directory):
+    bundle_path = os.path.join(tempfile.mkdtemp(), "assembly.bundle")
+    bundle = MeshBundle.from_directory(export_directory, bundle_path)
+
+    assert sorted(bundle.parts, key=int) == [str(key) for key in range(12)]
+    assert bundle.size == os.path.getsize(bundle_path)
+    for key in ("0", "7", "11"):
+        assert bundle.read_part(bundle_path, key) == read(os.path.join(export_directory, key + ".obj"))
+
+    index = MeshBundle.from_json(MeshBundle.index_path(bundle_path))
+    assert index.parts == bundle.parts
+    assert index.byte_range(7) == bundle.byte_range("7")
+    with pytest.raises(KeyError):
+        index.byte_range("12")
+
+
+def test_project_manager_reads_single_parts_from_uploaded_bundle(export_directory):
+    config_path = tempfile.mktemp(suffix=".json", prefix="config_compas_xr")
+    with open(config_path, "w+") as config_file:
+        json.dump({"apiKey": "x", "authDomain": "x.firebaseapp.com", "databaseURL": "https://x.firebasedatabase.app", "storageBucket": "x.appspot.com"}, config_file)
+    pm = ProjectManager(config_path)
+    pm.storage = BytesStorage()
+
+    bundle_path = os.path.join(tempfile.mkdtemp(), "assembly.bundle")
+    bundle = pm.write_mesh_bundle(export_directory, bundle_path)
+    pm.upload_mesh_bundle_to_storage(bundle_path, "roof")
+    assert sorted(pm.storage.files) == ["bundle_storage/roof/assembly.bundle", "bundle_storage/roof/assembly.bundle.index.json"]
+
+    index = pm.get_mesh_bundle_index_from_storage("roof", "assembly.bundle")
+    assert index.parts == bundle.parts
+    part = pm.get_part_from_mesh_bundle_in_storage("roof", "assembly.bundle", "5", bundle_index=index)
+    assert part == read(os.path.join(export_directory, "5.obj"))
+    assert pm.storage.requested_ranges == [bundle.byte_range("5")]
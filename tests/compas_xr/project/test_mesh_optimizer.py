@@ -0,0 +1,82 @@
+import os
+import tempfile
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_xr.project import AssemblyExtensions
+from compas_xr.project import MeshOptimizer
+from compas_xr.project import cluster_vertices
+from compas_xr.project.glb import mesh_to_glb
+
+
+def unwelded_box():
+    # Every face has its own vertices, like the joined face meshes of a Brep
+    box = Mesh.from_shape(Box(1.23456789, 2.0, 0.5))
+    mesh = Mesh(name="beam")
+    for face in box.faces():
+        mesh.join(Mesh.from_vertices_and_faces(box.face_coordinates(face), [[0, 1, 2, 3]]))
+    return mesh
+
+
+def test_optimize_welds_seams_and_rounds_coordinates():
+    mesh = unwelded_box()
+    assert mesh.number_of_vertices() == 24
+
+    optimized = MeshOptimizer(precision=3).optimize(mesh)
+    assert optimized.name == "beam"
+    assert optimized.number_of_vertices() == 8
+    assert optimized.number_of_faces() == 6
+    assert sorted(set(round(abs(x), 6) for x, _, _ in optimized.vertices_attributes("xyz"))) == [0.617]
+
+
+def test_optimize_drops_collapsed_faces():
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [1, 1e-6, 0]], [[0, 1, 2], [0, 1, 3]])
+    optimized = MeshOptimizer(precision=4).optimize(mesh)
+    assert optimized.number_of_faces() == 1
+    assert optimized.number_of_vertices() == 3
+
+
+def test_optimize_keeps_the_first_welded_vertex():
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0.004, 0.004, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2], [3, 4, 5]])
+    optimized = MeshOptimizer(precision=4, weld_tolerance=0.01).optimize(mesh)
+    assert optimized.number_of_vertices() == 4
+    assert [0.0, 0.0, 0.0] in [optimized.vertex_coordinates(vertex) for vertex in optimized.vertices()]
+
+    # Decimation places the merged vertices at their average
+    clustered = cluster_vertices(mesh, 0.01, precision=4)
+    assert [0.002, 0.002, 0.0] in [clustered.vertex_coordinates(vertex) for vertex in clustered.vertices()]
+
+
+def test_export_reports_optimization():
+    assembly = Assembly()
+    for i in range(3):
+        assembly.add_part(Part(name="part {}".format(i), frame=Frame.worldXY(), shape=unwelded_box()))
+    folder_path = tempfile.mkdtemp()
+    optimizer = MeshOptimizer(precision=3)
+    AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "optimized", optimizer=optimizer)
+
+    assert sorted(optimizer.report) == ["0", "1", "2"]
+    entry = optimizer.report["1"]
+    assert (entry["vertices_before"], entry["vertices_after"]) == (24, 8)
+    assert entry["bytes_after"] == os.path.getsize(os.path.join(folder_path, "optimized", "1.obj"))
+    assert entry["bytes_after"] < entry["bytes_before"]
+    assert optimizer.totals["vertices_after"] == 24
+
+
+def test_export_measures_unoptimized_size_without_writing_it():
+    assembly = Assembly()
+    assembly.add_part(Part(name="part", frame=Frame.worldXY(), shape=unwelded_box()))
+    folder_path = tempfile.mkdtemp()
+    obj_optimizer = MeshOptimizer(precision=3)
+    AssemblyExtensions().export_mesh_assembly_objs(assembly, folder_path, "objs", optimizer=obj_optimizer)
+    glb_optimizer = MeshOptimizer(precision=3)
+    AssemblyExtensions().export_mesh_assembly_glbs(assembly, folder_path, "glbs", optimizer=glb_optimizer)
+
+    unoptimized_path = os.path.join(folder_path, "unoptimized.obj")
+    unwelded_box().to_obj(unoptimized_path)
+    assert obj_optimizer.report["0"]["bytes_before"] == os.path.getsize(unoptimized_path)
+    assert glb_optimizer.report["0"]["bytes_before"] == len(mesh_to_glb(unwelded_box()))
+    assert sorted(os.listdir(os.path.join(folder_path, "objs"))) == ["0.obj"]
@@ -0,0 +1,53 @@
+import os
+import tempfile
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import Vector
+from compas_xr.project.obj_writer import write_meshes_as_obj
+from compas_xr.project.obj_writer import write_obj
+from compas_xr.project.obj_writer import write_transformed_obj
+
+
+def read(path):
+    with open(path) as obj_file:
+        return obj_file.read()
+
+
+def test_write_transformed_obj_matches_transformed_copy():
+    folder_path = tempfile.mkdtemp()
+    for i in range(5):
+        frame = Frame(Point(i, 2.5 * i, 0.3), Vector(1, 0.37 * i, 0), Vector(0, 0.1, 1))
+        mesh = Mesh.from_shape(Box(1.0 + i, 2.0, 0.5, frame=frame)).subdivided("quad")
+        mesh.name = "part {}".format(i) if i % 2 else "Mesh"
+        transformation = Transformation.from_frame_to_frame(frame, Frame(Point(0, 0, 0), Vector.Xaxis(), Vector.Zaxis()))
+
+        mesh.transformed(transformation).to_obj(os.path.join(folder_path, "copy.obj"))
+        write_transformed_obj(mesh, transformation, os.path.join(folder_path, "arrays.obj"))
+        assert read(os.path.join(folder_path, "copy.obj")) == read(os.path.join(folder_path, "arrays.obj"))
+
+
+def test_write_obj_reads_back():
+    file_path = os.path.join(tempfile.mkdtemp(), "quad.obj")
+    write_obj(file_path, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2, 3]], name="quad", number_of_edges=4, precision=2)
+    assert "v 1.00 1.00 0.00\n" in read(file_path)
+    mesh = Mesh.from_obj(file_path)
+    assert (mesh.number_of_vertices(), mesh.number_of_faces()) == (4, 1)
+
+
+def test_write_meshes_as_obj_matches_joined_transformed_mesh():
+    # Face meshes with their own vertices, like the tessellation of a Brep
+    box = Mesh.from_shape(Box(1.3, 2.0, 0.5)).subdivided("quad")
+    meshes = [Mesh.from_vertices_and_faces(box.face_coordinates(face), [[0, 1, 2, 3]]) for face in box.faces()]
+    transformation = Transformation.from_frame_to_frame(Frame(Point(1, 2, 3), Vector(1, 0.3, 0), Vector(0, 0, 1)), Frame.worldXY())
+
+    joined = Mesh()
+    for mesh in meshes:
+        joined.join(mesh)
+    folder_path = tempfile.mkdtemp()
+    joined.transformed(transformation).to_obj(os.path.join(folder_path, "joined.obj"))
+    write_meshes_as_obj(os.path.join(folder_path, "streamed.obj"), meshes, transformation)
+    assert read(os.path.join(folder_path, "joined.obj")) == read(os.path.join(folder_path, "streamed.obj"))
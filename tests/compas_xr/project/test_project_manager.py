@@ -1,8 +1,23 @@
+import os
 import tempfile
+import threading
 
 import pytest
 import json
+from compas.datastructures import Assembly
+from compas.datastructures import Part
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Step
 from compas_xr.project import ProjectManager
+from compas_xr.realtime_database import LocalRealtimeDatabase
+from compas_xr.realtime_database import DatabaseQuery
+from compas_xr.realtime_database import WriteQueue
+from fakes import MemoryDatabase
+from fakes import sqlite_required
+from fakes import write_local_config
 
 
 @pytest.fixture
@@ -19,6 +34,166 @@ def config_path():
     return config_path
 
 
+@pytest.fixture
+def local_config_path():
+    return write_local_config()
+
+
 def test_project_manager(config_path):
     pm = ProjectManager(config_path)
     assert pm is not None
+
+
+def project_steps():
+    steps = []
+    for i in range(12):
+        steps.append({"dtype": "compas_timber.planning/Step", "data": {"is_built": i < 5, "priority": i // 4, "actor": "ROBOT" if i % 2 else "HUMAN", "element_ids": [i]}})
+    return {"project": {"building_plan": {"data": {"steps": steps}}}}
+
+
+def test_edit_step_on_database_sends_one_partial_update(config_path):
+    pm = ProjectManager(config_path)
+    pm.database = MemoryDatabase(project_steps())
+    pm.edit_step_on_database("project", "3", "ROBOT", True, False, 2)
+
+    # A single write, after a shallow read of the step instead of a full one
+    assert pm.database.requests == ["SHALLOW", "PATCH"]
+    assert pm.database.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "3"]) == {
+        "dtype": "compas_timber.planning/Step",
+        "data": {"actor": "ROBOT", "is_built": True, "is_planned": False, "priority": 2, "element_ids": [3]},
+    }
+
+    # A missing step is not created without its dtype
+    pm.database.requests = []
+    with pytest.raises(Exception):
+        pm.edit_step_on_database("project", "12", "ROBOT", True, False, 2)
+    assert pm.database.requests == ["SHALLOW"]
+
+
+def test_edit_steps_on_database_groups_fields_per_step(config_path):
+    pm = ProjectManager(config_path)
+    pm.database = MemoryDatabase(project_steps())
+    report = pm.edit_steps_on_database("project", {1: {"actor": "HUMAN"}, "2": {"priority": 3, "is_planned": True}})
+
+    assert report.succeeded
+    assert sorted(report.updated) == ["1", "2"]
+    assert pm.database.requests == ["PATCH"]
+    assert json.loads(pm.database.sent[0]) == {"steps/1/data/actor": "HUMAN", "steps/2/data/priority": 3, "steps/2/data/is_planned": True}
+    steps = pm.database.get_data_from_deep_reference(["project", "building_plan", "data", "steps"])
+    assert steps[1]["data"] == {"is_built": True, "priority": 0, "actor": "HUMAN", "element_ids": [1]}
+    assert steps[2]["data"] == {"is_built": True, "priority": 3, "actor": "HUMAN", "is_planned": True, "element_ids": [2]}
+    assert steps[3]["data"]["actor"] == "ROBOT"
+
+
+def test_get_unbuilt_steps_from_database_queries_the_steps(config_path):
+    pm = ProjectManager(config_path)
+    pm.database = MemoryDatabase(project_steps())
+
+    assert list(pm.get_unbuilt_steps_from_database("project")) == [str(i) for i in range(5, 12)]
+    assert pm.database.queries[-1] == ({"orderBy": '"data/is_built"', "equalTo": "false"}, ["project", "building_plan", "data", "steps"])
+    assert list(pm.get_unbuilt_steps_from_database("project", priority=1)) == ["5", "6", "7"]
+    assert pm.database.queries[-1][0] == {"orderBy": '"data/priority"', "equalTo": "1"}
+    assert list(pm.get_next_priority_steps_from_database("project")) == ["5", "6", "7"]
+
+    robots = pm.query_steps_on_database("project", DatabaseQuery("data/actor", equal_to="ROBOT", limit_to_first=2))
+    assert list(robots) == ["1", "3"]
+
+
+@sqlite_required
+def test_project_manager_runs_on_local_backend(local_config_path):
+    pm = ProjectManager(local_config_path)
+    assert isinstance(pm.database, LocalRealtimeDatabase)
+
+    assembly = Assembly()
+    for i in range(4):
+        assembly.add_part(Part(name="part {}".format(i), frame=Frame(Point(i, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))))
+    building_plan = BuildingPlan([Step([part.key], actor="HUMAN", location=Frame.worldXY(), priority=part.key // 2) for part in assembly.parts()])
+    pm.upload_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], normalized=True)
+
+    objects = pm.get_project_objects("project")
+    assert sorted(objects["parts"]) == ["0", "1", "2", "3"]
+    pm.edit_step_on_database("project", "0", "ROBOT", True, False, 0)
+    assert list(pm.get_next_priority_steps_from_database("project")) == ["1"]
+    assert pm.get_project_data("project", lazy=True).building_plan.data.steps[0].data.actor == "ROBOT"
+
+    pm.upload_compas_object_to_storage(assembly, "assembly.json")
+    assert len(list(pm.get_assembly_from_storage("assembly.json").parts())) == 4
+
+
+@sqlite_required
+def test_project_manager_writes_to_replica(local_config_path):
+    remote = ProjectManager(local_config_path).database
+    pm = ProjectManager(local_config_path, replica_directory=os.path.join(os.path.dirname(local_config_path), "replica"), sync_interval=None)
+    assert pm.database.remote.file_path == remote.file_path
+
+    building_plan = BuildingPlan([Step(["0"], actor="HUMAN", location=Frame.worldXY())])
+    pm.upload_data_to_project(building_plan, "project", "building_plan")
+    pm.edit_step_on_database("project", "0", "ROBOT", True, False, 1)
+    with pytest.raises(Exception):
+        remote.get_data("project")
+    assert pm.get_project_data("project")["building_plan"]["data"]["steps"][0]["data"]["actor"] == "ROBOT"
+
+    assert pm.database.sync().succeeded
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "0", "data", "actor"]) == "ROBOT"
+
+
+@sqlite_required
+def test_project_manager_queues_writes(local_config_path):
+    remote = ProjectManager(local_config_path).database
+    pm = ProjectManager(local_config_path, write_window=60)
+    assert isinstance(pm.database, WriteQueue)
+
+    building_plan = BuildingPlan([Step([str(i)], actor="HUMAN", location=Frame.worldXY()) for i in range(3)])
+    pm.upload_data_to_project(building_plan, "project", "building_plan")
+    with pytest.raises(Exception):
+        remote.get_data("project")
+
+    # Checking the key of the first edit reads below the queued building plan, which flushes it
+    for i in range(3):
+        pm.edit_step_on_database("project", str(i), "ROBOT", True, False, i)
+    assert pm.write_queue.requests == 1
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "2", "data", "priority"]) == 0
+
+    # The key checks of the other edits read beside the queued edits, which stay queued
+    pm.write_queue.flush()
+    assert pm.write_queue.requests == 2
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "2", "data", "priority"]) == 2
+    assert list(pm.get_next_priority_steps_from_database("project")) == []
+
+    pm.write_queue.upload_data_to_deep_reference("2", ["project", "building_plan", "data", "LastBuiltIndex"])
+    report = pm.edit_steps_on_database("project", {"0": {"actor": "HUMAN"}})
+    assert report.updated == ["0"] and len(pm.write_queue) == 0
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "LastBuiltIndex"]) == "2"
+    pm.close()
+
+
+@sqlite_required
+def test_project_managers_of_a_configuration_share_the_write_queue(local_config_path):
+    remote = ProjectManager(local_config_path).database
+    threads = threading.active_count()
+    # Like a Grasshopper component, which creates a project manager on every solution
+    for i in range(3):
+        pm = ProjectManager(local_config_path, write_window=60)
+        pm.application_settings_writer("project", "folder_{}".format(i))
+    assert threading.active_count() == threads + 1
+    assert len(pm.write_queue) == 1
+
+    pm.close()
+    assert pm.write_queue.requests == 1
+    assert remote.get_data("ApplicationSettings")["storage_folder"] == "folder_2"
+    assert ProjectManager(local_config_path, write_window=60).write_queue is pm.write_queue
+
+
+@sqlite_required
+def test_project_manager_queues_writes_to_replica(local_config_path):
+    remote = ProjectManager(local_config_path).database
+    pm = ProjectManager(local_config_path, replica_directory=os.path.join(os.path.dirname(local_config_path), "replica"), sync_interval=60, write_window=60)
+    assert pm.database is pm.write_queue and pm.write_queue.database is pm.replica
+
+    pm.upload_data_to_project(BuildingPlan([Step(["0"], actor="HUMAN", location=Frame.worldXY())]), "project", "building_plan")
+    pm.write_queue.flush()
+    assert pm.replica.sync().succeeded
+    step = ["project", "building_plan", "data", "steps", "0"]
+    assert remote.get_data_from_deep_reference(step) == pm.replica.get_data_from_deep_reference(step)
+    pm.close()
+    assert pm.replica._thread is None
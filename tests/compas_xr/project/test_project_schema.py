@@ -0,0 +1,103 @@
+from compas.data import json_dumps
+from compas.datastructures import Assembly
+from compas.datastructures import Part
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import TButtJoint
+from compas_timber.parts import Beam
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Step
+from compas_xr.project import ProjectManager
+from compas_xr.project.project_schema import _decode
+from compas_xr.project.project_schema import project_objects_from_data
+from fakes import as_database
+
+
+def create_timber_project():
+    assembly = TimberAssembly()
+    beams = [Beam.from_endpoints(Point(0, 0, 0), Point(3, 0, 0), 0.1, 0.2), Beam.from_endpoints(Point(3, 0, 0), Point(3, 3, 0), 0.1, 0.2)]
+    for beam in beams:
+        assembly.add_beam(beam)
+    TButtJoint.create(assembly, beams[0], beams[1])
+    building_plan = BuildingPlan([Step([beam.key], actor="HUMAN", location=Frame.worldXY()) for beam in beams])
+    return assembly, building_plan
+
+
+def test_normalized_project_stores_parts_once_and_reads_back():
+    assembly, building_plan = create_timber_project()
+    pm = ProjectManager.__new__(ProjectManager)
+    default = pm.create_project_data_from_compas(assembly, building_plan, [Frame.worldXY()])
+    normalized = pm.create_project_data_from_compas(assembly, building_plan, [Frame.worldXY()], normalized=True)
+
+    assert normalized["schema"] == "normalized"
+    assert len(json_dumps(normalized["assembly"])) < len(json_dumps(default["assembly"])) / 2
+
+    for data in (default, normalized):
+        objects = project_objects_from_data(as_database(data))
+        read = objects["assembly"]
+        assert isinstance(read, TimberAssembly)
+        assert sorted(objects["beams"]) == ["0", "1"]
+        assert sorted(objects["joints"]) == ["2"]
+        assert objects["beams"]["0"] is read.graph.node[0]["part"]
+        assert objects["beams"]["1"].__data__ == assembly.beams[1].__data__
+        assert objects["joints"]["2"].beams == [objects["beams"]["0"], objects["beams"]["1"]]
+        assert len(objects["building_plan"].steps) == 2
+        assert len(objects["QRFrames"].graph.node) == 1
+
+    # Only the normalized schema keeps the edges, the database drops their empty attributes in the default one
+    assert sorted(project_objects_from_data(as_database(normalized))["assembly"].graph.edges()) == sorted(assembly.graph.edges())
+
+
+def test_normalized_assembly_project_reads_back_parts():
+    assembly = Assembly()
+    parts = [Part(name="part {}".format(i), frame=Frame(Point(i, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))) for i in range(3)]
+    for part in parts:
+        assembly.add_part(part)
+    assembly.add_connection(parts[0], parts[1])
+    building_plan = BuildingPlan([Step([part.key], actor="HUMAN", location=Frame.worldXY()) for part in parts])
+    pm = ProjectManager.__new__(ProjectManager)
+    normalized = pm.create_project_data_from_compas(assembly, building_plan, [Frame.worldXY()], normalized=True)
+
+    assert "parts" in normalized and "beams" not in normalized
+    assert normalized["assembly"]["graph"]["node"][0]["part"] == 0
+
+    objects = project_objects_from_data(as_database(normalized))
+    read = objects["assembly"]
+    assert type(read) is Assembly
+    assert "beams" not in objects and "joints" not in objects
+    assert sorted(objects["parts"]) == ["0", "1", "2"]
+    assert objects["parts"]["1"] is read.graph.node[1]["part"]
+    assert [part.attributes["name"] for part in read.parts()] == ["part 0", "part 1", "part 2"]
+    assert objects["parts"]["2"].frame.point == Point(2, 0, 0)
+    assert list(read.graph.edges()) == [(0, 1)]
+
+
+def test_project_reads_list_shaped_beams_and_steps():
+    assembly, _ = create_timber_project()
+    building_plan = BuildingPlan([Step([i % 2], actor="HUMAN", location=Frame.worldXY(), priority=i) for i in range(12)])
+    pm = ProjectManager.__new__(ProjectManager)
+    data = as_database(pm.create_project_data_from_compas(assembly, building_plan, [Frame.worldXY()], normalized=True))
+    # A deleted step leaves a hole in the array returned by the database
+    data["building_plan"]["data"]["steps"][4] = None
+
+    assert isinstance(data["beams"], list)
+    assert isinstance(data["building_plan"]["data"]["steps"], list)
+    objects = project_objects_from_data(data)
+    assert sorted(objects["beams"]) == ["0", "1"]
+    assert [step.priority for step in objects["building_plan"].steps] == [0, 1, 2, 3, 5, 6, 7, 8, 9, 10, 11]
+    assert objects["building_plan"].steps[-1].element_ids == [1]
+
+
+def test_database_decoder_restores_dropped_none_values():
+    part = Part(name="part", frame=Frame(Point(1, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0)))
+    data = as_database({"parts": [part, Part()]})
+    assert "key" not in data["parts"][0]["data"]
+    assert "features" not in data["parts"][0]["data"]
+
+    parts = _decode(data)["parts"]
+    assert parts[0].key is None
+    assert parts[0].attributes["name"] == "part"
+    assert parts[0].frame.point == Point(1, 0, 0)
+    assert isinstance(parts[1], Part)
@@ -0,0 +1,69 @@
+import tempfile
+
+from compas.datastructures import Assembly
+from compas.datastructures import Mesh
+from compas.datastructures import Part
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Step
+from compas_xr.project import ProjectManager
+from compas_xr.project.project_snapshot import diff_trees
+from fakes import MemoryDatabase
+
+
+def test_diff_trees():
+    old = {"a": {"b": 1, "c": [1, 2, 3]}, "d": "x", "e": {"f": 1}}
+    new = {"a": {"b": 1, "c": [1, 5, 3]}, "d": "y", "g": {"h": True}}
+    assert diff_trees(old, new) == {"a/c/1": 5, "d": "y", "e": None, "g": {"h": True}}
+    assert diff_trees(new, new) == {}
+
+
+def create_assembly():
+    assembly = Assembly()
+    for i in range(20):
+        frame = Frame(Point(i, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))
+        assembly.add_part(Part(name="part {}".format(i), frame=frame, shape=Mesh.from_shape(Box(1.0, 1.0, 1.0, frame=frame))))
+    building_plan = BuildingPlan([Step([part.key], actor="HUMAN", location=Frame.worldXY()) for part in assembly.parts()])
+    return assembly, building_plan
+
+
+def test_publish_sends_only_changed_paths():
+    assembly, building_plan = create_assembly()
+    snapshot_directory = tempfile.mkdtemp()
+
+    pm = ProjectManager.__new__(ProjectManager)
+    pm.database = MemoryDatabase()
+    pm.database_url = "https://first.firebaseio.com"
+    assert pm.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) is None
+    assert pm.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) == {}
+
+    building_plan.steps[7].is_built = True
+    updates = pm.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory)
+    assert updates == {"building_plan/data/steps/7/data/is_built": True}
+    assert len(pm.database.sent[-1]) < len(pm.database.sent[0]) / 100
+    assert pm.database.get_data_from_deep_reference(["project", "building_plan", "data", "steps", 7, "data", "is_built"]) is True
+
+
+def test_publish_uploads_projects_missing_in_the_database():
+    assembly, building_plan = create_assembly()
+    snapshot_directory = tempfile.mkdtemp()
+    first = ProjectManager.__new__(ProjectManager)
+    first.database = MemoryDatabase()
+    first.database_url = "https://first.firebaseio.com"
+    second = ProjectManager.__new__(ProjectManager)
+    second.database = MemoryDatabase()
+    second.database_url = "https://second.firebaseio.com"
+
+    assert first.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) is None
+    # The snapshot of the first database does not apply to the project of the same name in the second database
+    assert second.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) is None
+    assert sorted(second.database.root["project"]) == sorted(first.database.root["project"])
+
+    first.database.delete_data_from_deep_reference(["project", "QRFrames"])
+    assert first.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) is None
+    first.database.delete_data_from_deep_reference(["project"])
+    assert first.publish_project_data_from_compas("project", assembly, building_plan, [Frame.worldXY()], snapshot_directory=snapshot_directory) is None
+    assert sorted(first.database.root["project"]) == sorted(second.database.root["project"])
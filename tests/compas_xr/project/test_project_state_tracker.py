@@ -0,0 +1,80 @@
+import json
+import tempfile
+
+import pytest
+from compas.datastructures import Graph
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas_xr.project import ProjectManager
+from compas_xr.project import ProjectStateTracker
+from compas_xr.realtime_database import DatabaseMirror
+from fakes import MemoryDatabase
+
+
+class FakeAssembly(object):
+    def __init__(self, count):
+        self.graph = Graph()
+        for key in range(count):
+            self.graph.add_node(key, part="part {}".format(key))
+
+
+def step(index, actor="HUMAN", is_built=False):
+    location = Frame(Point(index, 0, 0), [1, 0, 0], [0, 1, 0])
+    data = {"element_ids": [index], "actor": actor, "is_built": is_built, "is_planned": False, "location": location.__data__, "priority": 0}
+    return {"dtype": "compas_timber.planning/Step", "data": data, "guid": str(index)}
+
+
+@pytest.fixture
+def project_manager():
+    config_path = tempfile.mktemp(suffix=".json", prefix="config_compas_xr")
+    with open(config_path, "w+") as config_file:
+        json.dump({"apiKey": "x", "authDomain": "x.firebaseapp.com", "databaseURL": "https://x.firebasedatabase.app", "storageBucket": "x.appspot.com"}, config_file)
+    return ProjectManager(config_path)
+
+
+def assert_same_state(state, expected):
+    assert state[0] == expected[0]
+    assert [frame.point for frame in state[1]] == [frame.point for frame in expected[1]]
+    assert list(state[2:]) == list(expected[2:])
+
+
+def test_tracker_matches_visualize_project_state(project_manager):
+    assembly = FakeAssembly(50)
+    data = {"LastBuiltIndex": "3", "steps": [step(i, "ROBOT" if i % 3 else "HUMAN", i < 4) for i in range(50)]}
+    project_manager.database = MemoryDatabase({"project": {"building_plan": {"data": data}}})
+    tracker = ProjectStateTracker(assembly)
+
+    state = project_manager.visualize_project_state(assembly, "project", tracker=tracker)
+    assert_same_state(state, project_manager.visualize_project_state(assembly, "project"))
+
+    data["LastBuiltIndex"] = "10"
+    data["steps"][10] = step(10, "ROBOT", True)
+    data["steps"][20] = step(20, "HUMAN", False)
+    data["steps"].pop()
+    project_manager.database.upload_data_to_deep_reference(data, ["project", "building_plan", "data"])
+    state = project_manager.visualize_project_state(assembly, "project", tracker=tracker)
+    assert_same_state(state, project_manager.visualize_project_state(assembly, "project"))
+    assert state[0] == "10"
+    assert len(state[1]) == 49
+
+
+def test_tracker_only_applies_changed_steps_from_mirror():
+    mirror = DatabaseMirror(MemoryDatabase(), ["project", "building_plan", "data"])
+    mirror.apply_event("put", "/", {"LastBuiltIndex": "0", "steps": [step(i) for i in range(1000)]})
+    reads = []
+    get_data = mirror.get_data
+    mirror.get_data = lambda path=None: reads.append(path) or get_data(path)
+
+    tracker = ProjectStateTracker(FakeAssembly(1000), mirror=mirror)
+    tracker.on_change([["steps", "0", "data", "is_built"]])
+    assert len(tracker.refresh()[3]) == 1000
+
+    del reads[:]
+    mirror.apply_event("put", "/steps/500", step(500, "ROBOT", True))
+    tracker.on_change([["steps", "500", "data", "actor"], ["steps", "500", "data", "is_built"]])
+    last_built_index, locations, built_human, unbuilt_human, built_robot, unbuilt_robot = tracker.refresh()
+    assert reads == [["LastBuiltIndex"], ["steps", "500"]]
+    assert built_robot == ["part 500"]
+    assert len(unbuilt_human) == 999
+    assert unbuilt_human[499:501] == ["part 499", "part 501"]
+    assert locations[500].point == Point(500, 0, 0)
@@ -0,0 +1,42 @@
+from compas_xr.realtime_database import DatabaseMirror
+from fakes import MemoryDatabase
+
+
+def test_mirror_applies_put_and_patch_events():
+    changes = []
+    database = MemoryDatabase()
+    mirror = DatabaseMirror(database, ["project", "building_plan", "data"], callback=changes.append).start()
+    send = database.streams[0].send
+    assert database.streams[0].database_reference == ["project", "building_plan", "data"]
+    assert not mirror.wait_until_synced(0)
+
+    send("put", "/", {"LastBuiltIndex": "0", "steps": {"0": {"data": {"is_built": True}}, "1": {"data": {"is_built": False}}}})
+    assert mirror.wait_until_synced(0)
+    assert sorted(changes.pop()) == [["LastBuiltIndex"], ["steps", "0", "data", "is_built"], ["steps", "1", "data", "is_built"]]
+
+    send("patch", "/steps/1/data", {"is_built": True, "actor": "ROBOT"})
+    assert sorted(changes.pop()) == [["steps", "1", "data", "actor"], ["steps", "1", "data", "is_built"]]
+    send("put", "/LastBuiltIndex", "1")
+    assert changes.pop() == [["LastBuiltIndex"]]
+    send("put", "/steps/0", None)
+    assert changes.pop() == [["steps", "0", "data", "is_built"]]
+
+    send("put", "/LastBuiltIndex", "1")
+    assert not changes
+    assert mirror.get_data() == {"LastBuiltIndex": "1", "steps": {"1": {"data": {"is_built": True, "actor": "ROBOT"}}}}
+    assert mirror.get_data(["steps", "1", "data", "actor"]) == "ROBOT"
+    assert mirror.get_data(["steps", "0"]) is None
+    mirror.close()
+    assert not database.streams
+
+
+def test_mirror_updates_lists_like_firebase_arrays():
+    changes = []
+    mirror = DatabaseMirror(MemoryDatabase(), ["project"], callback=changes.append)
+    mirror.apply_event("put", "/", {"steps": [{"data": {"is_built": False}}, {"data": {"is_built": False}}]})
+    mirror.apply_event("patch", "/steps/1/data", {"is_built": True})
+    assert changes[-1] == [["steps", "1", "data", "is_built"]]
+    mirror.apply_event("put", "/steps/2", {"data": {"is_built": True}})
+    assert mirror.get_data(["steps", "2", "data", "is_built"]) is True
+    mirror.apply_event("put", "/steps/name", "wall")
+    assert mirror.get_data(["steps"]) == {"0": {"data": {"is_built": False}}, "1": {"data": {"is_built": True}}, "2": {"data": {"is_built": True}}, "name": "wall"}
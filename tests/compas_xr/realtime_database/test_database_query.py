@@ -0,0 +1,46 @@
+import pytest
+
+from compas_xr.realtime_database import DatabaseQuery
+from compas_xr.realtime_database.database_query import query_url
+
+
+def test_query_parameters_are_json_encoded():
+    query = DatabaseQuery("data/priority", start_at=1, end_at=2, limit_to_first=10)
+    assert query.parameters() == {"orderBy": '"data/priority"', "startAt": "1", "endAt": "2", "limitToFirst": "10"}
+    assert DatabaseQuery("$key", equal_to="3").parameters() == {"orderBy": '"$key"', "equalTo": '"3"'}
+    assert query_url("https://x/steps.json", {"orderBy": '"$key"'}) == "https://x/steps.json?orderBy=%22%24key%22"
+    assert query_url("https://x/steps.json?auth=t", {"limitToLast": "1"}) == "https://x/steps.json?auth=t&limitToLast=1"
+    assert query_url("https://x/steps.json?", {}) == "https://x/steps.json?"
+
+
+def test_query_rejects_invalid_combinations():
+    with pytest.raises(Exception):
+        DatabaseQuery("data/priority", equal_to=1, start_at=0)
+    with pytest.raises(Exception):
+        DatabaseQuery("data/priority", limit_to_first=1, limit_to_last=1)
+    with pytest.raises(Exception):
+        DatabaseQuery("$key", start_at=1)
+
+
+def test_evaluate_orders_like_the_database():
+    data = {
+        "a": {"value": "b"},
+        "b": {"value": 2},
+        "c": {"value": True},
+        "d": {},
+        "e": {"value": False},
+        "f": {"value": 1.5},
+        "g": {"value": "a"},
+        "h": {"value": {"x": 1}},
+    }
+    assert list(DatabaseQuery("value").evaluate(data)) == ["d", "e", "c", "f", "b", "g", "a", "h"]
+    assert list(DatabaseQuery("value", start_at=1, end_at="a").evaluate(data)) == ["f", "b", "g"]
+    assert list(DatabaseQuery("value", equal_to=False).evaluate(data)) == ["e"]
+    assert list(DatabaseQuery("value", limit_to_last=2).evaluate(data)) == ["a", "h"]
+
+
+def test_evaluate_orders_keys_numerically_first():
+    data = ["a", None, "c"] + ["x"] * 8
+    assert list(DatabaseQuery("$key", limit_to_first=3).evaluate(data)) == ["0", "2", "3"]
+    assert list(DatabaseQuery("$key", start_at="9").evaluate(dict(data=1, **dict((str(i), i) for i in range(8, 12))))) == ["9", "10", "11", "data"]
+    assert list(DatabaseQuery("$value", end_at="a").evaluate(data)) == ["0"]
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from compas_xr.realtime_database import DatabaseView
+from fakes import MemoryDatabase
+
+
+def project():
+    steps = [{"data": {"is_built": i % 2 == 0, "actor": "HUMAN", "location": {"point": [float(i)] * 3}}} for i in range(500)]
+    return {
+        "project": {
+            "beams": dict((str(i), {"dtype": "compas_timber.elements/Beam", "data": {"width": 0.1, "height": 0.2}}) for i in range(500)),
+            "building_plan": {"dtype": "compas_timber.planning/BuildingPlan", "data": {"LastBuiltIndex": "12", "steps": steps}},
+            "flags": {"locked": True},
+        }
+    }
+
+
+def test_view_reads_small_fields_without_downloading_the_project():
+    database = MemoryDatabase(project())
+    view = database.view_deep_reference(["project"])
+
+    assert view.building_plan.data.LastBuiltIndex == "12"
+    assert database.requests == ["SHALLOW", "SHALLOW", "SHALLOW"]
+    assert database.received_bytes < 250
+    assert database.received_bytes * 100 < len(json.dumps(database.root))
+
+    # Everything read is memoized
+    assert view["building_plan"]["data"]["LastBuiltIndex"] == "12"
+    assert len(database.requests) == 3
+
+
+def test_view_tells_booleans_from_truncated_objects():
+    database = MemoryDatabase(project())
+    view = DatabaseView(database, ["project"])
+    assert view.flags.locked is True
+    assert isinstance(view.flags, DatabaseView)
+    assert view.building_plan.data.steps[1].data.is_built is False
+    assert view.building_plan.data.steps[2]["data"]["is_built"] is True
+
+
+def test_view_lists_keys_and_loads_subtrees():
+    database = MemoryDatabase(project())
+    view = DatabaseView(database, ["project"])
+    assert sorted(view.keys()) == ["beams", "building_plan", "flags"]
+    assert "beams" in view and "parts" not in view
+    assert view.get("parts") is None
+    with pytest.raises(AttributeError):
+        view.parts
+
+    beams = view.beams.to_data()
+    assert len(beams) == 500
+    requests = len(database.requests)
+    assert view.beams["3"].data.width == 0.1
+    assert view.beams["3"].to_data() == beams[3]
+    assert len(database.requests) == requests
+
+    view.refresh()
+    database.root["project"]["building_plan"]["data"]["LastBuiltIndex"] = "13"
+    assert view.building_plan.data.LastBuiltIndex == "13"
+
+
+def test_view_of_missing_location_raises():
+    view = DatabaseView(MemoryDatabase(project()), ["other"])
+    with pytest.raises(Exception):
+        view.keys()
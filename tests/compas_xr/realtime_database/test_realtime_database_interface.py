@@ -0,0 +1,55 @@
+from fakes import MemoryDatabase
+
+
+def test_update_data_at_paths_writes_only_given_paths():
+    database = MemoryDatabase()
+    database.upload_data_to_deep_reference({"steps": {"0": {"data": {"actor": "HUMAN", "device_id": "A"}}}}, ["project", "building_plan"])
+
+    updates = {"steps/0/data/actor": "ROBOT", ("steps", 1, "data", "priority"): 2}
+    database.update_data_at_paths(updates, ["project", "building_plan"])
+
+    steps = database.get_data_from_deep_reference(["project", "building_plan", "steps"])
+    assert steps[0]["data"] == {"actor": "ROBOT", "device_id": "A"}
+    assert steps[1]["data"] == {"priority": 2}
+    assert database.requests == ["PUT", "PATCH", "GET"]
+
+
+def test_update_data_at_paths_deletes_none_values():
+    database = MemoryDatabase()
+    database.upload_data_to_deep_reference({"a": 1, "b": 2}, ["project"])
+    database.update_data_at_paths({"/b": None}, ["project"])
+    database.update_data_at_paths({}, ["project"])
+    assert database.get_data_from_deep_reference(["project"]) == {"a": 1}
+    assert database.requests.count("PATCH") == 1
+
+
+class FailingDatabase(MemoryDatabase):
+    def update_data_in_reference(self, updates, database_reference):
+        if "steps/13/data/priority" in updates:
+            raise Exception("write refused")
+        MemoryDatabase.update_data_in_reference(self, updates, database_reference)
+
+
+def test_update_data_at_paths_in_batches_chunks_requests():
+    database = MemoryDatabase()
+    grouped_updates = dict((str(i), {"steps/{}/data/actor".format(i): "ROBOT", "steps/{}/data/priority".format(i): i}) for i in range(1000))
+    report = database.update_data_at_paths_in_batches(grouped_updates, ["project", "building_plan", "data"], max_request_size=4096)
+
+    assert report.succeeded
+    assert sorted(report.updated, key=int) == [str(i) for i in range(1000)]
+    assert 10 < report.requests < 50
+    assert database.requests.count("PATCH") == report.requests
+    steps = database.root["project"]["building_plan"]["data"]["steps"]
+    assert steps["999"]["data"] == {"actor": "ROBOT", "priority": 999}
+
+
+def test_update_data_at_paths_in_batches_reports_failed_groups():
+    database = FailingDatabase()
+    grouped_updates = dict((str(i), {("steps", i, "data", "priority"): i}) for i in range(20))
+    report = database.update_data_at_paths_in_batches(grouped_updates, ["project"], max_request_size=100)
+
+    assert not report.succeeded
+    assert "13" in report.failed
+    assert "write refused" in report.failed["13"]
+    assert len(report.updated) + len(report.failed) == 20
+    assert "13" not in database.root["project"]["steps"]
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from compas_xr.realtime_database import DatabaseMirror
+from compas_xr.realtime_database import DatabaseQuery
+from compas_xr.realtime_database import LocalRealtimeDatabase
+from fakes import sqlite_required
+from fakes import write_local_config
+
+
+@pytest.fixture
+def database():
+    return LocalRealtimeDatabase(write_local_config(localPath="data"))
+
+
+@sqlite_required
+def test_local_database_stores_data_like_firebase(database):
+    database.upload_data({"steps": [{"is_built": False}, {"is_built": True}], "empty": {}, "none": None, "name": "a"}, "project")
+    assert os.path.exists(os.path.join(os.path.dirname(database.config_path), "data", "database.sqlite"))
+    assert database.get_data("project") == {"steps": [{"is_built": False}, {"is_built": True}], "name": "a"}
+    assert database.get_data_from_deep_reference(["project", "steps", 1]) == {"is_built": True}
+    assert database.get_data_from_deep_reference(["project/steps/1/is_built"]) is True
+
+    database.upload_data_to_deep_reference({"5": "x", "7": "y"}, ["other", "sparse"])
+    assert database.get_data_from_deep_reference(["other", "sparse"]) == {"5": "x", "7": "y"}
+    database.upload_data_to_deep_reference("value", ["other", "sparse", "5", "child"])
+    assert database.get_data_from_deep_reference(["other", "sparse", "5"]) == {"child": "value"}
+
+    database.delete_data_from_deep_reference(["project", "steps"])
+    database.delete_data_from_child_reference("project", "name")
+    with pytest.raises(Exception):
+        database.get_data("project")
+    with pytest.raises(Exception):
+        database.upload_data({"a.b": 1}, "project")
+
+
+@sqlite_required
+def test_local_database_updates_paths_atomically(database):
+    database.upload_data({"data": {"steps": {"0": {"actor": "HUMAN", "priority": 1}}}}, "project")
+    database.update_data_at_paths({"steps/0/actor": "ROBOT", "steps/1/priority": 2, "steps/0/priority": None}, ["project", "data"])
+    assert database.get_data_from_deep_reference(["project", "data", "steps"]) == [{"actor": "ROBOT"}, {"priority": 2}]
+
+    with pytest.raises(Exception):
+        database.update_data_at_paths({"steps/0": {}, "steps/0/actor": "HUMAN"}, ["project", "data"])
+    assert database.get_data_from_deep_reference(["project", "data", "steps", "0", "actor"]) == "ROBOT"
+
+
+@sqlite_required
+def test_local_database_shallow_queries_and_views(database):
+    steps = [{"data": {"is_built": i < 3, "priority": i // 2}} for i in range(6)]
+    database.upload_data({"building_plan": {"data": {"LastBuiltIndex": "2", "steps": steps}}}, "project")
+
+    assert database.get_shallow_data_from_deep_reference(["project", "building_plan", "data"]) == {"LastBuiltIndex": "2", "steps": True}
+    assert database.get_shallow_data_from_deep_reference(["project", "missing"]) is None
+    assert database.view_deep_reference(["project"]).building_plan.data.steps[4].data.priority == 2
+
+    unbuilt = database.query_data_from_deep_reference(DatabaseQuery("data/is_built", equal_to=False), ["project", "building_plan", "data", "steps"])
+    assert list(unbuilt) == ["3", "4", "5"]
+
+
+@sqlite_required
+def test_local_database_shallow_queries_keep_keys_sorting_before_children(database):
+    database.upload_data({"a": 1, "a-b": {"c": 2}, "a b": 3, "a!": {"d": 4}, "c": {"e": 5}, "c,d": 6}, "project")
+
+    shallow = {"a": 1, "a-b": True, "a b": 3, "a!": True, "c": True, "c,d": 6}
+    assert database.get_shallow_data_from_deep_reference(["project"]) == shallow
+    assert sorted(database.view_deep_reference(["project"]).keys()) == sorted(shallow)
+
+
+@sqlite_required
+def test_local_database_streams_changes(database):
+    database.upload_data({"data": {"LastBuiltIndex": "0"}}, "project")
+    changes = []
+    mirror = DatabaseMirror(database, ["project", "data"], callback=changes.append).start()
+    assert mirror.get_data() == {"LastBuiltIndex": "0"}
+
+    database.update_data_at_paths({"LastBuiltIndex": "1", "steps/0/is_built": True}, ["project", "data"])
+    assert mirror.get_data() == {"LastBuiltIndex": "1", "steps": {"0": {"is_built": True}}}
+    database.upload_data({"data": {"LastBuiltIndex": "5"}}, "project")
+    assert mirror.get_data() == {"LastBuiltIndex": "5"}
+
+    mirror.close()
+    database.upload_data({"data": {"LastBuiltIndex": "6"}}, "project")
+    assert mirror.get_data() == {"LastBuiltIndex": "5"}
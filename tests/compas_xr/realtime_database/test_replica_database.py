@@ -0,0 +1,191 @@
+import os
+import tempfile
+import time
+
+import pytest
+from compas_xr.realtime_database import LocalRealtimeDatabase
+from compas_xr.realtime_database import ReplicaDatabase
+from fakes import sqlite_required
+
+
+class FlakyDatabase(LocalRealtimeDatabase):
+    online = True
+    requests = 0
+
+    def _check(self):
+        if not self.online:
+            raise Exception("No connection")
+        self.requests += 1
+
+    def get_data_from_reference(self, database_reference):
+        self._check()
+        return LocalRealtimeDatabase.get_data_from_reference(self, database_reference)
+
+    def get_shallow_data_from_reference(self, database_reference):
+        self._check()
+        return LocalRealtimeDatabase.get_shallow_data_from_reference(self, database_reference)
+
+    def update_data_in_reference(self, updates, database_reference):
+        self._check()
+        LocalRealtimeDatabase.update_data_in_reference(self, updates, database_reference)
+
+    def upload_data_to_reference(self, data, database_reference):
+        self._check()
+        LocalRealtimeDatabase.upload_data_to_reference(self, data, database_reference)
+
+
+def project():
+    steps = [{"dtype": "compas_timber.planning/Step", "data": {"actor": "HUMAN", "is_built": False, "priority": i}} for i in range(4)]
+    return {"building_plan": {"dtype": "compas_timber.planning/BuildingPlan", "data": {"LastBuiltIndex": "0", "steps": steps}}, "QRFrames": {"a": 1}}
+
+
+def setup():
+    directory = tempfile.mkdtemp()
+    remote = FlakyDatabase.from_file(os.path.join(directory, "remote.sqlite"))
+    remote.upload_data(project(), "project")
+    return remote, ReplicaDatabase(remote, os.path.join(directory, "a")), ReplicaDatabase(remote, os.path.join(directory, "b"))
+
+
+@sqlite_required
+def test_replica_reads_and_writes_offline():
+    remote, replica, _ = setup()
+    assert replica.get_data_from_deep_reference(["project", "QRFrames"]) == {"a": 1}
+
+    remote.online = False
+    requests = remote.requests
+    replica.update_data_at_paths({"steps/1/data/is_built": True, "steps/1/data/actor": "ROBOT", "LastBuiltIndex": "1"}, ["project", "building_plan", "data"])
+    replica.update_data_at_paths({"steps/1/data/actor": "HUMAN"}, ["project", "building_plan", "data"])
+    assert replica.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "1", "data", "actor"]) == "HUMAN"
+    assert sorted(replica.pending) == [
+        "project/building_plan/data/LastBuiltIndex",
+        "project/building_plan/data/steps/1/data/actor",
+        "project/building_plan/data/steps/1/data/is_built",
+    ]
+    assert remote.requests == requests
+    assert not replica.sync().succeeded
+    assert replica.online is False
+
+    remote.online = True
+    report = replica.sync()
+    assert report.succeeded and len(report.pushed) == 3
+    assert not replica.pending
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "1", "data"]) == {"actor": "HUMAN", "is_built": True, "priority": 1}
+    assert remote.get_data_from_deep_reference(["project", "sync", "steps", "1"]) > 0
+
+
+@sqlite_required
+def test_replica_pulls_projects_read_offline_once_online():
+    remote, replica, _ = setup()
+    remote.online = False
+    with pytest.raises(Exception):
+        replica.get_data("project")
+    assert replica.projects == []
+    assert not replica.sync().succeeded
+
+    remote.online = True
+    report = replica.sync()
+    assert report.succeeded and "project/building_plan" in report.pulled
+    assert replica.get_data("project")["QRFrames"] == {"a": 1}
+    assert replica.projects == ["project"]
+    replica.close()
+
+
+@sqlite_required
+def test_replica_pulls_remote_changes_and_keeps_pending_state():
+    remote, replica, _ = setup()
+    replica.replicate("project")
+    remote.update_data_at_paths({"LastBuiltIndex": "2", "steps/2/data/is_built": True}, ["project", "building_plan", "data"])
+    report = replica.sync()
+    assert sorted(report.pulled) == ["project/building_plan/data/LastBuiltIndex", "project/building_plan/data/steps/2"]
+    assert replica.get_data_from_deep_reference(["project", "building_plan", "data", "LastBuiltIndex"]) == "2"
+
+    remote.online = False
+    replica.delete_data_from_deep_reference(["project", "QRFrames"])
+    reopened = ReplicaDatabase(remote, os.path.dirname(replica.state_path))
+    assert reopened.pending == replica.pending and reopened.projects == ["project"]
+    remote.online = True
+    reopened.sync()
+    assert remote.get_data_from_deep_reference(["project"]).get("QRFrames") is None
+
+
+@sqlite_required
+def test_replica_resolves_step_conflicts_by_last_writer():
+    remote, first, second = setup()
+    first.replicate("project")
+    second.replicate("project")
+
+    first.update_data_at_paths({"steps/0/data/actor": "ROBOT", "steps/3/data/actor": "ROBOT"}, ["project", "building_plan", "data"])
+    second.update_data_at_paths({"steps/0/data/actor": "HUMAN_2"}, ["project", "building_plan", "data"])
+    # The later change of the second replica wins, even though the first replica pushes last
+    first._pending["project/building_plan/data/steps/0/data/actor"] -= 1000
+    assert second.sync().succeeded
+    report = first.sync()
+    assert report.discarded == ["project/building_plan/data/steps/0/data/actor"]
+    assert report.pushed == ["project/building_plan/data/steps/3/data/actor"]
+
+    steps = remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps"])
+    assert [step["data"]["actor"] for step in steps] == ["HUMAN_2", "HUMAN", "HUMAN", "ROBOT"]
+    assert first.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "0", "data", "actor"]) == "HUMAN_2"
+    assert second.sync().pulled == ["project/building_plan/data/steps/3"]
+
+
+@sqlite_required
+def test_replica_syncs_in_background():
+    remote, replica, _ = setup()
+    replica.replicate("project")
+    replica.start(interval=0.01)
+    replica.upload_data_to_deep_reference("3", ["project", "building_plan", "data", "LastBuiltIndex"])
+    for _ in range(500):
+        if not replica.pending:
+            break
+        time.sleep(0.01)
+    replica.close()
+    assert remote.get_data_from_deep_reference(["project", "building_plan", "data", "LastBuiltIndex"]) == "3"
+
+
+@sqlite_required
+def test_replica_keeps_sync_data_out_of_settings():
+    remote, replica, _ = setup()
+    settings = {"project_name": "project", "storage_folder": "None", "z_to_y_remap": False}
+    replica.upload_data(settings, "ApplicationSettings")
+    assert replica.get_data("ApplicationSettings") == settings
+    assert replica.projects == []
+
+    assert replica.sync().succeeded
+    assert remote.get_data("ApplicationSettings") == settings
+    assert remote.get_shallow_data_from_deep_reference(["ReplicaClocks"]) is None
+    assert replica.get_data_from_deep_reference(["project", "QRFrames"]) == {"a": 1}
+    assert replica.projects == ["project"]
+
+
+@sqlite_required
+def test_replica_keeps_later_unstamped_remote_changes():
+    remote, replica, _ = setup()
+    replica.replicate("project")
+    replica.update_data_at_paths({"steps/1/data/actor": "ROBOT", "steps/2/data/actor": "ROBOT"}, ["project", "building_plan", "data"])
+    # A later change of a writer that does not stamp its changes, like the app marking a step as built
+    remote.update_data_at_paths({"steps/1/data/actor": "HUMAN_2"}, ["project", "building_plan", "data"])
+
+    report = replica.sync()
+    assert report.discarded == ["project/building_plan/data/steps/1/data/actor"]
+    assert report.pushed == ["project/building_plan/data/steps/2/data/actor"]
+    steps = remote.get_data_from_deep_reference(["project", "building_plan", "data", "steps"])
+    assert [step["data"]["actor"] for step in steps] == ["HUMAN", "HUMAN_2", "ROBOT", "HUMAN"]
+    assert replica.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "1", "data", "actor"]) == "HUMAN_2"
+    assert not replica.sync().pulled
+
+
+@sqlite_required
+def test_replica_pulls_only_changed_steps():
+    remote, replica, _ = setup()
+    replica.replicate("project")
+    assert replica.sync().succeeded
+    requests = remote.requests
+    assert replica.sync().succeeded
+    assert remote.requests == requests
+
+    remote.update_data_at_paths({"steps/3/data/is_built": True}, ["project", "building_plan", "data"])
+    requests = remote.requests
+    assert replica.sync().pulled == ["project/building_plan/data/steps/3"]
+    assert remote.requests == requests
+    replica.close()
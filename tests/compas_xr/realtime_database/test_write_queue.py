@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from compas_xr.realtime_database import LocalRealtimeDatabase
+from compas_xr.realtime_database import WriteQueue
+from fakes import sqlite_required
+
+
+class CountingDatabase(LocalRealtimeDatabase):
+    online = True
+    requests = 0
+
+    def _send(self):
+        if not self.online:
+            raise Exception("No connection")
+        self.requests += 1
+
+    def update_data_in_reference(self, updates, database_reference):
+        self._send()
+        LocalRealtimeDatabase.update_data_in_reference(self, updates, database_reference)
+
+    def upload_data_to_reference(self, data, database_reference):
+        self._send()
+        LocalRealtimeDatabase.upload_data_to_reference(self, data, database_reference)
+
+
+def counting_database():
+    return CountingDatabase.from_file(os.path.join(tempfile.mkdtemp(), "database.sqlite"))
+
+
+@sqlite_required
+def test_write_queue_coalesces_writes_into_one_update():
+    database = counting_database()
+    queue = WriteQueue(database, window=60)
+    for i in range(100):
+        queue.upload_data({"project_name": "project", "storage_folder": "folder", "z_to_y_remap": i % 2 == 0}, "ApplicationSettings")
+        queue.upload_data_to_deep_reference(str(i), ["project", "building_plan", "data", "LastBuiltIndex"])
+    queue.update_data_at_paths({"steps/0/actor": "ROBOT", "steps/1/actor": "HUMAN"}, ["project", "building_plan", "data"])
+    queue.delete_data_from_deep_reference(["project", "building_plan", "data", "steps", "1"])
+    assert len(queue) == 4 and queue.writes == 203 and database.requests == 0
+
+    assert queue.flush() == 4
+    assert database.requests == 2
+    assert database.get_data("ApplicationSettings")["z_to_y_remap"] is False
+    assert database.get_data("project") == {"building_plan": {"data": {"LastBuiltIndex": "99", "steps": [{"actor": "ROBOT"}]}}}
+
+    queue.upload_data_to_deep_reference({"data": {"steps": [{"actor": "HUMAN"}]}}, ["project", "building_plan"])
+    queue.upload_data_to_deep_reference(True, ["project", "building_plan", "data", "steps", "0", "is_built"])
+    assert len(queue) == 1
+    # Reads include the queued writes
+    assert queue.get_data_from_deep_reference(["project", "building_plan", "data", "steps", "0"]) == {"actor": "HUMAN", "is_built": True}
+    queue.close()
+
+
+@sqlite_required
+def test_write_queue_sends_after_the_window():
+    database = counting_database()
+    queue = WriteQueue(database, window=0.05)
+    queue.upload_data_to_deep_reference("1", ["project", "LastBuiltIndex"])
+    for _ in range(200):
+        if database.requests:
+            break
+        time.sleep(0.01)
+    assert database.get_data_from_deep_reference(["project", "LastBuiltIndex"]) == "1"
+    queue.close()
+
+
+@sqlite_required
+def test_write_queue_keeps_failed_writes_and_applies_backpressure():
+    database = counting_database()
+    database.online = False
+    queue = WriteQueue(database, window=60, max_size=2, timeout=0.5)
+    queue.upload_data_to_deep_reference({"a": 1, "b": 2}, ["project", "values"])
+    with pytest.raises(Exception):
+        queue.flush()
+    queue.upload_data_to_deep_reference(3, ["project", "values", "b"])
+    queue.upload_data_to_deep_reference("x", ["other"])
+    assert len(queue) == 2
+    with pytest.raises(Exception):
+        queue.upload_data_to_deep_reference("y", ["third"])
+
+    database.online = True
+    writer = threading.Thread(target=queue.upload_data_to_deep_reference, args=("y", ["third"]))
+    writer.start()
+    writer.join()
+    queue.flush()
+    assert database.get_data("project") == {"values": {"a": 1, "b": 3}}
+    assert database.get_data("other") == "x" and database.get_data("third") == "y"
+    queue.close()
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+
+from compas.geometry import Frame
+from compas_xr.storage import StorageCache
+
+URL = "https://firebasestorage.googleapis.com/v0/b/x123.appspot.com/o/assembly.json?alt=media&token=abc"
+
+
+class FakeRemote(object):
+    def __init__(self, data):
+        self.generation = 1
+        self.data = data
+        self.downloads = 0
+        self.metadata_requests = 0
+
+    def fetch(self, url):
+        if "alt=media" in url:
+            self.downloads += 1
+            return json.dumps(self.data)
+        self.metadata_requests += 1
+        assert url.endswith("/o/assembly.json?token=abc")
+        return json.dumps({"generation": str(self.generation)})
+
+
+def test_warm_reads_only_revalidate():
+    remote = FakeRemote(Frame.worldXY().__jsondump__())
+    cache = StorageCache(tempfile.mkdtemp())
+
+    first = cache.get_data(URL, remote.fetch)
+    second = cache.get_data(URL, remote.fetch)
+    assert isinstance(first, Frame)
+    assert first is not second and first == second
+    assert remote.downloads == 1
+    assert remote.metadata_requests == 2
+
+    remote.generation = 2
+    remote.data = Frame([1, 0, 0], [1, 0, 0], [0, 1, 0]).__jsondump__()
+    third = cache.get_data(URL, remote.fetch)
+    assert remote.downloads == 2
+    assert third.point.x == 1
+
+
+def test_disk_layer_survives_new_instance_and_evicts():
+    directory = tempfile.mkdtemp()
+    remote = FakeRemote({"values": list(range(100))})
+    StorageCache(directory).get_data(URL, remote.fetch)
+
+    cache = StorageCache(directory)
+    assert cache.get_data(URL, remote.fetch) == {"values": list(range(100))}
+    assert remote.downloads == 1
+    assert cache.hits == 1
+
+    other_url = URL.replace("assembly.json", "other.json")
+    small_cache = StorageCache(directory, max_size=cache.size + 10)
+    small_cache.get_data(other_url, lambda url: remote.fetch(url.replace("other.json", "assembly.json")))
+    assert list(small_cache._index) == ["/v0/b/x123.appspot.com/o/other.json"]
+
+
+def test_memory_reads_do_not_write_the_index():
+    directory = tempfile.mkdtemp()
+    remote = FakeRemote({"values": [1, 2]})
+    cache = StorageCache(directory)
+    cache.get_data(URL, remote.fetch)["values"].append(3)
+    index_time = os.path.getmtime(os.path.join(directory, StorageCache.INDEX_NAME))
+    os.utime(os.path.join(directory, StorageCache.INDEX_NAME), (0, 0))
+
+    assert cache.get_data(URL, remote.fetch) == {"values": [1, 2]}
+    assert os.path.getmtime(os.path.join(directory, StorageCache.INDEX_NAME)) == 0
+    cache.close()
+    assert os.path.getmtime(os.path.join(directory, StorageCache.INDEX_NAME)) >= index_time
+
+    shared = StorageCache(directory, share_objects=True)
+    assert shared.get_data(URL, remote.fetch) is shared.get_data(URL, remote.fetch)
@@ -0,0 +1,71 @@
+import os
+import tempfile
+
+import pytest
+from compas_xr.storage.storage_interface import content_in_range
+from compas_xr.storage.storage_interface import range_headers
+from fakes import MemoryStorage
+
+
+@pytest.fixture
+def obj_directory():
+    directory = tempfile.mkdtemp()
+    for i in range(20):
+        with open(os.path.join(directory, "{}.obj".format(i)), "w") as file:
+            file.write("v 0 0 {}\n".format(i))
+    return directory
+
+
+def test_sync_uploads_only_changes(obj_directory):
+    storage = MemoryStorage()
+    report = storage.sync_directory_to_deep_reference(obj_directory, ["obj_storage", "test"])
+    assert len(report.added) == 20
+    assert "obj_storage/test/manifest.json" in storage.files
+
+    with open(os.path.join(obj_directory, "5.obj"), "w") as file:
+        file.write("v 1 1 1\n")
+    with open(os.path.join(obj_directory, "20.obj"), "w") as file:
+        file.write("v 2 2 2\n")
+    os.remove(os.path.join(obj_directory, "0.obj"))
+
+    report = storage.sync_directory_to_deep_reference(obj_directory, ["obj_storage", "test"])
+    assert report.added == ["20.obj"]
+    assert report.changed == ["5.obj"]
+    assert len(report.unchanged) == 18
+    assert report.orphaned == ["0.obj"]
+    assert len(report.upload.uploaded) == 2
+    assert storage.files["obj_storage/test/5.obj"] == b"v 1 1 1\n"
+
+    report = storage.sync_directory_to_deep_reference(obj_directory, ["obj_storage", "test"], delete_orphans=True)
+    assert report.deleted == ["0.obj"]
+    assert not report.upload.uploaded
+    assert "obj_storage/test/0.obj" not in storage.files
+
+
+def test_sync_retries_failed_uploads(obj_directory):
+    storage = MemoryStorage(failing_names=["3.obj"])
+    report = storage.sync_directory_to_deep_reference(obj_directory, ["obj_storage", "test"])
+    assert not report.succeeded
+
+    storage.failing_names = []
+    report = storage.sync_directory_to_deep_reference(obj_directory, ["obj_storage", "test"])
+    assert report.added == ["3.obj"]
+    assert report.succeeded
+
+
+def test_byte_ranges(obj_directory):
+    storage = MemoryStorage()
+    storage.upload_file_as_bytes_to_deep_reference(os.path.join(obj_directory, "12.obj"), ["obj_storage", "test"])
+    assert storage.get_bytes_from_deep_reference(["obj_storage", "test", "12.obj"], (2, 5)) == b"0 0"
+
+    assert range_headers(None) is None
+    assert range_headers((10, 20)) == {"Range": "bytes=10-19"}
+
+    class Response(object):
+        def __init__(self, status, content):
+            self.status = status
+            self.content = content
+
+    # Servers that ignore the Range header answer with the whole file
+    assert content_in_range(Response(200, b"0123456789"), (2, 5)) == b"234"
+    assert content_in_range(Response(206, b"234"), (2, 5)) == b"234"
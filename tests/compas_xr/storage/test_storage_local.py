@@ -0,0 +1,91 @@
+import os
+
+import pytest
+from compas.geometry import Frame
+
+from compas_xr.storage import LocalStorage
+from fakes import write_local_config
+
+
+@pytest.fixture
+def storage():
+    return LocalStorage(write_local_config())
+
+
+def test_local_storage_reads_and_writes_files():
+    config_path = write_local_config()
+    directory = os.path.dirname(config_path)
+    storage = LocalStorage(config_path)
+    assert storage.root == os.path.join(directory, "compas_xr_local", "storage")
+
+    storage.upload_data_to_folder(Frame.worldXY(), "frames", "frame.json")
+    assert storage.get_data_from_folder("frames", "frame.json") == Frame.worldXY()
+
+    local_path = os.path.join(directory, "part.obj")
+    with open(local_path, "wb") as local_file:
+        local_file.write(b"0123456789")
+    storage.upload_file_as_bytes_to_deep_reference(local_path, ["obj_storage", "folder"])
+    assert storage.get_bytes_from_deep_reference(["obj_storage/folder", "part.obj"]) == b"0123456789"
+    assert storage.get_bytes_from_deep_reference(["obj_storage", "folder", "part.obj"], (2, 5)) == b"234"
+
+    report = storage.sync_directory_to_deep_reference(directory, ["synced"])
+    assert sorted(report.added) == ["config.json", "part.obj"]
+    assert not storage.sync_directory_to_deep_reference(directory, ["synced"]).upload.uploaded
+
+    storage.delete_data_from_deep_reference(["obj_storage", "folder", "part.obj"])
+    assert not os.path.exists(os.path.join(storage.root, "obj_storage"))
+    with pytest.raises(Exception):
+        storage.get_bytes_from_deep_reference(["obj_storage", "folder", "part.obj"])
+    with pytest.raises(Exception):
+        storage.get_data_from_deep_reference(["..", "config.json"])
+
+
+def test_local_storage_reads_byte_ranges(storage):
+    storage.upload_data_to_deep_reference([0, 1, 2, 3, 4], ["data", "list.json"], pretty=False)
+    content = storage.get_bytes_from_deep_reference(["data", "list.json"])
+    assert content == b"[0, 1, 2, 3, 4]"
+
+    assert storage.get_bytes_from_deep_reference(["data", "list.json"], (0, len(content))) == content
+    assert storage.get_bytes_from_deep_reference(["data", "list.json"], (1, 2)) == b"0"
+    # Like an HTTP range, a range past the end of the file returns the bytes up to the end
+    assert storage.get_bytes_from_deep_reference(["data", "list.json"], (10, 100)) == b"3, 4]"
+    assert storage.get_bytes_from_deep_reference(["data", "list.json"], (100, 200)) == b""
+    for byte_range in ((3, 3), (5, 2)):
+        with pytest.raises(Exception):
+            storage.get_bytes_from_deep_reference(["data", "list.json"], byte_range)
+
+
+def test_local_storage_deletes_files_and_their_empty_folders(storage):
+    storage.upload_data_to_deep_reference("a", ["project", "parts", "a.json"])
+    storage.upload_data_to_deep_reference("b", ["project", "parts", "b.json"])
+    storage.upload_data_to_deep_reference("c", ["project", "c.json"])
+
+    storage.delete_data_from_deep_reference(["project", "parts", "a.json"])
+    assert storage.get_data_from_deep_reference(["project", "parts", "b.json"]) == "b"
+    storage.delete_data_from_deep_reference(["project/parts/b.json"])
+    assert sorted(os.listdir(os.path.join(storage.root, "project"))) == ["c.json"]
+    storage.delete_data_from_deep_reference(["project", "c.json"])
+    assert os.listdir(storage.root) == []
+
+    # Missing files and folders are not deleted
+    with pytest.raises(Exception):
+        storage.delete_data_from_deep_reference(["project", "c.json"])
+    storage.upload_data_to_deep_reference("d", ["project", "parts", "d.json"])
+    with pytest.raises(Exception):
+        storage.delete_data_from_deep_reference(["project", "parts"])
+    assert storage.get_data_from_deep_reference(["project", "parts", "d.json"]) == "d"
+
+
+def test_local_storage_rejects_invalid_paths(storage):
+    storage.upload_data_to_deep_reference("a", ["project", "a.json"])
+    for cloud_path_list in ([], ["", "/"], [".."], ["project", "..", "a.json"], ["project/./a.json"]):
+        with pytest.raises(Exception):
+            storage.get_data_from_deep_reference(cloud_path_list)
+        with pytest.raises(Exception):
+            storage.upload_data_to_deep_reference("b", cloud_path_list)
+        with pytest.raises(Exception):
+            storage.delete_data_from_deep_reference(cloud_path_list)
+    assert sorted(os.listdir(os.path.dirname(storage.root))) == ["storage"]
+    assert storage.get_data_from_deep_reference(["project", "a.json"]) == "a"
+    with pytest.raises(Exception):
+        storage.upload_file_as_bytes_to_deep_reference(os.path.join(storage.root, "missing.obj"), ["project"])
@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+
+import pytest
+from compas_xr.storage import UploadError
+from compas_xr.storage.upload_engine import UploadEngine
+from fakes import MemoryStorage
+
+
+@pytest.fixture
+def obj_directory():
+    directory = tempfile.mkdtemp()
+    for i in range(20):
+        with open(os.path.join(directory, "{}.obj".format(i)), "w") as file:
+            file.write("v 0 0 {}\n".format(i))
+    return directory
+
+
+def test_upload_directory_concurrently(obj_directory):
+    storage = MemoryStorage()
+    report = storage.upload_files_as_bytes_from_directory_to_deep_reference(obj_directory, ["obj_storage", "test"], max_workers=4)
+    assert report.succeeded
+    assert len(report.uploaded) == 20
+    assert len(storage.files) == 20
+    assert storage.files["obj_storage/test/7.obj"] == b"v 0 0 7\n"
+    assert report.total_bytes == sum(len(data) for data in storage.files.values())
+
+
+def test_upload_failures_are_reported_and_journaled(obj_directory):
+    storage = MemoryStorage(failing_names=["3.obj"])
+    journal_path = os.path.join(tempfile.mkdtemp(), "journal.jsonl")
+    engine = UploadEngine(storage, max_workers=4, journal_path=journal_path)
+    file_paths = [os.path.join(obj_directory, name) for name in sorted(os.listdir(obj_directory))]
+    report = engine.upload_files(file_paths, ["obj_storage", "test"])
+
+    assert not report.succeeded
+    assert list(report.failed) == [os.path.join(obj_directory, "3.obj")]
+    assert len(report.uploaded) == 19
+
+    with open(journal_path) as journal:
+        entries = [json.loads(line) for line in journal]
+    assert len(entries) == 20
+    assert [entry["reference"] for entry in entries if entry["status"] == "failed"] == ["obj_storage/test/3.obj"]
+
+
+def test_upload_directory_raises_after_failed_files(obj_directory):
+    storage = MemoryStorage(failing_names=["3.obj"])
+    # Caught by hand, the IronPython test runner does not expose the raised exception
+    try:
+        storage.upload_files_as_bytes_from_directory_to_deep_reference(obj_directory, ["obj_storage", "test"], max_workers=4)
+        error = None
+    except UploadError as e:
+        error = e
+    assert list(error.report.failed) == [os.path.join(obj_directory, "3.obj")]
+    assert "upload refused" in str(error)
+    # The other files are still uploaded
+    assert len(storage.files) == 19
+
+    report = storage.upload_files_as_bytes_from_directory_to_deep_reference(obj_directory, ["obj_storage", "test"], raise_on_error=False)
+    assert not report.succeeded
+    assert len(report.uploaded) == 19
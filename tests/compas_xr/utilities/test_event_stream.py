@@ -0,0 +1,76 @@
+import json
+import threading
+
+import pytest
+from compas_xr.utilities import EventStream
+from fakes import ThreadingServer
+
+try:
+    from http.server import BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+
+
+def event(event_type, path, data):
+    return "event: {}\ndata: {}\n\n".format(event_type, json.dumps({"path": path, "data": data})).encode("utf-8")
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    requests = []
+    streams = 0
+    release = threading.Event()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        StreamHandler.requests.append((self.path, self.headers.get("Accept")))
+        if self.path == "/moved.json":
+            self.send_response(307)
+            self.send_header("Location", "/project.json")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        StreamHandler.streams += 1
+        connection = StreamHandler.streams
+        self.wfile.write(event("put", "/", {"steps": {"0": {"is_built": False}}, "connection": connection}))
+        self.wfile.write(b"event: keep-alive\ndata: null\n\n")
+        self.wfile.write(event("patch", "/steps/0", {"is_built": True}))
+        self.wfile.flush()
+        if connection > 1:
+            # Keep the last connection open until the test is done
+            StreamHandler.release.wait(5)
+
+
+@pytest.fixture
+def server_url():
+    StreamHandler.requests = []
+    StreamHandler.streams = 0
+    StreamHandler.release.clear()
+    server = ThreadingServer(StreamHandler)
+    yield server.url
+    StreamHandler.release.set()
+    server.close()
+
+
+def test_event_stream_follows_redirects_and_reconnects(server_url):
+    events = []
+    received = threading.Event()
+
+    def callback(event_type, path, data):
+        events.append((event_type, path, data))
+        if event_type == "put" and data["connection"] == 2:
+            received.set()
+
+    stream = EventStream(server_url + "/moved.json", callback, timeout=5).start()
+    assert received.wait(10)
+    stream.close()
+
+    assert stream.closed
+    assert StreamHandler.requests == [("/moved.json", "text/event-stream"), ("/project.json", "text/event-stream")] * 2
+    assert stream.connections == 2
+    assert events[0] == ("put", "/", {"steps": {"0": {"is_built": False}}, "connection": 1})
+    assert events[1] == ("patch", "/steps/0", {"is_built": True})
+    assert "keep-alive" not in [event_type for event_type, _, _ in events]
@@ -0,0 +1,71 @@
+import pytest
+from compas_xr.utilities import HttpClient
+from compas_xr.utilities import HttpError
+from fakes import ThreadingServer
+
+try:
+    from http.server import BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    store = {}
+    patches = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        Handler.connections.add(self.client_address)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path in Handler.store:
+            self._reply(200, Handler.store[self.path])
+        else:
+            self._reply(404, b"null")
+
+    def do_PUT(self):
+        Handler.store[self.path] = self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(200, Handler.store[self.path])
+
+    def do_PATCH(self):
+        # Applies the request, but closes the connection before answering
+        Handler.patches.append(self.rfile.read(int(self.headers["Content-Length"])))
+        self.close_connection = True
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingServer(Handler)
+    yield server.url
+    server.close()
+
+
+def test_requests_reuse_connections(server_url):
+    Handler.connections.clear()
+    client = HttpClient(pool_size=2)
+    client.put(server_url + "/steps/1.json", '{"is_built": true}')
+    for _ in range(10):
+        assert client.get(server_url + "/steps/1.json").json() == {"is_built": True}
+    assert len(Handler.connections) == 1
+
+    with pytest.raises(HttpError) as error:
+        client.get(server_url + "/steps/2.json")
+    assert error.value.status == 404
+    client.close()
+
+
+def test_requests_are_not_applied_twice(server_url):
+    client = HttpClient()
+    client.put(server_url + "/steps/1.json", "null")
+    with pytest.raises(Exception):
+        client.request("PATCH", server_url + "/steps.json", '{"1/is_built": true}')
+    assert len(Handler.patches) == 1
+    client.close()
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+from compas_xr.utilities import AsyncTimeoutError
+from compas_xr.utilities import TaskExecutor
+from compas_xr.utilities import wait_all
+
+
+class FakeSynchronizationContext(object):
+    """Mimics the context of a UI thread, which only runs the continuations posted to it once the thread is idle."""
+
+    current = None
+
+    def __init__(self):
+        self.posted = []
+
+    def Post(self, continuation):
+        self.posted.append(continuation)
+
+
+class FakeAwaiter(object):
+    """Mimics the awaiter of a .NET task completed later by the runtime."""
+
+    def __init__(self, result=None, error=None, delay=0.01):
+        self.result = result
+        self.error = error
+        self.delay = delay
+        self.continuation = None
+        self.continue_on_captured_context = True
+
+    def OnCompleted(self, continuation):
+        context = FakeSynchronizationContext.current if self.continue_on_captured_context else None
+        if context:
+            continuation = lambda: context.Post(self.continuation)  # noqa: E731
+        self.continuation = continuation
+        if self.delay is not None:
+            threading.Timer(self.delay, continuation).start()
+
+    def GetResult(self):
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class FakeTask(object):
+    def __init__(self, **kwargs):
+        self.awaiter = FakeAwaiter(**kwargs)
+
+    def GetAwaiter(self):
+        return self.awaiter
+
+    def ConfigureAwait(self, continue_on_captured_context):
+        self.awaiter.continue_on_captured_context = continue_on_captured_context
+        return self
+
+
+class FakeStorageTask(object):
+    """Mimics a FirebaseStorageTask, which wraps its task and cannot be configured itself."""
+
+    def __init__(self, **kwargs):
+        self.TargetTask = FakeTask(**kwargs)
+
+    def GetAwaiter(self):
+        self.TargetTask.awaiter.continue_on_captured_context = True
+        return self.TargetTask.awaiter
+
+
+def test_batched_tasks_do_not_need_threads():
+    executor = TaskExecutor()
+    threads_before = threading.active_count()
+    tasks = [FakeTask(result=i, delay=None) for i in range(500)]
+    futures = [executor.submit(lambda task=task: task) for task in tasks]
+    assert threading.active_count() == threads_before
+    assert not any(future.done() for future in futures)
+
+    for task in reversed(tasks):
+        task.awaiter.continuation()
+    assert wait_all(futures, timeout=5) == list(range(500))
+    assert executor.map([lambda: FakeTask(result="url")], timeout=5) == ["url"]
+
+
+def test_failures_and_timeouts_are_typed():
+    executor = TaskExecutor()
+    with pytest.raises(ValueError):
+        executor.run(lambda: FakeTask(error=ValueError("faulted")), timeout=5)
+    with pytest.raises(AsyncTimeoutError):
+        executor.run(lambda: FakeTask(delay=None), timeout=0.05)
+
+
+def test_run_does_not_wait_for_the_blocked_ui_thread():
+    executor = TaskExecutor()
+    FakeSynchronizationContext.current = context = FakeSynchronizationContext()
+    try:
+        assert executor.run(lambda: FakeTask(result="data"), timeout=5) == "data"
+        assert executor.run(lambda: FakeStorageTask(result="url"), timeout=5) == "url"
+    finally:
+        FakeSynchronizationContext.current = None
+    assert context.posted == []
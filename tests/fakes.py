@@ -0,0 +1,294 @@
+"""
+In-memory stand-ins for the backends, shared by the tests.
+
+The tests directory is on the import path of both runners, import them with ``from fakes import MemoryDatabase``.
+
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+
+import pytest
+
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
+from compas_xr.storage.storage_interface import StorageInterface
+
+try:
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+# LocalRealtimeDatabase stores its data with sqlite3, which IronPython does not provide
+sqlite_required = pytest.mark.skip(reason="sqlite3 is not available on IronPython") if sys.platform == "cli" else lambda test: test
+
+
+def write_local_config(**options):
+    """Writes the config of the local backend into a new temporary directory.
+
+    Parameters
+    ----------
+    **options : dict, optional
+        Additional config entries, e.g. ``localPath``.
+
+    Returns
+    -------
+    str
+        The path of the config file.
+
+    """
+    config = {"backend": "local"}
+    config.update(options)
+    config_path = os.path.join(tempfile.mkdtemp(), "config.json")
+    with open(config_path, "w") as config_file:
+        json.dump(config, config_file)
+    return config_path
+
+
+def _as_tree(value):
+    # Like the Realtime Database, store lists as objects and drop empty values
+    if isinstance(value, list):
+        value = dict((str(index), item) for index, item in enumerate(value))
+    if isinstance(value, dict):
+        value = dict((key, _as_tree(item)) for key, item in value.items())
+        value = dict((key, item) for key, item in value.items() if item is not None and item != {})
+    return value
+
+
+def _as_lists(value):
+    # Like the Realtime Database, return objects with mostly consecutive integer keys as lists
+    if not isinstance(value, dict):
+        return value
+    value = dict((key, _as_lists(item)) for key, item in value.items())
+    if value and all(key.isdigit() for key in value) and max(int(key) for key in value) < 2 * len(value):
+        return [value.get(str(index)) for index in range(max(int(key) for key in value) + 1)]
+    return value
+
+
+def as_database(data):
+    """Returns data the way the Realtime Database returns it after storing it.
+
+    Parameters
+    ----------
+    data : Any
+        JSON serializable data.
+
+    Returns
+    -------
+    Any
+        The data without empty values, with lists for objects keyed by consecutive integers.
+
+    """
+    return _as_lists(_as_tree(json.loads(json_dumps(data))))
+
+
+class MemoryStream(object):
+    """Subscription of a :class:`MemoryDatabase`, the test sends the events with its ``send`` method."""
+
+    def __init__(self, database, callback, database_reference):
+        self.database = database
+        self.send = callback
+        self.database_reference = database_reference
+
+    def close(self):
+        if self in self.database.streams:
+            self.database.streams.remove(self)
+
+
+class MemoryDatabase(RealtimeDatabaseInterface):
+    """Realtime Database that keeps its data in memory and records the requests it receives.
+
+    Parameters
+    ----------
+    data : dict, optional
+        The initial data of the database.
+
+    Attributes
+    ----------
+    root : dict
+        The stored data, with lists stored as objects keyed by index.
+    requests : list of str
+        The method of every request, e.g. ``"GET"``, ``"SHALLOW"`` or ``"PATCH"``.
+    sent : list of str
+        The JSON body of every write request.
+    received_bytes : int
+        The size of the JSON data returned by all read requests.
+    queries : list of tuple
+        The query parameters and the reference of every query request.
+    streams : list of :class:`MemoryStream`
+        The open subscriptions.
+
+    """
+
+    def __init__(self, data=None):
+        self.root = _as_tree(json.loads(json_dumps(data or {})))
+        self.requests = []
+        self.sent = []
+        self.received_bytes = 0
+        self.queries = []
+        self.streams = []
+
+    def construct_reference(self, parentname):
+        return self.construct_reference_from_list([parentname])
+
+    def construct_child_refrence(self, parentname, childname):
+        return self.construct_reference_from_list([parentname, childname])
+
+    def construct_grandchild_refrence(self, parentname, childname, grandchildname):
+        return self.construct_reference_from_list([parentname, childname, grandchildname])
+
+    def construct_reference_from_list(self, reference_list):
+        return [key for name in reference_list for key in str(name).split("/") if key]
+
+    def _node(self, database_reference):
+        node = self.root
+        for name in database_reference:
+            if not isinstance(node, dict) or name not in node:
+                return None
+            node = node[name]
+        return node
+
+    def _set(self, database_reference, value):
+        if not database_reference:
+            self.root = value if isinstance(value, dict) else {}
+            return
+        parents = [self.root]
+        for name in database_reference[:-1]:
+            if not isinstance(parents[-1].get(name), dict):
+                parents[-1][name] = {}
+            parents.append(parents[-1][name])
+        if value is None or value == {}:
+            parents[-1].pop(database_reference[-1], None)
+        else:
+            parents[-1][database_reference[-1]] = value
+        # Objects left without children are removed
+        for parent, name in reversed(list(zip(parents, database_reference[:-1]))):
+            if not parent[name]:
+                del parent[name]
+
+    def _receive(self, method, data):
+        self.requests.append(method)
+        self.received_bytes += len(json.dumps(data))
+        return data
+
+    def _send(self, method, data):
+        self.requests.append(method)
+        body = json_dumps(data)
+        self.sent.append(body)
+        return json.loads(body)
+
+    def upload_data_to_reference(self, data, database_reference):
+        self._set(database_reference, _as_tree(self._send("PUT", data)))
+
+    def update_data_in_reference(self, updates, database_reference):
+        for path, value in self._send("PATCH", updates).items():
+            self._set(database_reference + self.construct_reference_from_list([path]), _as_tree(value))
+
+    def delete_data_from_reference(self, database_reference):
+        self.requests.append("DELETE")
+        self._set(database_reference, None)
+
+    def get_data_from_reference(self, database_reference):
+        data = self._receive("GET", _as_lists(self._node(database_reference)))
+        if data is None:
+            raise Exception("No data found at database path {}".format("/".join(database_reference)))
+        return data
+
+    def get_shallow_data_from_reference(self, database_reference):
+        data = self._node(database_reference)
+        if isinstance(data, dict):
+            data = dict((key, True if isinstance(value, dict) else value) for key, value in data.items())
+        return self._receive("SHALLOW", data)
+
+    def query_data_from_reference(self, query, database_reference):
+        self.queries.append((query.parameters(), database_reference))
+        # Like the database, return the matching children unordered
+        return self._receive("QUERY", dict(query.evaluate(_as_lists(self._node(database_reference)))))
+
+    def stream_data_from_reference(self, callback, database_reference):
+        stream = MemoryStream(self, callback, database_reference)
+        self.streams.append(stream)
+        return stream
+
+
+class MemoryStorage(StorageInterface):
+    """Storage that keeps its files in memory.
+
+    Parameters
+    ----------
+    failing_names : list of str, optional
+        The names of the local files whose upload fails.
+
+    Attributes
+    ----------
+    files : dict of str, bytes
+        The content of the stored files, keyed by their "/" separated path.
+
+    """
+
+    def __init__(self, failing_names=None):
+        self.files = {}
+        self.failing_names = failing_names or []
+        self.lock = threading.Lock()
+
+    def construct_reference_from_list(self, cloud_path_list):
+        return "/".join(cloud_path_list)
+
+    def upload_bytes_to_reference_from_local_file(self, file_path, storage_reference):
+        if os.path.basename(file_path) in self.failing_names:
+            raise Exception("upload refused")
+        with open(file_path, "rb") as file:
+            data = file.read()
+        with self.lock:
+            self.files[storage_reference] = data
+
+    def upload_data_to_reference(self, data, storage_reference, pretty=True):
+        self.files[storage_reference] = json_dumps(data, pretty=pretty).encode()
+
+    def get_data_from_reference(self, storage_reference):
+        return json_loads(self.get_bytes_from_reference(storage_reference).decode())
+
+    def delete_data_from_reference(self, storage_reference):
+        del self.files[storage_reference]
+
+    def get_bytes_from_reference(self, storage_reference, byte_range=None):
+        if storage_reference not in self.files:
+            raise Exception("unable to get file {}".format(storage_reference))
+        content = self.files[storage_reference]
+        return content[byte_range[0] : byte_range[1]] if byte_range else content
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    """HTTP server on a free local port, serving every connection on its own thread until it is closed.
+
+    Parameters
+    ----------
+    handler_class : type
+        The request handler class, a subclass of ``BaseHTTPRequestHandler``.
+
+    Attributes
+    ----------
+    url : str
+        The base URL of the server.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handler_class):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), handler_class)
+        self.url = "http://127.0.0.1:{}".format(self.server_address[1])
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        self.shutdown()
+        self.server_close()